@@ -1,25 +1,33 @@
-"""Agent registry for LLM IDE rules."""
+"""Agent registry for LLM IDE rules.
+
+Agents are registered by import path and only imported when first used, so a command
+touching one agent does not import the other adapters. Third-party adapters register
+through the `llm_ide_rules.agents` entry-point group, e.g. in pyproject.toml:
+
+    [project.entry-points."llm_ide_rules.agents"]
+    myide = "my_package.agent:MyIDEAgent"
+"""
+
+import importlib
+from functools import cache
+from typing import Any
 
 from llm_ide_rules.agents.base import BaseAgent
-from llm_ide_rules.agents.cursor import CursorAgent
-from llm_ide_rules.agents.github import GitHubAgent
-from llm_ide_rules.agents.claude import ClaudeAgent
-from llm_ide_rules.agents.gemini import GeminiAgent
-from llm_ide_rules.agents.opencode import OpenCodeAgent
-from llm_ide_rules.agents.agents import AgentsAgent
-from llm_ide_rules.agents.vscode import VSCodeAgent
-from llm_ide_rules.agents.antigravity import AntigravityAgent
-
-AGENTS: dict[str, type[BaseAgent]] = {
-    "cursor": CursorAgent,
-    "github": GitHubAgent,
-    "claude": ClaudeAgent,
-    "gemini": GeminiAgent,
-    "opencode": OpenCodeAgent,
-    "agents": AgentsAgent,
-    "vscode": VSCodeAgent,
-    "antigravity": AntigravityAgent,
-    "grok": AntigravityAgent,
+from llm_ide_rules.log import log
+
+ENTRY_POINT_GROUP = "llm_ide_rules.agents"
+
+# Built-in agents as "module:class" import paths
+AGENT_IMPORT_PATHS: dict[str, str] = {
+    "cursor": "llm_ide_rules.agents.cursor:CursorAgent",
+    "github": "llm_ide_rules.agents.github:GitHubAgent",
+    "claude": "llm_ide_rules.agents.claude:ClaudeAgent",
+    "gemini": "llm_ide_rules.agents.gemini:GeminiAgent",
+    "opencode": "llm_ide_rules.agents.opencode:OpenCodeAgent",
+    "agents": "llm_ide_rules.agents.agents:AgentsAgent",
+    "vscode": "llm_ide_rules.agents.vscode:VSCodeAgent",
+    "antigravity": "llm_ide_rules.agents.antigravity:AntigravityAgent",
+    "grok": "llm_ide_rules.agents.antigravity:AntigravityAgent",
 }
 
 # Aliases for user-friendly names (e.g. grok for the .agents layout)
@@ -27,22 +35,83 @@ AGENT_ALIASES: dict[str, str] = {
     "grok": "antigravity",
 }
 
+_agent_classes: dict[str, type[BaseAgent]] = {}
+
+
+@cache
+def get_plugin_agents() -> dict[str, str]:
+    """Get agents registered through the entry-point group, by name.
+
+    Plugins cannot replace a built-in agent; conflicting names are ignored.
+    """
+    from importlib.metadata import entry_points
+
+    plugins = {}
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        if entry_point.name in AGENT_IMPORT_PATHS:
+            log.warning(
+                "ignoring plugin agent shadowing a built-in agent",
+                agent=entry_point.name,
+                target=entry_point.value,
+            )
+            continue
+        plugins[entry_point.name] = entry_point.value
+
+    return plugins
+
+
+def get_agent_registry() -> dict[str, str]:
+    """Get every registered agent name mapped to its import path."""
+    return {**AGENT_IMPORT_PATHS, **get_plugin_agents()}
+
+
+def get_agent_class(name: str) -> type[BaseAgent]:
+    """Import and return the class registered under name. Supports aliases."""
+    name = AGENT_ALIASES.get(name, name)
+    if name in _agent_classes:
+        return _agent_classes[name]
+
+    # Entry points are only scanned for names that are not built in
+    import_path = AGENT_IMPORT_PATHS.get(name) or get_plugin_agents().get(name)
+    if import_path is None:
+        raise ValueError(
+            f"Unknown agent: {name}. Available: {list(get_agent_registry().keys())}"
+        )
+
+    module_name, _, class_name = import_path.partition(":")
+    agent_cls = getattr(importlib.import_module(module_name), class_name)
+    _agent_classes[name] = agent_cls
+    return agent_cls
+
 
 def get_agent(name: str) -> BaseAgent:
     """Get an agent instance by name. Supports aliases like 'grok'."""
-    if name in AGENT_ALIASES:
-        name = AGENT_ALIASES[name]
-    if name not in AGENTS:
-        raise ValueError(f"Unknown agent: {name}. Available: {list(AGENTS.keys())}")
-    return AGENTS[name]()
+    return get_agent_class(name)()
 
 
 def get_all_agents() -> list[BaseAgent]:
     """Get instances of all registered agents (deduped by implementation class for aliases like grok)."""
     seen: set[type[BaseAgent]] = set()
     result: list[BaseAgent] = []
-    for agent_cls in AGENTS.values():
+    for name in get_agent_registry():
+        agent_cls = get_agent_class(name)
         if agent_cls not in seen:
             seen.add(agent_cls)
             result.append(agent_cls())
     return result
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve AGENTS and the agent classes (e.g. CursorAgent) on first access."""
+    if name == "AGENTS":
+        return {
+            agent_name: get_agent_class(agent_name)
+            for agent_name in get_agent_registry()
+        }
+
+    for import_path in AGENT_IMPORT_PATHS.values():
+        module_name, _, class_name = import_path.partition(":")
+        if class_name == name:
+            return getattr(importlib.import_module(module_name), class_name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,7 +3,8 @@
 from pathlib import Path
 import typer
 
-from llm_ide_rules.agents.base import BaseAgent
+from llm_ide_rules.agents.base import BaseAgent, SectionContent, write_output_file
+from llm_ide_rules.fs import get_filesystem
 
 
 class AgentsAgent(BaseAgent):
@@ -22,9 +23,10 @@ class AgentsAgent(BaseAgent):
         filename: str = "AGENTS.md",
     ) -> bool:
         """Bundle all AGENTS.md files into a single output file."""
+        fs = get_filesystem()
         base_dir = output_file.parent
         # Find all AGENTS.md files recursively
-        agents_files = list(base_dir.rglob(filename))
+        agents_files = list(fs.rglob(base_dir, filename))
         if not agents_files:
             return False
 
@@ -40,7 +42,7 @@ class AgentsAgent(BaseAgent):
         processed_sections: set[str] = set()
 
         for agents_file in all_agents:
-            content = agents_file.read_text().strip()
+            content = fs.read_text(agents_file).strip()
             if not content:
                 continue
 
@@ -97,7 +99,7 @@ class AgentsAgent(BaseAgent):
 
     def write_rule(
         self,
-        content_lines: list[str],
+        content_lines: SectionContent,
         filename: str,
         rules_dir: Path,
         glob_pattern: str | None = None,
@@ -108,7 +110,7 @@ class AgentsAgent(BaseAgent):
 
     def write_command(
         self,
-        content_lines: list[str],
+        content_lines: SectionContent,
         filename: str,
         commands_dir: Path,
         section_name: str | None = None,
@@ -116,6 +118,93 @@ class AgentsAgent(BaseAgent):
         """Agents doesn't support writing commands."""
         pass
 
+    def place_sections(
+        self,
+        rules_sections: dict[str, list[str]],
+        output_dir: Path,
+        section_globs: dict[str, str | None],
+    ) -> tuple[dict[Path, list[str]], list[str]]:
+        """Group section names by the directory whose AGENTS.md should hold them.
+
+        A section whose globs start with a directory (e.g. `src/**/*.py`) goes to that
+        directory. Wildcards fan it out to every matching directory, so
+        `packages/*/src/**/*.ts` places it in each package's src. A directory that does
+        not exist falls back to its deepest existing ancestor. All sections are resolved
+        against one DirectoryIndex, so each directory is listed at most once.
+
+        Returns:
+            Tuple of (section names by target directory, placement warnings)
+        """
+        from llm_ide_rules.globs import (
+            DirectoryIndex,
+            expand_braces,
+            glob_directory_prefix,
+            has_wildcard,
+            split_globs,
+        )
+
+        # Always include root directory for rules without specific directory targets
+        sections_by_dir: dict[Path, list[str]] = {output_dir: []}
+        warnings: list[str] = []
+        index = DirectoryIndex(output_dir)
+
+        for section_name in rules_sections:
+            prefixes = [
+                glob_directory_prefix(expanded)
+                for glob in split_globs(section_globs.get(section_name))
+                for expanded in expand_braces(glob)
+            ]
+
+            target_dirs: list[Path] = []
+            for prefix in prefixes or [""]:
+                matches = index.match_dirs(prefix)
+                if matches:
+                    target_dirs.extend(matches)
+                    continue
+
+                target_dir = index.deepest_existing(prefix)
+                if target_dir != output_dir:
+                    rel_actual = target_dir.relative_to(output_dir)
+                    if has_wildcard(prefix):
+                        warnings.append(
+                            f"Warning: No directory matches '{prefix}' for section '{section_name}'. "
+                            f"Placing in '{rel_actual}' instead."
+                        )
+                    else:
+                        warnings.append(
+                            f"Warning: Directory '{prefix}' for section '{section_name}' does not exist. "
+                            f"Placing in '{rel_actual}' instead."
+                        )
+                target_dirs.append(target_dir)
+
+            for target_dir in dict.fromkeys(target_dirs):
+                sections_by_dir.setdefault(target_dir, []).append(section_name)
+
+        return sections_by_dir, warnings
+
+    def get_root_doc_paths(
+        self,
+        general_lines: list[str],
+        rules_sections: dict[str, list[str]],
+        output_dir: Path,
+        section_globs: dict[str, str | None] | None = None,
+        filename: str = "AGENTS.md",
+    ) -> list[Path]:
+        """Get every AGENTS.md path generate_root_doc would write."""
+        if not section_globs:
+            if any(line.strip() for line in general_lines):
+                return [output_dir / filename]
+            return []
+
+        sections_by_dir, _warnings = self.place_sections(
+            rules_sections, output_dir, section_globs
+        )
+        return [
+            target_dir / filename
+            for target_dir, section_names in sections_by_dir.items()
+            if section_names
+        ]
+
     def generate_root_doc(
         self,
         general_lines: list[str],
@@ -130,47 +219,25 @@ class AgentsAgent(BaseAgent):
             # Fallback to single root AGENTS.md
             content = self.build_root_doc_content(general_lines, rules_sections)
             if content.strip():
-                (output_dir / filename).write_text(content)
+                write_output_file(output_dir / filename, content)
             return
 
-        # Group rules by target directory
-        rules_by_dir: dict[Path, dict[str, list[str]]] = {}
-
-        # Always include root directory for rules without specific directory targets
-        rules_by_dir[output_dir] = {}
-
-        from llm_ide_rules.utils import resolve_target_dir
-
-        for section_name, lines in rules_sections.items():
-            glob_pattern = section_globs.get(section_name)
-            target_dir = resolve_target_dir(output_dir, glob_pattern)
-
-            if target_dir != output_dir and glob_pattern and "**" in glob_pattern:
-                prefix = glob_pattern.split("**")[0].strip("/")
-                potential_dir = output_dir / prefix
-                if target_dir != potential_dir:
-                    rel_potential = potential_dir.relative_to(output_dir)
-                    rel_actual = target_dir.relative_to(output_dir)
-                    typer.secho(
-                        f"Warning: Directory '{rel_potential}' for section '{section_name}' does not exist. "
-                        f"Placing in '{rel_actual}' instead.",
-                        fg=typer.colors.YELLOW,
-                        err=True,
-                    )
-
-            if target_dir not in rules_by_dir:
-                rules_by_dir[target_dir] = {}
-
-            rules_by_dir[target_dir][section_name] = lines
+        sections_by_dir, warnings = self.place_sections(
+            rules_sections, output_dir, section_globs
+        )
+        for warning in warnings:
+            typer.secho(warning, fg=typer.colors.YELLOW, err=True)
 
         # Generate AGENTS.md for each directory
-        for target_dir, sections in rules_by_dir.items():
-            if not sections:
+        for target_dir, section_names in sections_by_dir.items():
+            if not section_names:
                 continue
 
+            sections = {name: rules_sections[name] for name in section_names}
+
             # Only include general instructions in the root AGENTS.md
             current_general_lines = general_lines if target_dir == output_dir else []
 
             content = self.build_root_doc_content(current_general_lines, sections)
             if content.strip():
-                (target_dir / filename).write_text(content)
+                write_output_file(target_dir / filename, content)
@@ -4,13 +4,16 @@ from pathlib import Path
 
 from llm_ide_rules.agents.base import (
     BaseAgent,
+    SectionContent,
+    as_normalized_section,
     get_ordered_files,
     resolve_header_from_stem,
     strip_header,
     strip_yaml_frontmatter,
     trim_content,
-    extract_description_and_filter_content,
+    write_output_file,
 )
+from llm_ide_rules.fs import get_filesystem
 
 
 class AntigravityAgent(BaseAgent):
@@ -29,19 +32,20 @@ class AntigravityAgent(BaseAgent):
         filename: str = "AGENTS.md",
     ) -> bool:
         """Bundle Antigravity rule files (.md) into a single output file."""
+        fs = get_filesystem()
         rules_dir = self.rules_dir
         if not rules_dir:
             return False
 
         rules_path = output_file.parent / rules_dir
-        if not rules_path.exists():
+        if not fs.exists(rules_path):
             return False
 
         extension = self.rule_extension
         if not extension:
             return False
 
-        rule_files = list(rules_path.glob(f"*{extension}"))
+        rule_files = list(fs.glob(rules_path, f"*{extension}"))
         if not rule_files:
             return False
 
@@ -55,7 +59,7 @@ class AntigravityAgent(BaseAgent):
 
         content_parts: list[str] = []
         for rule_file in ordered:
-            file_content = rule_file.read_text().strip()
+            file_content = fs.read_text(rule_file).strip()
             if not file_content:
                 continue
 
@@ -157,15 +161,16 @@ class AntigravityAgent(BaseAgent):
         self, output_file: Path, section_globs: dict[str, str | None] | None = None
     ) -> bool:
         """Bundle Antigravity skill files (SKILL.md) into a single output file."""
+        fs = get_filesystem()
         commands_dir = self.commands_dir
         if not commands_dir:
             return False
 
         commands_path = output_file.parent / commands_dir
-        if not commands_path.exists():
+        if not fs.exists(commands_path):
             return False
 
-        skill_files = list(commands_path.glob("**/SKILL.md"))
+        skill_files = list(fs.glob(commands_path, "**/SKILL.md"))
         if not skill_files:
             return False
 
@@ -176,7 +181,7 @@ class AntigravityAgent(BaseAgent):
 
         content_parts: list[str] = []
         for skill_file in ordered_skills:
-            file_content = skill_file.read_text().strip()
+            file_content = fs.read_text(skill_file).strip()
             if not file_content:
                 continue
 
@@ -234,21 +239,23 @@ class AntigravityAgent(BaseAgent):
         self._write_bundled_content(output_file, "".join(content_parts))
         return True
 
+    def get_command_file_path(self, commands_dir: Path, filename: str) -> Path:
+        """Skills live in their own directory: <commands_dir>/<filename>/SKILL.md."""
+        return commands_dir / filename / "SKILL.md"
+
     def write_rule(
         self,
-        content_lines: list[str],
+        content_lines: SectionContent,
         filename: str,
         rules_dir: Path,
         glob_pattern: str | None = None,
         description: str | None = None,
     ) -> None:
         """Write an Antigravity rule file (.md) with YAML frontmatter."""
-        extension = self.rule_extension or ".md"
-        filepath = rules_dir / f"{filename}{extension}"
+        filepath = self.get_rule_file_path(rules_dir, filename)
 
-        desc, filtered_content = extract_description_and_filter_content(
-            content_lines, ""
-        )
+        section = as_normalized_section(content_lines)
+        desc = section.description
         if not desc:
             desc = description or resolve_header_from_stem(filename, {})
 
@@ -264,40 +271,31 @@ class AntigravityAgent(BaseAgent):
 
         frontmatter = f"---\ndescription: {desc}\nglobs: {globs_str}\nalwaysApply: {always_apply}\n---\n\n"
 
-        trimmed = trim_content(filtered_content)
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        filepath.write_text(frontmatter + "".join(trimmed))
+        write_output_file(filepath, frontmatter + "".join(section.filtered))
 
     def write_command(
         self,
-        content_lines: list[str],
+        content_lines: SectionContent,
         filename: str,
         commands_dir: Path,
         section_name: str | None = None,
     ) -> None:
         """Write an Antigravity skill file (.agents/skills/<filename>/SKILL.md) with YAML frontmatter."""
-        filepath = commands_dir / filename / "SKILL.md"
+        filepath = self.get_command_file_path(commands_dir, filename)
 
-        desc, filtered_content = extract_description_and_filter_content(
-            content_lines, ""
-        )
+        section = as_normalized_section(content_lines)
+        desc = section.description
         if not desc:
             desc = section_name or filename.replace("-", " ").title()
 
-        # Find the header
-        header = None
-        for line in content_lines:
-            if line.startswith("## "):
-                header = line[3:].strip()
-                break
-
+        header = section.header
         if not header:
             header = section_name or filename.replace("-", " ").title()
 
         # Replace first ## Header with # Header
         final_content = []
         found_header = False
-        for line in filtered_content:
+        for line in section.filtered:
             if not found_header and line.startswith("## "):
                 found_header = True
                 final_content.append(f"# {header}\n")
@@ -307,5 +305,4 @@ class AntigravityAgent(BaseAgent):
         frontmatter = f"---\nname: {filename}\ndescription: {desc}\n---\n\n"
 
         trimmed = trim_content(final_content)
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        filepath.write_text(frontmatter + "".join(trimmed))
+        write_output_file(filepath, frontmatter + "".join(trimmed))
@@ -2,8 +2,35 @@
 
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import NamedTuple
 
-from llm_ide_rules.constants import header_to_filename
+from llm_ide_rules.constants import INSTRUCTIONS_MARKER, header_to_filename
+from llm_ide_rules.fs import get_filesystem
+from llm_ide_rules.manifest import record_generated_file
+from llm_ide_rules.timing import span
+
+
+class NormalizedSection(NamedTuple):
+    """A section prepared once and shared by every agent writer.
+
+    Writers only format these fields, so the O(lines) trimming and description
+    extraction happen once per section instead of once per agent.
+    """
+
+    # Content with leading and trailing blank lines removed
+    lines: list[str]
+    # Value of a leading "Description:" line, or ""
+    description: str
+    # Trimmed content without the description line
+    filtered: list[str]
+    # Text of the first "## " header, if any
+    header: str | None
+    # Filtered content without the first header line, trimmed
+    body: list[str]
+    glob_pattern: str | None = None
+
+
+SectionContent = list[str] | NormalizedSection
 
 
 class BaseAgent(ABC):
@@ -35,7 +62,7 @@ class BaseAgent(ABC):
     @abstractmethod
     def write_rule(
         self,
-        content_lines: list[str],
+        content_lines: SectionContent,
         filename: str,
         rules_dir: Path,
         glob_pattern: str | None = None,
@@ -47,7 +74,7 @@ class BaseAgent(ABC):
     @abstractmethod
     def write_command(
         self,
-        content_lines: list[str],
+        content_lines: SectionContent,
         filename: str,
         commands_dir: Path,
         section_name: str | None = None,
@@ -99,6 +126,29 @@ class BaseAgent(ABC):
 
         return "".join(content).strip() + "\n" if content else ""
 
+    def get_rule_file_path(self, rules_dir: Path, filename: str) -> Path:
+        """Get the output path of a rule file for a section filename."""
+        return rules_dir / f"{filename}{self.rule_extension or '.md'}"
+
+    def get_command_file_path(self, commands_dir: Path, filename: str) -> Path:
+        """Get the output path of a command file for a section filename."""
+        return commands_dir / f"{filename}{self.command_extension or '.md'}"
+
+    def get_general_instructions_path(self, base_dir: Path) -> Path | None:
+        """Get the output path for general instructions, if explode writes them for this agent."""
+        return None
+
+    def get_root_doc_paths(
+        self,
+        general_lines: list[str],
+        rules_sections: dict[str, list[str]],
+        output_dir: Path,
+        section_globs: dict[str, str | None] | None = None,
+        filename: str = "AGENTS.md",
+    ) -> list[Path]:
+        """Get the paths generate_root_doc would write, without rendering anything."""
+        return []
+
     def get_rules_path(self, base_dir: Path) -> Path:
         """Get the full path to the rules directory."""
         if not self.rules_dir:
@@ -113,23 +163,20 @@ class BaseAgent(ABC):
 
     def _write_bundled_content(self, output_file: Path, content: str) -> None:
         """Write bundled content to output file, preserving custom instructions after marker."""
-        marker = "<!-- END CLONED INSTRUCTIONS -->"
-        local_custom_content = ""
-
-        if output_file.exists():
-            try:
-                current_content = output_file.read_text(encoding="utf-8")
-                if marker in current_content:
-                    local_custom_content = current_content.split(marker, 1)[1]
-            except Exception:
-                # Fallback if file cannot be read
-                pass
+        from llm_ide_rules.utils import write_preserving_tail
 
+        marker = INSTRUCTIONS_MARKER
         if marker not in content:
             # Ensure marker is present at the end of the bundled content
             content = content.rstrip() + f"\n\n{marker}\n"
 
-        output_file.write_text(content + local_custom_content, encoding="utf-8")
+        with span(
+            "write",
+            path=str(output_file),
+            files=1,
+            bytes=len(content.encode("utf-8")),
+        ):
+            write_preserving_tail(output_file, content, marker)
 
 
 def strip_yaml_frontmatter(text: str) -> str:
@@ -261,12 +308,19 @@ def trim_content(content_lines: list[str]) -> list[str]:
     return content_lines[start:end]
 
 
+def write_output_file(path: Path, content: str) -> None:
+    """Write a generated file, creating parent directories and recording it in the manifest."""
+    data = content.encode("utf-8")
+    with span("write", path=str(path), files=1, bytes=len(data)):
+        get_filesystem().write_bytes(path, data)
+    record_generated_file(path, data)
+
+
 def write_rule_file(path: Path, header_yaml: str, content_lines: list[str]) -> None:
     """Write a rule file with front matter and content."""
     trimmed_content = trim_content(content_lines)
     output = header_yaml.strip() + "\n" + "".join(trimmed_content)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(output)
+    write_output_file(path, output)
 
 
 def replace_header_with_proper_casing(
@@ -315,3 +369,28 @@ def extract_description_and_filter_content(
         filtered_content = trimmed_content
 
     return description, filtered_content
+
+
+def normalize_section(
+    content_lines: list[str], glob_pattern: str | None = None
+) -> NormalizedSection:
+    """Prepare section content for the agent writers in a single pass."""
+    lines = trim_content(content_lines)
+    description, filtered = extract_description_and_filter_content(lines, "")
+
+    header = None
+    body = filtered
+    for i, line in enumerate(filtered):
+        if line.startswith("## "):
+            header = line[3:].strip()
+            body = trim_content(filtered[:i] + filtered[i + 1 :])
+            break
+
+    return NormalizedSection(lines, description, filtered, header, body, glob_pattern)
+
+
+def as_normalized_section(content: SectionContent) -> NormalizedSection:
+    """Accept either raw section lines or an already normalized section."""
+    if isinstance(content, NormalizedSection):
+        return content
+    return normalize_section(content)
@@ -4,12 +4,15 @@ from pathlib import Path
 
 from llm_ide_rules.agents.base import (
     BaseAgent,
+    SectionContent,
+    as_normalized_section,
     get_ordered_files,
     resolve_header_from_stem,
     strip_header,
     strip_yaml_frontmatter,
-    trim_content,
+    write_output_file,
 )
+from llm_ide_rules.fs import get_filesystem
 
 
 class ClaudeAgent(BaseAgent):
@@ -28,19 +31,20 @@ class ClaudeAgent(BaseAgent):
         filename: str = "AGENTS.md",
     ) -> bool:
         """Bundle Claude Code rule files (.md) into a single output file."""
+        fs = get_filesystem()
         rules_dir = self.rules_dir
         if not rules_dir:
             return False
 
         rules_path = output_file.parent / rules_dir
-        if not rules_path.exists():
+        if not fs.exists(rules_path):
             return False
 
         extension = self.rule_extension
         if not extension:
             return False
 
-        rule_files = list(rules_path.rglob(f"*{extension}"))
+        rule_files = list(fs.rglob(rules_path, f"*{extension}"))
         if not rule_files:
             return False
 
@@ -54,7 +58,7 @@ class ClaudeAgent(BaseAgent):
 
         content_parts: list[str] = []
         for rule_file in ordered:
-            file_content = rule_file.read_text().strip()
+            file_content = fs.read_text(rule_file).strip()
             if not file_content:
                 continue
 
@@ -124,19 +128,20 @@ class ClaudeAgent(BaseAgent):
         self, output_file: Path, section_globs: dict[str, str | None] | None = None
     ) -> bool:
         """Bundle Claude Code command files (.md) into a single output file."""
+        fs = get_filesystem()
         commands_dir = self.commands_dir
         if not commands_dir:
             return False
 
         commands_path = output_file.parent / commands_dir
-        if not commands_path.exists():
+        if not fs.exists(commands_path):
             return False
 
         extension = self.command_extension
         if not extension:
             return False
 
-        command_files = list(commands_path.glob(f"*{extension}"))
+        command_files = list(fs.glob(commands_path, f"*{extension}"))
         if not command_files:
             return False
 
@@ -146,7 +151,7 @@ class ClaudeAgent(BaseAgent):
 
         content_parts: list[str] = []
         for command_file in ordered_commands:
-            content = command_file.read_text().strip()
+            content = fs.read_text(command_file).strip()
             if not content:
                 continue
 
@@ -165,17 +170,16 @@ class ClaudeAgent(BaseAgent):
 
     def write_rule(
         self,
-        content_lines: list[str],
+        content_lines: SectionContent,
         filename: str,
         rules_dir: Path,
         glob_pattern: str | None = None,
         description: str | None = None,
     ) -> None:
         """Write a Claude Code rule file (.md)."""
-        extension = self.rule_extension or ".md"
-        filepath = rules_dir / f"{filename}{extension}"
+        filepath = self.get_rule_file_path(rules_dir, filename)
 
-        trimmed = trim_content(content_lines)
+        trimmed = as_normalized_section(content_lines).lines
 
         output_parts: list[str] = []
         if glob_pattern and glob_pattern != "manual":
@@ -185,23 +189,24 @@ class ClaudeAgent(BaseAgent):
 
         output_parts.extend(trimmed)
 
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        filepath.write_text("".join(output_parts))
+        write_output_file(filepath, "".join(output_parts))
 
     def write_command(
         self,
-        content_lines: list[str],
+        content_lines: SectionContent,
         filename: str,
         commands_dir: Path,
         section_name: str | None = None,
     ) -> None:
         """Write a Claude Code command file (.md) - plain markdown, no frontmatter."""
-        extension = self.command_extension or ".md"
-        filepath = commands_dir / f"{filename}{extension}"
+        filepath = self.get_command_file_path(commands_dir, filename)
 
-        trimmed = trim_content(content_lines)
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        filepath.write_text("".join(trimmed))
+        trimmed = as_normalized_section(content_lines).lines
+        write_output_file(filepath, "".join(trimmed))
+
+    def get_general_instructions_path(self, base_dir: Path) -> Path | None:
+        """General instructions become the general.md rule."""
+        return self.get_rule_file_path(self.get_rules_path(base_dir), "general")
 
     def generate_root_doc(
         self,
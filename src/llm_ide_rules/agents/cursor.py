@@ -4,14 +4,16 @@ from pathlib import Path
 
 from llm_ide_rules.agents.base import (
     BaseAgent,
+    SectionContent,
+    as_normalized_section,
     get_ordered_files,
     resolve_header_from_stem,
     strip_yaml_frontmatter,
     strip_header,
-    trim_content,
+    write_output_file,
     write_rule_file,
-    extract_description_and_filter_content,
 )
+from llm_ide_rules.fs import get_filesystem
 
 
 class CursorAgent(BaseAgent):
@@ -30,6 +32,7 @@ class CursorAgent(BaseAgent):
         filename: str = "AGENTS.md",
     ) -> bool:
         """Bundle Cursor rule files (.mdc) into a single output file."""
+        fs = get_filesystem()
         rules_dir = self.rules_dir
         if not rules_dir:
             return False
@@ -40,7 +43,7 @@ class CursorAgent(BaseAgent):
         if not rule_ext:
             return False
 
-        rule_files = list(rules_path.glob(f"*{rule_ext}"))
+        rule_files = list(fs.glob(rules_path, f"*{rule_ext}"))
 
         general = [f for f in rule_files if f.stem == "general"]
         others = [f for f in rule_files if f.stem != "general"]
@@ -52,7 +55,7 @@ class CursorAgent(BaseAgent):
 
         content_parts: list[str] = []
         for rule_file in ordered:
-            file_content = rule_file.read_text().strip()
+            file_content = fs.read_text(rule_file).strip()
             if not file_content:
                 continue
 
@@ -110,19 +113,20 @@ class CursorAgent(BaseAgent):
         self, output_file: Path, section_globs: dict[str, str | None] | None = None
     ) -> bool:
         """Bundle Cursor command files (.md) into a single output file."""
+        fs = get_filesystem()
         commands_dir = self.commands_dir
         if not commands_dir:
             return False
 
         commands_path = output_file.parent / commands_dir
-        if not commands_path.exists():
+        if not fs.exists(commands_path):
             return False
 
         command_ext = self.command_extension
         if not command_ext:
             return False
 
-        command_files = list(commands_path.glob(f"*{command_ext}"))
+        command_files = list(fs.glob(commands_path, f"*{command_ext}"))
         if not command_files:
             return False
 
@@ -132,7 +136,7 @@ class CursorAgent(BaseAgent):
 
         content_parts: list[str] = []
         for command_file in ordered_commands:
-            content = command_file.read_text().strip()
+            content = fs.read_text(command_file).strip()
             if not content:
                 continue
 
@@ -151,15 +155,14 @@ class CursorAgent(BaseAgent):
 
     def write_rule(
         self,
-        content_lines: list[str],
+        content_lines: SectionContent,
         filename: str,
         rules_dir: Path,
         glob_pattern: str | None = None,
         description: str | None = None,
     ) -> None:
         """Write a Cursor rule file (.mdc) with YAML frontmatter."""
-        extension = self.rule_extension or ".mdc"
-        filepath = rules_dir / f"{filename}{extension}"
+        filepath = self.get_rule_file_path(rules_dir, filename)
 
         desc = description or filename.replace("-", " ").title()
 
@@ -184,26 +187,26 @@ globs:
 alwaysApply: true
 ---
 """
-        write_rule_file(filepath, header_yaml, content_lines)
+        write_rule_file(
+            filepath, header_yaml, as_normalized_section(content_lines).lines
+        )
 
     def write_command(
         self,
-        content_lines: list[str],
+        content_lines: SectionContent,
         filename: str,
         commands_dir: Path,
         section_name: str | None = None,
     ) -> None:
         """Write a Cursor command file (.md) - plain markdown, no frontmatter."""
-        extension = self.command_extension or ".md"
-        filepath = commands_dir / f"{filename}{extension}"
+        filepath = self.get_command_file_path(commands_dir, filename)
 
-        trimmed = trim_content(content_lines)
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        filepath.write_text("".join(trimmed))
+        trimmed = as_normalized_section(content_lines).lines
+        write_output_file(filepath, "".join(trimmed))
 
     def write_prompt(
         self,
-        content_lines: list[str],
+        content_lines: SectionContent,
         filename: str,
         prompts_dir: Path,
         section_name: str | None = None,
@@ -212,16 +215,19 @@ alwaysApply: true
         extension = self.rule_extension or ".mdc"
         filepath = prompts_dir / f"{filename}{extension}"
 
-        description, filtered_content = extract_description_and_filter_content(
-            content_lines, ""
-        )
+        section = as_normalized_section(content_lines)
+        description, filtered_content = section.description, section.filtered
 
         output_parts: list[str] = []
         if description:
             output_parts.append(f"---\ndescription: {description}\n---\n")
 
         output_parts.extend(filtered_content)
-        filepath.write_text("".join(output_parts))
+        write_output_file(filepath, "".join(output_parts))
+
+    def get_general_instructions_path(self, base_dir: Path) -> Path | None:
+        """General instructions become the general.mdc rule."""
+        return self.get_rule_file_path(self.get_rules_path(base_dir), "general")
 
     def configure_agents_md(self, base_dir: Path) -> bool:
         """Cursor doesn't require explicit configuration for AGENTS.md."""
@@ -1,16 +1,17 @@
 """Gemini CLI agent implementation."""
 
-import json
 from pathlib import Path
 
 from llm_ide_rules.agents.base import (
     BaseAgent,
+    SectionContent,
+    as_normalized_section,
     get_ordered_files,
     resolve_header_from_stem,
     strip_toml_metadata,
-    trim_content,
-    extract_description_and_filter_content,
+    write_output_file,
 )
+from llm_ide_rules.fs import get_filesystem
 
 
 class GeminiAgent(BaseAgent):
@@ -39,19 +40,20 @@ class GeminiAgent(BaseAgent):
         self, output_file: Path, section_globs: dict[str, str | None] | None = None
     ) -> bool:
         """Bundle Gemini CLI command files (.toml) into a single output file."""
+        fs = get_filesystem()
         commands_dir = self.commands_dir
         if not commands_dir:
             return False
 
         commands_path = output_file.parent / commands_dir
-        if not commands_path.exists():
+        if not fs.exists(commands_path):
             return False
 
         extension = self.command_extension
         if not extension:
             return False
 
-        command_files = list(commands_path.glob(f"*{extension}"))
+        command_files = list(fs.glob(commands_path, f"*{extension}"))
         if not command_files:
             return False
 
@@ -61,7 +63,7 @@ class GeminiAgent(BaseAgent):
 
         content_parts: list[str] = []
         for command_file in ordered_commands:
-            content = command_file.read_text().strip()
+            content = fs.read_text(command_file).strip()
             if not content:
                 continue
 
@@ -81,7 +83,7 @@ class GeminiAgent(BaseAgent):
 
     def write_rule(
         self,
-        content_lines: list[str],
+        content_lines: SectionContent,
         filename: str,
         rules_dir: Path,
         glob_pattern: str | None = None,
@@ -92,7 +94,7 @@ class GeminiAgent(BaseAgent):
 
     def write_command(
         self,
-        content_lines: list[str],
+        content_lines: SectionContent,
         filename: str,
         commands_dir: Path,
         section_name: str | None = None,
@@ -100,23 +102,11 @@ class GeminiAgent(BaseAgent):
         """Write a Gemini CLI command file (.toml) with TOML format."""
         import tomli_w
 
-        extension = self.command_extension or ".toml"
-        filepath = commands_dir / f"{filename}{extension}"
+        filepath = self.get_command_file_path(commands_dir, filename)
 
-        description, filtered_content = extract_description_and_filter_content(
-            content_lines, ""
-        )
-
-        final_content = []
-        found_header = False
-        for line in filtered_content:
-            if not found_header and line.startswith("## "):
-                found_header = True
-                continue
-            final_content.append(line)
-
-        final_content = trim_content(final_content)
-        content_str = "".join(final_content).strip()
+        section = as_normalized_section(content_lines)
+        description = section.description
+        content_str = "".join(section.body).strip()
 
         desc = description if description else (section_name or filename)
 
@@ -128,8 +118,7 @@ class GeminiAgent(BaseAgent):
 
         # tomli-w will handle escaping and multiline strings automatically
         output = tomli_w.dumps(data)
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        filepath.write_text(output)
+        write_output_file(filepath, output)
 
     def generate_root_doc(
         self,
@@ -152,38 +141,44 @@ class GeminiAgent(BaseAgent):
             filename="GEMINI.md",
         )
 
+    def get_root_doc_paths(
+        self,
+        general_lines: list[str],
+        rules_sections: dict[str, list[str]],
+        output_dir: Path,
+        section_globs: dict[str, str | None] | None = None,
+        filename: str = "AGENTS.md",
+    ) -> list[Path]:
+        """Gemini CLI uses GEMINI.md placed like AGENTS.md."""
+        from llm_ide_rules.agents.agents import AgentsAgent
+
+        return AgentsAgent().get_root_doc_paths(
+            general_lines, rules_sections, output_dir, section_globs, "GEMINI.md"
+        )
+
     def configure_agents_md(self, base_dir: Path) -> bool:
         """Configure Gemini CLI to use GEMINI.md."""
+        fs = get_filesystem()
+        from llm_ide_rules.utils import load_settings_file, modify_json_file
 
         settings_path = base_dir / ".gemini" / "settings.json"
-        settings_path.parent.mkdir(parents=True, exist_ok=True)
-
-        data = {}
-        if settings_path.exists():
-            try:
-                data = json.loads(settings_path.read_text())
-            except Exception:
-                pass
 
-        old_data = json.dumps(data, sort_keys=True)
+        file_names: list[str] = []
+        if fs.exists(settings_path):
+            data = load_settings_file(settings_path)
+            context = data.get("context") if isinstance(data, dict) else None
+            if isinstance(context, dict):
+                current = context.get("fileName", [])
+                if isinstance(current, str):
+                    file_names = [current]
+                elif isinstance(current, list):
+                    file_names = [f for f in current if isinstance(f, str)]
 
-        if "context" not in data:
-            data["context"] = {}
+            if "GEMINI.md" in file_names:
+                return False
 
-        file_names = data["context"].get("fileName", [])
-        if isinstance(file_names, str):
-            file_names = [file_names]
-
-        if "GEMINI.md" not in file_names:
-            file_names = ["GEMINI.md"] + [f for f in file_names if f != "GEMINI.md"]
-            data["context"]["fileName"] = file_names
-
-        new_data = json.dumps(data, sort_keys=True)
-        if old_data == new_data and settings_path.exists():
-            return False
-
-        settings_path.write_text(json.dumps(data, indent=2))
-        return True
+        file_names = ["GEMINI.md"] + [f for f in file_names if f != "GEMINI.md"]
+        return modify_json_file(settings_path, {("context", "fileName"): file_names})
 
     def check_gemini_config(self, base_dir: Path) -> bool:
         """Check if Gemini CLI is configured to use GEMINI.md (local or global)."""
@@ -200,12 +195,13 @@ class GeminiAgent(BaseAgent):
 
     def _check_gemini_config(self, config_path: Path) -> bool:
         """Check if a specific Gemini CLI config file is configured to use GEMINI.md."""
+        from llm_ide_rules.utils import load_settings_file
 
-        if not config_path.exists():
+        data = load_settings_file(config_path)
+        if data is None:
             return False
 
         try:
-            data = json.loads(config_path.read_text())
             file_names = data.get("context", {}).get("fileName", [])
             if isinstance(file_names, str):
                 return file_names == "GEMINI.md"
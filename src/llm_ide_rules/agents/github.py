@@ -4,14 +4,17 @@ from pathlib import Path
 
 from llm_ide_rules.agents.base import (
     BaseAgent,
+    SectionContent,
+    as_normalized_section,
     get_ordered_files_github,
     resolve_header_from_stem,
     strip_yaml_frontmatter,
     strip_header,
+    write_output_file,
     write_rule_file,
-    extract_description_and_filter_content,
 )
 from llm_ide_rules.constants import header_to_filename
+from llm_ide_rules.fs import get_filesystem
 
 
 class GitHubAgent(BaseAgent):
@@ -30,6 +33,7 @@ class GitHubAgent(BaseAgent):
         filename: str = "AGENTS.md",
     ) -> bool:
         """Bundle GitHub instruction files into a single output file."""
+        fs = get_filesystem()
         rules_dir = self.rules_dir
         if not rules_dir:
             return False
@@ -42,21 +46,21 @@ class GitHubAgent(BaseAgent):
         if not rule_ext:
             return False
 
-        instr_files = list(instructions_path.glob(f"*{rule_ext}"))
+        instr_files = list(fs.glob(instructions_path, f"*{rule_ext}"))
 
         ordered_instructions = get_ordered_files_github(
             instr_files, list(section_globs.keys()) if section_globs else None
         )
 
         content_parts: list[str] = []
-        if copilot_general.exists():
-            content = copilot_general.read_text().strip()
+        if fs.exists(copilot_general):
+            content = fs.read_text(copilot_general).strip()
             if content:
                 content_parts.append(content)
                 content_parts.append("\n\n")
 
         for instr_file in ordered_instructions:
-            file_content = instr_file.read_text().strip()
+            file_content = fs.read_text(instr_file).strip()
             if not file_content:
                 continue
 
@@ -99,19 +103,20 @@ class GitHubAgent(BaseAgent):
         self, output_file: Path, section_globs: dict[str, str | None] | None = None
     ) -> bool:
         """Bundle GitHub prompt files into a single output file."""
+        fs = get_filesystem()
         commands_dir = self.commands_dir
         if not commands_dir:
             return False
 
         prompts_path = output_file.parent / commands_dir
-        if not prompts_path.exists():
+        if not fs.exists(prompts_path):
             return False
 
         command_ext = self.command_extension
         if not command_ext:
             return False
 
-        prompt_files = list(prompts_path.glob(f"*{command_ext}"))
+        prompt_files = list(fs.glob(prompts_path, f"*{command_ext}"))
         if not prompt_files:
             return False
 
@@ -133,7 +138,7 @@ class GitHubAgent(BaseAgent):
 
         content_parts: list[str] = []
         for prompt_file in ordered_prompts:
-            content = prompt_file.read_text().strip()
+            content = fs.read_text(prompt_file).strip()
             if not content:
                 continue
 
@@ -155,15 +160,14 @@ class GitHubAgent(BaseAgent):
 
     def write_rule(
         self,
-        content_lines: list[str],
+        content_lines: SectionContent,
         filename: str,
         rules_dir: Path,
         glob_pattern: str | None = None,
         description: str | None = None,
     ) -> None:
         """Write a GitHub instruction file (.instructions.md) with YAML frontmatter."""
-        extension = self.rule_extension or ".instructions.md"
-        filepath = rules_dir / f"{filename}{extension}"
+        filepath = self.get_rule_file_path(rules_dir, filename)
 
         if glob_pattern and glob_pattern != "manual":
             header_yaml = f"""---
@@ -173,34 +177,37 @@ applyTo: "{glob_pattern}"
         else:
             header_yaml = ""
 
-        write_rule_file(filepath, header_yaml, content_lines)
+        write_rule_file(
+            filepath, header_yaml, as_normalized_section(content_lines).lines
+        )
 
     def write_command(
         self,
-        content_lines: list[str],
+        content_lines: SectionContent,
         filename: str,
         commands_dir: Path,
         section_name: str | None = None,
     ) -> None:
         """Write a GitHub prompt file (.prompt.md) with YAML frontmatter."""
-        extension = self.command_extension or ".prompt.md"
-        filepath = commands_dir / f"{filename}{extension}"
+        filepath = self.get_command_file_path(commands_dir, filename)
 
-        description, filtered_content = extract_description_and_filter_content(
-            content_lines, ""
-        )
+        section = as_normalized_section(content_lines)
+        description, filtered_content = section.description, section.filtered
 
         frontmatter = f"---\nmode: 'agent'\ndescription: '{description}'\n---\n"
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        filepath.write_text(frontmatter + "".join(filtered_content))
+        write_output_file(filepath, frontmatter + "".join(filtered_content))
 
     def write_general_instructions(
         self, content_lines: list[str], base_dir: Path
     ) -> None:
         """Write the general copilot-instructions.md file (no frontmatter)."""
-        filepath = base_dir / ".github" / "copilot-instructions.md"
+        filepath = self.get_general_instructions_path(base_dir)
         write_rule_file(filepath, "", content_lines)
 
+    def get_general_instructions_path(self, base_dir: Path) -> Path:
+        """General instructions live in .github/copilot-instructions.md."""
+        return base_dir / ".github" / "copilot-instructions.md"
+
     def configure_agents_md(self, base_dir: Path) -> bool:
         """Configure VS Code to use AGENTS.md."""
         from llm_ide_rules.utils import modify_json_file
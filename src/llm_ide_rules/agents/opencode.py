@@ -4,10 +4,13 @@ from pathlib import Path
 
 from llm_ide_rules.agents.base import (
     BaseAgent,
+    SectionContent,
+    as_normalized_section,
     get_ordered_files,
     resolve_header_from_stem,
-    trim_content,
+    write_output_file,
 )
+from llm_ide_rules.fs import get_filesystem
 
 
 class OpenCodeAgent(BaseAgent):
@@ -32,19 +35,20 @@ class OpenCodeAgent(BaseAgent):
         self, output_file: Path, section_globs: dict[str, str | None] | None = None
     ) -> bool:
         """Bundle OpenCode command files (.md) into a single output file."""
+        fs = get_filesystem()
         commands_dir = self.commands_dir
         if not commands_dir:
             return False
 
         commands_path = output_file.parent / commands_dir
-        if not commands_path.exists():
+        if not fs.exists(commands_path):
             return False
 
         extension = self.command_extension
         if not extension:
             return False
 
-        command_files = list(commands_path.glob(f"*{extension}"))
+        command_files = list(fs.glob(commands_path, f"*{extension}"))
         if not command_files:
             return False
 
@@ -54,7 +58,7 @@ class OpenCodeAgent(BaseAgent):
 
         content_parts: list[str] = []
         for command_file in ordered_commands:
-            content = command_file.read_text().strip()
+            content = fs.read_text(command_file).strip()
             if not content:
                 continue
 
@@ -73,7 +77,7 @@ class OpenCodeAgent(BaseAgent):
 
     def write_rule(
         self,
-        content_lines: list[str],
+        content_lines: SectionContent,
         filename: str,
         rules_dir: Path,
         glob_pattern: str | None = None,
@@ -84,18 +88,16 @@ class OpenCodeAgent(BaseAgent):
 
     def write_command(
         self,
-        content_lines: list[str],
+        content_lines: SectionContent,
         filename: str,
         commands_dir: Path,
         section_name: str | None = None,
     ) -> None:
         """Write an OpenCode command file (.md) - plain markdown, no frontmatter."""
-        extension = self.command_extension or ".md"
-        filepath = commands_dir / f"{filename}{extension}"
+        filepath = self.get_command_file_path(commands_dir, filename)
 
-        trimmed = trim_content(content_lines)
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        filepath.write_text("".join(trimmed))
+        trimmed = as_normalized_section(content_lines).lines
+        write_output_file(filepath, "".join(trimmed))
 
     def configure_agents_md(self, base_dir: Path) -> bool:
         """OpenCode has native support for AGENTS.md, no configuration changes needed."""
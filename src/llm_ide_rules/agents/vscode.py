@@ -2,7 +2,7 @@
 
 from pathlib import Path
 
-from llm_ide_rules.agents.base import BaseAgent
+from llm_ide_rules.agents.base import BaseAgent, SectionContent
 
 
 class VSCodeAgent(BaseAgent):
@@ -31,7 +31,7 @@ class VSCodeAgent(BaseAgent):
 
     def write_rule(
         self,
-        content_lines: list[str],
+        content_lines: SectionContent,
         filename: str,
         rules_dir: Path,
         glob_pattern: str | None = None,
@@ -42,7 +42,7 @@ class VSCodeAgent(BaseAgent):
 
     def write_command(
         self,
-        content_lines: list[str],
+        content_lines: SectionContent,
         filename: str,
         commands_dir: Path,
         section_name: str | None = None,
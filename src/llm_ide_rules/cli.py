@@ -0,0 +1,186 @@
+"""Typer app of the llm-ide-rules CLI.
+
+Importing this module imports every command, so the console script (see
+llm_ide_rules.client) only imports it when a command cannot be served by a daemon.
+"""
+
+import os
+from pathlib import Path
+
+if "LOG_LEVEL" not in os.environ:
+    os.environ["LOG_LEVEL"] = "WARNING"
+
+import typer
+from typing_extensions import Annotated
+
+from llm_ide_rules.commands.explode import explode_main
+from llm_ide_rules.commands.ignores import ignores_main
+from llm_ide_rules.commands.implode import (
+    cursor,
+    github,
+    claude,
+    antigravity,
+    grok,
+    gemini,
+    opencode,
+    agents,
+)
+from llm_ide_rules.commands.download import download_main
+from llm_ide_rules.commands.delete import delete_main
+from llm_ide_rules.commands.config import config_main
+from llm_ide_rules.commands.serve import serve_main
+from llm_ide_rules.commands.analyze import duplicates_main, globs_main
+from llm_ide_rules.commands.stats import stats_main
+from llm_ide_rules.version import get_cli_version
+
+
+def version_callback(value: bool):
+    """Callback to display the version and exit."""
+    if value:
+        print(f"llm-ide-rules version {get_cli_version()}")
+        raise typer.Exit()
+
+
+app = typer.Typer(
+    name="llm_ide_rules",
+    help="CLI tool for managing LLM IDE prompts and rules",
+    no_args_is_help=True,
+)
+
+
+@app.callback()
+def main_callback(
+    ctx: typer.Context,
+    verbose: Annotated[
+        bool,
+        typer.Option(
+            "--verbose", "-v", help="Enable verbose logging (sets LOG_LEVEL=DEBUG)"
+        ),
+    ] = False,
+    version: Annotated[
+        bool | None,
+        typer.Option(
+            "--version",
+            help="Show the version and exit",
+            callback=version_callback,
+            is_eager=True,
+        ),
+    ] = None,
+    timings: Annotated[
+        bool,
+        typer.Option(
+            "--timings",
+            help="Print how long each phase took once the command finishes",
+        ),
+    ] = False,
+    trace: Annotated[
+        Path | None,
+        typer.Option(
+            "--trace",
+            help="Write every timed span to FILE as a Chrome trace (chrome://tracing, Perfetto, speedscope)",
+            metavar="FILE",
+        ),
+    ] = None,
+    profile: Annotated[
+        Path | None,
+        typer.Option(
+            "--profile",
+            help="Profile the command with cProfile, writing stats to FILE and printing the hottest functions",
+            metavar="FILE",
+        ),
+    ] = None,
+    profile_memory: Annotated[
+        bool,
+        typer.Option(
+            "--profile-memory",
+            help="With --profile, also trace allocations and print the peak and top allocation sites",
+        ),
+    ] = False,
+):
+    """Global CLI options."""
+    if profile_memory and not profile:
+        error_msg = "--profile-memory requires --profile"
+        typer.echo(typer.style(error_msg, fg=typer.colors.RED), err=True)
+        raise typer.Exit(1)
+
+    if verbose:
+        os.environ["LOG_LEVEL"] = "DEBUG"
+        from llm_ide_rules.log import log
+
+        log.configure()
+
+    if timings or trace:
+        from llm_ide_rules.timing import report_recording, start_recording
+
+        start_recording()
+        ctx.call_on_close(lambda: report_recording(timings, trace))
+
+    if profile:
+        from llm_ide_rules.profiling import Profiler
+
+        profiler = Profiler(profile, memory=profile_memory)
+        profiler.start()
+        ctx.call_on_close(profiler.stop)
+
+
+# Add commands directly
+app.command("explode", help="Convert instruction file to separate rule files")(
+    explode_main
+)
+app.command("ignores", help="Generate list of files to ignore based on instructions")(
+    ignores_main
+)
+app.command("download", help="Download LLM instruction files from GitHub repositories")(
+    download_main
+)
+app.command("delete", help="Remove downloaded LLM instruction files")(delete_main)
+app.command("config", help="Configure agents to use AGENTS.md")(config_main)
+app.command("serve", help="Run a resident daemon the CLI forwards commands to")(
+    serve_main
+)
+app.command("stats", help="Report the bytes and tokens each agent loads")(stats_main)
+
+# Create implode sub-typer
+implode_app = typer.Typer(help="Bundle rule files into a single instruction file")
+implode_app.command(
+    "cursor", help="Bundle Cursor rules and commands into a single file"
+)(cursor)
+implode_app.command(
+    "github", help="Bundle GitHub/Copilot instructions and prompts into a single file"
+)(github)
+implode_app.command(
+    "claude", help="Bundle Claude Code rules and commands into single files"
+)(claude)
+implode_app.command(
+    "antigravity", help="Bundle Antigravity (.agents) rules and skills into single files"
+)(antigravity)
+implode_app.command(
+    "grok", help="Bundle Grok (.agents) rules and skills into single files"
+)(grok)
+implode_app.command("gemini", help="Bundle Gemini CLI commands into a single file")(
+    gemini
+)
+implode_app.command("opencode", help="Bundle OpenCode commands into a single file")(
+    opencode
+)
+implode_app.command("agents", help="Bundle AGENTS.md files into a single file")(agents)
+app.add_typer(implode_app, name="implode")
+
+# Create analyze sub-typer
+analyze_app = typer.Typer(help="Analyze how instructions apply to the project")
+analyze_app.command(
+    "globs", help="Report glob matches per section, dead globs and overlapping sections"
+)(globs_main)
+analyze_app.command(
+    "duplicates", help="Report blocks repeated across sections and generated files"
+)(duplicates_main)
+app.add_typer(analyze_app, name="analyze")
+
+
+def main():
+    """Run the CLI in this process."""
+    app()
+
+
+if __name__ == "__main__":
+    main()
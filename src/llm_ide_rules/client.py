@@ -0,0 +1,133 @@
+"""Console entry point, handing commands to a running daemon before importing the CLI.
+
+Importing the Typer app imports every command module and their dependencies, which
+takes longer than most commands run. This module only imports what a socket round
+trip needs, tries the daemon (see llm_ide_rules.daemon) and imports the app only when
+the command has to run in this process.
+
+Each request carries the client's environment, which the daemon applies while it
+runs the command, so GITHUB_TOKEN, HOME, XDG_* and LOG_LEVEL are the caller's.
+"""
+
+import json
+import os
+import socket
+import sys
+
+from llm_ide_rules.version import get_cli_version
+
+SOCKET_ENV_VAR = "LLM_IDE_RULES_SOCKET"
+DISABLE_ENV_VAR = "LLM_IDE_RULES_NO_DAEMON"
+
+FORWARDED_COMMANDS = {"explode", "implode", "ignores", "delete"}
+
+# Options that measure the invoking process, so forwarding would measure the daemon
+LOCAL_ONLY_OPTIONS = ("--timings", "--trace", "--profile")
+
+# Only the connection attempt is bounded, a forwarded command may run for a while
+CONNECT_TIMEOUT_SECONDS = 0.5
+
+
+def get_socket_path() -> str:
+    """Get the daemon socket path, per user unless overridden by the environment."""
+    if override := os.environ.get(SOCKET_ENV_VAR):
+        return override
+
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "llm-ide-rules.sock")
+
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "llm-ide-rules", "daemon.sock")
+
+
+def get_protocol_version() -> str:
+    """Version string a client and daemon must agree on to share a request."""
+    return get_cli_version()
+
+
+def should_forward(argv: list[str]) -> bool:
+    """Check whether an invocation can be served by the daemon."""
+    if os.environ.get(DISABLE_ENV_VAR):
+        return False
+
+    command = next((arg for arg in argv if not arg.startswith("-")), None)
+    if command not in FORWARDED_COMMANDS:
+        return False
+
+    if "--help" in argv or "--version" in argv:
+        return False
+
+    if any(arg.startswith(LOCAL_ONLY_OPTIONS) for arg in argv):
+        return False
+
+    # The daemon has no terminal, so interactive confirmation must run locally
+    if command == "delete" and not ({"--yes", "-y"} & set(argv)):
+        return False
+
+    return True
+
+
+def receive_line(conn: socket.socket) -> bytes:
+    """Read one newline-terminated message from a socket."""
+    chunks: list[bytes] = []
+    while chunk := conn.recv(65536):
+        chunks.append(chunk)
+        if chunk.endswith(b"\n"):
+            break
+
+    return b"".join(chunks)
+
+
+def forward_to_daemon(argv: list[str]) -> int | None:
+    """Run a CLI invocation in the daemon, if one is running.
+
+    Returns:
+        The exit code of the forwarded command, or None if it should run locally.
+    """
+    if not should_forward(argv):
+        return None
+
+    socket_path = get_socket_path()
+    if not os.path.exists(socket_path):
+        return None
+
+    request = {
+        "version": get_protocol_version(),
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "env": dict(os.environ),
+    }
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.settimeout(CONNECT_TIMEOUT_SECONDS)
+            conn.connect(socket_path)
+            conn.settimeout(None)
+            conn.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            response = json.loads(receive_line(conn))
+    except (OSError, ValueError):
+        # Stale socket or a daemon that went away, run locally instead
+        return None
+
+    if "error" in response:
+        return None
+
+    sys.stdout.write(response["stdout"])
+    sys.stdout.flush()
+    sys.stderr.write(response["stderr"])
+    sys.stderr.flush()
+    return int(response["exit_code"])
+
+
+def main() -> None:
+    """Serve the invocation from a running daemon when possible, otherwise locally."""
+    exit_code = forward_to_daemon(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+    from llm_ide_rules.cli import app
+
+    app(prog_name="llm-ide-rules")
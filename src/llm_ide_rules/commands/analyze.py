@@ -0,0 +1,210 @@
+"""Analyze command: Report on how instructions apply to the project."""
+
+import time
+from pathlib import Path
+
+import typer
+from typing_extensions import Annotated
+
+from llm_ide_rules.commands.explode import (
+    is_valid_agent,
+    read_instruction_sources,
+    read_rendered_outputs,
+)
+from llm_ide_rules.duplicates import Document, DuplicateBlock, find_duplicate_blocks
+from llm_ide_rules.globs import analyze_glob_coverage, list_project_files
+from llm_ide_rules.log import log
+from llm_ide_rules.markdown_parser import parse_sections
+from llm_ide_rules.timing import span
+from llm_ide_rules.tokens import TOKEN_ESTIMATORS, get_token_estimator
+
+
+def globs_main(
+    input_file: Annotated[
+        str, typer.Argument(help="Input markdown file")
+    ] = "instructions.md",
+) -> None:
+    """Report how many files each section's globs match, dead globs and overlapping sections.
+
+    Files come from `git ls-files` inside a git checkout, otherwise from a walk of the
+    current directory that skips hidden, dependency and build directories.
+    """
+    cwd = Path.cwd()
+    input_path = Path(input_file)
+
+    try:
+        input_text, _ = read_instruction_sources(input_path)
+    except FileNotFoundError:
+        log.error("input file not found", input_file=str(input_path))
+        error_msg = f"Input file not found: {input_path}"
+        typer.echo(typer.style(error_msg, fg=typer.colors.RED), err=True)
+        raise typer.Exit(1)
+
+    _, sections = parse_sections(input_text)
+    section_globs = {name: data.glob_pattern for name, data in sections.items()}
+
+    start = time.perf_counter()
+    with span("analyze.list_files") as list_span:
+        files = list_project_files(cwd)
+        list_span.set(files=len(files))
+    with span("analyze.match_globs"):
+        coverage, overlaps = analyze_glob_coverage(section_globs, files)
+    elapsed = time.perf_counter() - start
+
+    if not coverage:
+        typer.echo("No sections have globs.")
+        return
+
+    name_width = max(len("Section"), *(len(item.section) for item in coverage))
+    typer.echo(f"{'Section':<{name_width}}  {'Files':>7}  Globs")
+    for item in coverage:
+        line = f"{item.section:<{name_width}}  {item.file_count:>7}  {', '.join(item.globs)}"
+        if item.file_count:
+            typer.echo(line)
+        else:
+            typer.echo(typer.style(line, fg=typer.colors.YELLOW))
+
+    dead = [(item.section, glob) for item in coverage for glob in item.dead_globs]
+    if dead:
+        typer.echo(f"\nGlobs matching no files ({len(dead)}):")
+        for section, glob in dead:
+            typer.echo(typer.style(f"  {section}: {glob}", fg=typer.colors.YELLOW))
+
+    if overlaps:
+        typer.echo(f"\nSections applying to the same files ({len(overlaps)}):")
+        for overlap in overlaps:
+            typer.echo(
+                f"  {overlap.first} & {overlap.second}: {overlap.file_count} files"
+                f" (e.g. {overlap.example})"
+            )
+
+    typer.echo(
+        f"\nMatched {len(coverage)} sections against {len(files)} files in {elapsed:.2f}s"
+    )
+
+
+def _echo_duplicates(
+    corpus: str, duplicates: list[tuple[int, DuplicateBlock]], top: int
+) -> None:
+    """Print the duplicate blocks of one corpus, most redundant tokens first."""
+    redundant = sum(
+        tokens * (len(block.occurrences) - 1) for tokens, block in duplicates
+    )
+    typer.echo(
+        f"{corpus}: {len(duplicates)} duplicate blocks, {redundant} redundant tokens"
+    )
+
+    for tokens, block in duplicates[:top]:
+        locations = ", ".join(
+            f"{occurrence.document}:{occurrence.line}"
+            for occurrence in block.occurrences
+        )
+        lines = block.text.strip().splitlines()
+        preview = next(
+            (line for line in lines if not line.lstrip().startswith(("```", "~~~"))),
+            lines[0],
+        ).strip()
+        if len(preview) > 72:
+            preview = preview[:69] + "..."
+        typer.echo(f"  {tokens} tokens x{len(block.occurrences)}: {locations}")
+        typer.echo(typer.style(f"    {preview}", fg=typer.colors.YELLOW))
+
+    if len(duplicates) > top:
+        typer.echo(f"  ... and {len(duplicates) - top} more")
+
+
+def duplicates_main(
+    input_file: Annotated[
+        str, typer.Argument(help="Input markdown file")
+    ] = "instructions.md",
+    agent: Annotated[
+        str,
+        typer.Option(
+            "--agent",
+            "-a",
+            help="Agent whose generated files to scan (cursor, github, claude, gemini, opencode, agents, antigravity, grok, or all)",
+        ),
+    ] = "all",
+    estimator_name: Annotated[
+        str,
+        typer.Option(
+            "--estimator",
+            help=f"Token estimator: {', '.join(TOKEN_ESTIMATORS)}, or a module:Class path",
+        ),
+    ] = "heuristic",
+    min_tokens: Annotated[
+        int,
+        typer.Option("--min-tokens", help="Ignore duplicate blocks smaller than this"),
+    ] = 10,
+    top: Annotated[
+        int,
+        typer.Option("--top", help="Duplicate blocks to list per source"),
+    ] = 10,
+) -> None:
+    """Report sentences and blocks repeated across sections, commands and outputs.
+
+    Sentences are matched line by line, so a sentence wrapped over several lines only
+    matches together with the whole sentence.
+
+    The instruction and command files are scanned together, then each agent's
+    generated files separately, since an agent only loads its own files. Each
+    duplicate block is listed with its size and redundant token cost.
+    """
+    working_dir = Path.cwd()
+
+    if not is_valid_agent(agent):
+        error_msg = f"Invalid agent '{agent}'"
+        typer.echo(typer.style(error_msg, fg=typer.colors.RED), err=True)
+        raise typer.Exit(1)
+
+    try:
+        estimator = get_token_estimator(estimator_name)
+    except ValueError as e:
+        typer.echo(typer.style(f"Error: {e}", fg=typer.colors.RED), err=True)
+        raise typer.Exit(1)
+
+    try:
+        input_text, commands_text = read_instruction_sources(working_dir / input_file)
+        rendered = read_rendered_outputs(input_file, agent, working_dir)
+    except FileNotFoundError:
+        log.error("input file not found", input_file=input_file)
+        error_msg = f"Input file not found: {working_dir / input_file}"
+        typer.echo(typer.style(error_msg, fg=typer.colors.RED), err=True)
+        raise typer.Exit(1)
+
+    corpora: dict[str, list[Document]] = {
+        "sources": [Document(input_file, input_text)],
+    }
+    if commands_text:
+        commands_file = (Path(input_file).parent / "commands.md").as_posix()
+        corpora["sources"].append(Document(commands_file, commands_text))
+    for output, data in rendered:
+        corpora.setdefault(output.agent, []).append(
+            Document(
+                output.path.relative_to(working_dir).as_posix(), data.decode("utf-8")
+            )
+        )
+
+    found = False
+    for corpus, documents in corpora.items():
+        with span("analyze.duplicates", corpus=corpus, documents=len(documents)):
+            blocks = find_duplicate_blocks(documents)
+
+        duplicates = [
+            (tokens, block)
+            for block in blocks
+            if (tokens := estimator.count(block.text)) >= min_tokens
+        ]
+        if not duplicates:
+            continue
+
+        duplicates.sort(
+            key=lambda item: item[0] * (len(item[1].occurrences) - 1), reverse=True
+        )
+        if found:
+            typer.echo("")
+        _echo_duplicates(corpus, duplicates, top)
+        found = True
+
+    if not found:
+        typer.echo("No duplicate blocks found.")
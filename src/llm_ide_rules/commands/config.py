@@ -1,11 +1,25 @@
 """Command to configure agents to use AGENTS.md."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import typer
 from typing_extensions import Annotated
 
 from llm_ide_rules.agents import get_agent, get_all_agents
+from llm_ide_rules.agents.base import BaseAgent
+from llm_ide_rules.fs import FileSystem, get_filesystem, using_filesystem
+
+
+def configure_agent(
+    fs: FileSystem, agent_inst: BaseAgent, base_dir: Path
+) -> bool | Exception:
+    """Run one agent's configurator, returning the exception instead of raising it."""
+    try:
+        with using_filesystem(fs):
+            return agent_inst.configure_agents_md(base_dir)
+    except Exception as e:
+        return e
 
 
 def config_main(
@@ -29,18 +43,26 @@ def config_main(
     else:
         agents_to_configure = get_all_agents()
 
-    for agent_inst in agents_to_configure:
-        if agent_inst.name == "agents":
-            continue
+    agents_to_configure = [a for a in agents_to_configure if a.name != "agents"]
 
-        try:
-            configured = agent_inst.configure_agents_md(base_dir)
-            if configured:
-                typer.echo(
-                    typer.style(f"Configured {agent_inst.name}", fg=typer.colors.GREEN)
-                )
-            else:
-                msg = f"Skipped {agent_inst.name} (no changes needed or not applicable)"
-                typer.echo(typer.style(msg, fg=typer.colors.YELLOW))
-        except Exception as e:
-            typer.echo(f"Failed to configure {agent_inst.name}: {e}", err=True)
+    # Each agent writes its own settings file, so configurators run concurrently and
+    # results are reported in the usual agent order. Workers do not inherit the
+    # active filesystem, so hand it to them
+    fs = get_filesystem()
+    with ThreadPoolExecutor(max_workers=max(len(agents_to_configure), 1)) as executor:
+        results = list(
+            executor.map(
+                lambda a: configure_agent(fs, a, base_dir), agents_to_configure
+            )
+        )
+
+    for agent_inst, result in zip(agents_to_configure, results):
+        if isinstance(result, Exception):
+            typer.echo(f"Failed to configure {agent_inst.name}: {result}", err=True)
+        elif result:
+            typer.echo(
+                typer.style(f"Configured {agent_inst.name}", fg=typer.colors.GREEN)
+            )
+        else:
+            msg = f"Skipped {agent_inst.name} (no changes needed or not applicable)"
+            typer.echo(typer.style(msg, fg=typer.colors.YELLOW))
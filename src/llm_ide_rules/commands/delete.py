@@ -1,81 +1,289 @@
 """Delete command: Remove downloaded LLM instruction files."""
 
-import shutil
+import logging
+import os
+from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import NamedTuple
 
 import typer
 from typing_extensions import Annotated
 
 from llm_ide_rules.commands.download import INSTRUCTION_TYPES, DEFAULT_TYPES
-from llm_ide_rules.constants import header_to_filename
+from llm_ide_rules.commands.explode import (
+    get_agent_names,
+    project_explode_outputs,
+    read_instruction_sources,
+)
+from llm_ide_rules.fs import FileSystem, get_filesystem
 from llm_ide_rules.log import log
-from llm_ide_rules.markdown_parser import parse_sections
+from llm_ide_rules.manifest import Manifest, load_manifest, save_manifest
 
+# Above this many paths, listings are summarized per directory unless --verbose is used
+SUMMARY_THRESHOLD = 50
 
-def get_generated_files(target_dir: Path) -> set[Path]:
-    """Identify files that would be generated from local instruction files."""
-    generated = set()
+# Upper bound on concurrent unlink workers, deletion is I/O bound
+MAX_DELETE_WORKERS = 16
 
-    # Check instructions.md
+# Top-level directories owned by agents, the only places empty directories are pruned
+GENERATED_ROOTS = {
+    dir_name.split("/")[0]
+    for config in INSTRUCTION_TYPES.values()
+    for dir_name in config["directories"]
+}
+
+
+class DeletionResult(NamedTuple):
+    """Outcome of a batched deletion."""
+
+    deleted_count: int
+    errors: list[tuple[Path, Exception]]
+    removed_dirs: list[Path]
+
+
+def get_generated_files(target_dir: Path) -> set[str]:
+    """Identify files that would be generated from local instruction files.
+
+    Returns posix paths relative to target_dir, so candidates can be matched with plain
+    string keys instead of resolving every path on disk.
+    """
+    fs = get_filesystem()
     instructions_path = target_dir / "instructions.md"
-    if instructions_path.exists():
+    commands_path = target_dir / "commands.md"
+    if not fs.exists(instructions_path) and not fs.exists(commands_path):
+        return set()
+
+    try:
+        if fs.exists(instructions_path):
+            input_text, commands_text = read_instruction_sources(instructions_path)
+        else:
+            input_text, commands_text = "", fs.read_text(commands_path)
+
+        outputs = project_explode_outputs(
+            input_text, commands_text, get_agent_names("all"), target_dir
+        )
+    except Exception as e:
+        log.warning("failed to parse instruction files", error=str(e))
+        return set()
+
+    return {output.path.relative_to(target_dir).as_posix() for output in outputs}
+
+
+def iter_directory_files(directory: Path) -> Iterator[Path]:
+    """Yield every file below a directory using a single scandir pass per directory."""
+    yield from get_filesystem().walk_files(directory)
+
+
+def partition_generated_candidates(
+    candidates: list[Path], generated_files: set[str], target_dir: Path
+) -> tuple[list[Path], list[Path]]:
+    """Split candidate files into (generated, skipped) in a single pass.
+
+    Candidates are keyed by their path relative to target_dir, which needs no syscalls.
+    """
+    generated = []
+    skipped = []
+    seen: set[str] = set()
+
+    for file_path in candidates:
         try:
-            general, sections = parse_sections(instructions_path.read_text())
-
-            # If general instructions exist, these files are generated
-            if any(line.strip() for line in general):
-                generated.add(target_dir / ".cursor/rules/general.mdc")
-                generated.add(target_dir / ".github/copilot-instructions.md")
-                generated.add(target_dir / ".claude/rules/general.md")
-                generated.add(target_dir / ".agents/rules/general.md")
-                generated.add(target_dir / "AGENTS.md")
-                generated.add(target_dir / "GEMINI.md")
-
-            # If any sections exist, AGENTS.md is definitely generated
-            if sections:
-                generated.add(target_dir / "AGENTS.md")
-                generated.add(target_dir / "GEMINI.md")
-
-            # Section specific files
-            from llm_ide_rules.utils import resolve_target_dir
-
-            for header, section_data in sections.items():
-                filename = header_to_filename(header)
-                generated.add(target_dir / f".cursor/rules/{filename}.mdc")
-                generated.add(
-                    target_dir / f".github/instructions/{filename}.instructions.md"
-                )
-                generated.add(target_dir / f".claude/rules/{filename}.md")
-                generated.add(target_dir / f".agents/rules/{filename}.md")
-
-                # Add subdirectory AGENTS.md for sections with ** glob patterns
-                glob_pattern = section_data.glob_pattern
-                section_target_dir = resolve_target_dir(target_dir, glob_pattern)
-
-                if section_target_dir != target_dir:
-                    generated.add(section_target_dir / "AGENTS.md")
-                    generated.add(section_target_dir / "GEMINI.md")
+            key = file_path.relative_to(target_dir).as_posix()
+        except ValueError:
+            key = file_path.as_posix()
 
-        except Exception as e:
-            log.warning("failed to parse instructions.md", error=str(e))
+        if key in seen:
+            continue
+        seen.add(key)
 
-    # Check commands.md
-    commands_path = target_dir / "commands.md"
-    if commands_path.exists():
+        if key in generated_files:
+            generated.append(file_path)
+        else:
+            skipped.append(file_path)
+
+    return generated, skipped
+
+
+def matches_instruction_types(relative_path: str, instruction_types: list[str]) -> bool:
+    """Check whether a project-relative posix path belongs to any of the instruction types."""
+    file_name = relative_path.rsplit("/", 1)[-1]
+
+    for inst_type in instruction_types:
+        config = INSTRUCTION_TYPES.get(inst_type)
+        if config is None:
+            continue
+
+        for dir_name in config["directories"]:
+            if relative_path.startswith(f"{dir_name}/"):
+                return True
+
+        if relative_path in config["files"]:
+            return True
+
+        if relative_path in config.get("generated_files", []):
+            return True
+
+        if file_name in config.get("recursive_files", []):
+            return True
+
+    return False
+
+
+def find_manifest_files_to_delete(
+    manifest: Manifest, instruction_types: list[str], target_dir: Path
+) -> tuple[list[Path], list[Path]]:
+    """Select generated files from the manifest without walking the tree.
+
+    Returns:
+        Tuple of (unmodified, modified) files; modified files were edited since generation
+    """
+    fs = get_filesystem()
+    unmodified_files = []
+    modified_files = []
+
+    for relative_path in manifest.files:
+        if not matches_instruction_types(relative_path, instruction_types):
+            continue
+
+        file_path = target_dir / relative_path
+        if not fs.is_file(file_path):
+            continue
+
+        if manifest.is_unmodified(target_dir, relative_path):
+            unmodified_files.append(file_path)
+        else:
+            modified_files.append(file_path)
+
+    return unmodified_files, modified_files
+
+
+def prune_manifest(manifest: Manifest, target_dir: Path) -> None:
+    """Drop manifest entries whose files no longer exist and persist the result."""
+    fs = get_filesystem()
+    manifest.files = {
+        relative_path: entry
+        for relative_path, entry in manifest.files.items()
+        if fs.is_file(target_dir / relative_path)
+    }
+    save_manifest(target_dir, manifest)
+
+
+def _delete_directory_group(
+    fs: FileSystem, dir_path: Path | None, paths: list[Path]
+) -> tuple[int, list[tuple[Path, Exception]]]:
+    """Delete one directory's worth of files (or a whole directory tree when dir_path is None)."""
+    deleted_count = 0
+    errors: list[tuple[Path, Exception]] = []
+    debug = log.is_enabled_for(logging.DEBUG)
+
+    for path in paths:
         try:
-            _, sections = parse_sections(commands_path.read_text())
-            for header in sections:
-                filename = header_to_filename(header)
-                generated.add(target_dir / f".cursor/commands/{filename}.md")
-                generated.add(target_dir / f".github/prompts/{filename}.prompt.md")
-                generated.add(target_dir / f".gemini/commands/{filename}.toml")
-                generated.add(target_dir / f".claude/commands/{filename}.md")
-                generated.add(target_dir / f".opencode/commands/{filename}.md")
-                generated.add(target_dir / f".agents/skills/{filename}/SKILL.md")
+            if dir_path is None:
+                if debug:
+                    log.debug("deleting directory", path=str(path))
+                fs.rmtree(path)
+            else:
+                if debug:
+                    log.debug("deleting file", path=str(path))
+                fs.unlink(path)
+            deleted_count += 1
         except Exception as e:
-            log.warning("failed to parse commands.md", error=str(e))
+            errors.append((path, e))
+
+    return deleted_count, errors
+
+
+def remove_empty_parents(paths: list[Path], root: Path) -> list[Path]:
+    """Remove agent directories left empty by a deletion, deepest first.
+
+    Only directories below GENERATED_ROOTS are considered, so project directories that
+    merely held a nested AGENTS.md are never removed.
+    """
+    candidates: set[Path] = set()
+    for path in paths:
+        try:
+            relative_parts = path.relative_to(root).parts
+        except ValueError:
+            continue
+
+        if len(relative_parts) < 2 or relative_parts[0] not in GENERATED_ROOTS:
+            continue
+
+        for parent in path.parents:
+            if parent == root:
+                break
+            candidates.add(parent)
 
-    return {p.resolve() for p in generated}
+    fs = get_filesystem()
+    removed = []
+    for dir_path in sorted(candidates, key=lambda p: len(p.parts), reverse=True):
+        try:
+            fs.rmdir(dir_path)
+            removed.append(dir_path)
+        except OSError:
+            # not empty (holds hand-written files) or already gone
+            continue
+
+    return removed
+
+
+def delete_paths(
+    dirs: list[Path], files: list[Path], root: Path, max_workers: int | None = None
+) -> DeletionResult:
+    """Delete files and directory trees concurrently.
+
+    Files are grouped by parent directory so each worker unlinks within one directory,
+    then directories left empty by the deletion are removed bottom-up.
+    """
+    files_by_dir: dict[Path, list[Path]] = defaultdict(list)
+    for file_path in files:
+        files_by_dir[file_path.parent].append(file_path)
+
+    groups: list[tuple[Path | None, list[Path]]] = [(None, [d]) for d in dirs]
+    groups.extend(files_by_dir.items())
+
+    if max_workers is None:
+        max_workers = min(MAX_DELETE_WORKERS, (os.cpu_count() or 1) + 4)
+
+    deleted_count = 0
+    errors: list[tuple[Path, Exception]] = []
+
+    # Workers do not inherit the active filesystem, so hand it to them
+    fs = get_filesystem()
+
+    if groups:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(groups))) as pool:
+            for group_count, group_errors in pool.map(
+                lambda group: _delete_directory_group(fs, *group), groups
+            ):
+                deleted_count += group_count
+                errors.extend(group_errors)
+
+    removed_dirs = remove_empty_parents(dirs + files, root)
+
+    return DeletionResult(deleted_count, errors, removed_dirs)
+
+
+def echo_path_listing(
+    paths: list[Path], root: Path, suffix: str, verbose: bool
+) -> None:
+    """Print paths relative to root, summarized per directory when the list is large."""
+    relative_paths = sorted(path.relative_to(root) for path in paths)
+
+    if verbose or len(relative_paths) <= SUMMARY_THRESHOLD:
+        for relative_path in relative_paths:
+            typer.echo(f"  - {relative_path}{suffix}")
+        return
+
+    counts: dict[str, int] = defaultdict(int)
+    for relative_path in relative_paths:
+        counts[relative_path.parent.as_posix()] += 1
+
+    for dir_name, count in sorted(counts.items()):
+        typer.echo(f"  - {dir_name}/ ({count} items)")
+
+    typer.echo(f"  (use --verbose to list all {len(relative_paths)} paths)")
 
 
 def find_files_to_delete(
@@ -86,6 +294,7 @@ def find_files_to_delete(
     Returns:
         Tuple of (directories, files) to delete
     """
+    fs = get_filesystem()
     dirs_to_delete = []
     files_to_delete = []
 
@@ -98,22 +307,22 @@ def find_files_to_delete(
 
         for dir_name in config["directories"]:
             dir_path = target_dir / dir_name
-            if dir_path.exists() and dir_path.is_dir():
+            if fs.is_dir(dir_path):
                 dirs_to_delete.append(dir_path)
 
         for file_name in config["files"]:
             file_path = target_dir / file_name
-            if file_path.exists() and file_path.is_file():
+            if fs.is_file(file_path):
                 files_to_delete.append(file_path)
 
         for file_name in config.get("generated_files", []):
             file_path = target_dir / file_name
-            if file_path.exists() and file_path.is_file():
+            if fs.is_file(file_path):
                 files_to_delete.append(file_path)
 
         for file_pattern in config.get("recursive_files", []):
-            matching_files = list(target_dir.rglob(file_pattern))
-            files_to_delete.extend([f for f in matching_files if f.is_file()])
+            matching_files = list(fs.rglob(target_dir, file_pattern))
+            files_to_delete.extend([f for f in matching_files if fs.is_file(f)])
 
     # Deduplicate files to delete while preserving order
     files_to_delete = list(dict.fromkeys(files_to_delete))
@@ -144,6 +353,13 @@ def delete_main(
             "--yes", "-y", help="Skip confirmation prompt and delete immediately"
         ),
     ] = False,
+    verbose: Annotated[
+        bool,
+        typer.Option(
+            "--verbose",
+            help=f"List every path instead of a per-directory summary for more than {SUMMARY_THRESHOLD} items",
+        ),
+    ] = False,
 ):
     """Remove downloaded LLM instruction files.
 
@@ -152,6 +368,8 @@ def delete_main(
 
     By default, it ONLY deletes files that correspond to your local 'instructions.md' and
     'commands.md' files. This prevents accidental deletion of manually created files.
+    When a manifest from 'explode' or 'download' is present, exactly the recorded files are
+    deleted, and files edited by hand since generation are preserved.
     Use --everything to delete all standard instruction files and directories.
 
     Examples:
@@ -197,7 +415,7 @@ def delete_main(
 
     target_path = Path(target_dir).resolve()
 
-    if not target_path.exists():
+    if not get_filesystem().exists(target_path):
         log.error("target directory does not exist", target_dir=str(target_path))
         error_msg = f"Target directory does not exist: {target_path}"
         typer.echo(typer.style(error_msg, fg=typer.colors.RED), err=True)
@@ -209,34 +427,41 @@ def delete_main(
         target_dir=str(target_path),
     )
 
-    dirs_to_delete, files_to_delete = find_files_to_delete(
-        instruction_types, target_path
-    )
+    manifest = load_manifest(target_path)
 
     skipped_files = []
+    modified_files = []
+
+    if not everything and manifest.files:
+        log.info("selecting files to delete from manifest")
+        dirs_to_delete = []
+        files_to_delete, modified_files = find_manifest_files_to_delete(
+            manifest, instruction_types, target_path
+        )
+    elif not everything:
+        dirs_to_delete, files_to_delete = find_files_to_delete(
+            instruction_types, target_path
+        )
 
-    if not everything:
         log.info("filtering files to delete based on local sources")
         generated_files = get_generated_files(target_path)
 
         # Expand directories to files for granular filtering
-        expanded_files = []
+        all_candidates = list(files_to_delete)
         for d in dirs_to_delete:
-            expanded_files.extend([f for f in d.rglob("*") if f.is_file()])
+            all_candidates.extend(iter_directory_files(d))
 
-        all_candidates = files_to_delete + expanded_files
-
-        # Filter: keep only files that are in the generated set
-        # We compare resolved paths to be safe
-        files_to_delete = [f for f in all_candidates if f.resolve() in generated_files]
-
-        # Identify skipped files (candidates that were NOT in generated set)
-        skipped_files = [
-            f for f in all_candidates if f.resolve() not in generated_files
-        ]
+        # Keep only files in the generated set; the rest are reported as skipped
+        files_to_delete, skipped_files = partition_generated_candidates(
+            all_candidates, generated_files, target_path
+        )
 
         # We are no longer deleting whole directories in safe mode
         dirs_to_delete = []
+    else:
+        dirs_to_delete, files_to_delete = find_files_to_delete(
+            instruction_types, target_path
+        )
 
     if not dirs_to_delete and not files_to_delete:
         log.info("no files found to delete")
@@ -246,21 +471,22 @@ def delete_main(
                 f"\n{len(skipped_files)} files were skipped because they don't match local instructions/commands."
             )
             typer.echo("Use --everything to delete them.")
+        if modified_files:
+            typer.echo(
+                f"\n{len(modified_files)} generated files were skipped because they were modified since generation."
+            )
+            typer.echo("Use --everything to delete them.")
         return
 
     typer.echo("\nThe following files and directories will be deleted:\n")
 
     if dirs_to_delete:
         typer.echo("Directories:")
-        for dir_path in sorted(dirs_to_delete):
-            relative_path = dir_path.relative_to(target_path)
-            typer.echo(f"  - {relative_path}/")
+        echo_path_listing(dirs_to_delete, target_path, "/", verbose)
 
     if files_to_delete:
         typer.echo("\nFiles:")
-        for file_path in sorted(files_to_delete):
-            relative_path = file_path.relative_to(target_path)
-            typer.echo(f"  - {relative_path}")
+        echo_path_listing(files_to_delete, target_path, "", verbose)
 
     total_items = len(dirs_to_delete) + len(files_to_delete)
     typer.echo(f"\nTotal: {total_items} items")
@@ -270,6 +496,11 @@ def delete_main(
             f"\n(Note: {len(skipped_files)} other files will be preserved. Use --everything to delete them)"
         )
 
+    if modified_files:
+        typer.echo(
+            f"\n(Note: {len(modified_files)} generated files were modified since generation and will be preserved. Use --everything to delete them)"
+        )
+
     if not yes:
         typer.echo()
         confirm = typer.confirm("Are you sure you want to delete these files?")
@@ -278,25 +509,24 @@ def delete_main(
             typer.echo("Deletion cancelled.")
             raise typer.Exit(0)
 
-    deleted_count = 0
+    log.info(
+        "deleting files",
+        directories=len(dirs_to_delete),
+        files=len(files_to_delete),
+    )
+    result = delete_paths(dirs_to_delete, files_to_delete, target_path)
 
-    for dir_path in dirs_to_delete:
-        try:
-            log.info("deleting directory", path=str(dir_path))
-            shutil.rmtree(dir_path)
-            deleted_count += 1
-        except Exception as e:
-            log.error("failed to delete directory", path=str(dir_path), error=str(e))
-            typer.echo(f"Error deleting {dir_path}: {e}", err=True)
+    for path, error in result.errors:
+        log.error("failed to delete path", path=str(path), error=str(error))
+        typer.echo(f"Error deleting {path}: {error}", err=True)
 
-    for file_path in files_to_delete:
-        try:
-            log.info("deleting file", path=str(file_path))
-            file_path.unlink()
-            deleted_count += 1
-        except Exception as e:
-            log.error("failed to delete file", path=str(file_path), error=str(e))
-            typer.echo(f"Error deleting {file_path}: {e}", err=True)
+    if result.removed_dirs:
+        log.info("removed empty directories", count=len(result.removed_dirs))
+
+    deleted_count = result.deleted_count
+
+    if manifest.files:
+        prune_manifest(manifest, target_path)
 
     success_msg = f"Successfully deleted {deleted_count} of {total_items} items."
     typer.echo(typer.style(success_msg, fg=typer.colors.GREEN))
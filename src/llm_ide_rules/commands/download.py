@@ -1,9 +1,12 @@
 """Download command: Download LLM instruction files from GitHub repositories."""
 
+import json
 import os
 import re
+import shutil
 import tempfile
 import zipfile
+from enum import Enum
 from pathlib import Path
 
 import requests
@@ -11,12 +14,30 @@ import typer
 from typing_extensions import Annotated
 
 from llm_ide_rules.commands.explode import explode_implementation
-from llm_ide_rules.constants import VALID_AGENTS
+from llm_ide_rules.constants import INSTRUCTIONS_MARKER, VALID_AGENTS
 from llm_ide_rules.log import log
+from llm_ide_rules.manifest import record_existing_file, recording_manifest
+from llm_ide_rules.timing import span
+from llm_ide_rules.utils import write_preserving_tail
 
 DEFAULT_REPO = "iloveitaly/llm-ide-rules"
 DEFAULT_BRANCH = "master"
 
+# ioctl request number for FICLONE on Linux (clone a whole file via reflink)
+FICLONE = 0x40049409
+
+# ETag and file stats of the extraction held by an archive store
+ARCHIVE_STATE_FILENAME = "archive.json"
+
+
+class LinkMode(str, Enum):
+    """Strategy used to materialize files from a downloaded archive."""
+
+    copy = "copy"
+    hardlink = "hardlink"
+    reflink = "reflink"
+    auto = "auto"
+
 
 def normalize_repo(repo: str) -> str:
     """Normalize repository input to user/repo format.
@@ -96,8 +117,59 @@ INSTRUCTION_TYPES = {
 DEFAULT_TYPES = [k for k in INSTRUCTION_TYPES.keys() if k != "grok"]
 
 
-def download_and_extract_repo(repo: str, branch: str = DEFAULT_BRANCH) -> Path:
-    """Download a GitHub repository as a ZIP and extract it to a temporary directory."""
+def get_archive_store_dir(repo: str, branch: str) -> Path:
+    """Get the cached archive store directory for a repository and branch.
+
+    Linked copies need the source and target on the same filesystem, which is often
+    not true for the system temp directory (tmpfs), so linking modes extract here.
+    """
+    cache_home = Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser()
+    store_name = f"{normalize_repo(repo).replace('/', '__')}@{branch}"
+    return cache_home / "llm-ide-rules" / "archives" / store_name
+
+
+def _snapshot_files(directory: Path) -> dict[str, list[int]]:
+    """Size and mtime of every file below directory, to detect later edits."""
+    snapshot = {}
+    for path in directory.rglob("*"):
+        if path.is_file():
+            stat = path.stat()
+            snapshot[path.relative_to(directory).as_posix()] = [
+                stat.st_size,
+                stat.st_mtime_ns,
+            ]
+    return snapshot
+
+
+def load_current_archive(archive_dir: Path) -> tuple[str, Path] | None:
+    """Get the ETag and repository directory of an archive store, if it is unmodified.
+
+    Hard linked files share their data with the store, so editing one in place edits
+    the store too. Such a store is not reused.
+    """
+    extract_dir = archive_dir / "extracted"
+    try:
+        state = json.loads((archive_dir / ARCHIVE_STATE_FILENAME).read_text())
+        etag, repo_dir, files = state["etag"], state["repo_dir"], state["files"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    if _snapshot_files(extract_dir) != files:
+        log.info("archive store was modified, downloading again", path=str(archive_dir))
+        return None
+
+    return etag, extract_dir / repo_dir
+
+
+def download_and_extract_repo(
+    repo: str, branch: str = DEFAULT_BRANCH, archive_dir: Path | None = None
+) -> Path:
+    """Download a GitHub repository as a ZIP and extract it.
+
+    Extracts to a fresh temporary directory unless `archive_dir` is given. An archive
+    store is revalidated with its ETag and reused while the branch is unchanged,
+    otherwise its previous extraction is replaced.
+    """
     normalized_repo = normalize_repo(repo)
     zip_url = f"https://github.com/{normalized_repo}/archive/{branch}.zip"
 
@@ -115,15 +187,33 @@ def download_and_extract_repo(repo: str, branch: str = DEFAULT_BRANCH) -> Path:
         headers["Authorization"] = f"Bearer {github_token}"
         log.debug("using GITHUB_TOKEN for authentication")
 
+    current_archive = None
+    if archive_dir is not None:
+        current_archive = load_current_archive(archive_dir)
+        if current_archive is not None:
+            headers["If-None-Match"] = current_archive[0]
+
     try:
-        response = requests.get(zip_url, headers=headers, timeout=30)
-        response.raise_for_status()
+        with span("download.fetch") as fetch_span:
+            response = requests.get(zip_url, headers=headers, timeout=30)
+            response.raise_for_status()
+            fetch_span.set(bytes=len(response.content))
     except requests.RequestException as e:
         log.error("failed to download repository", error=str(e), url=zip_url)
         raise typer.Exit(1)
 
-    # Create temporary directory and file
-    temp_dir = Path(tempfile.mkdtemp())
+    if current_archive is not None and response.status_code == 304:
+        log.info("archive store is current", path=str(current_archive[1]))
+        return current_archive[1]
+
+    if archive_dir is None:
+        temp_dir = Path(tempfile.mkdtemp())
+    else:
+        # Replace the previous extraction so the store always mirrors the branch
+        shutil.rmtree(archive_dir, ignore_errors=True)
+        archive_dir.mkdir(parents=True, exist_ok=True)
+        temp_dir = archive_dir
+
     zip_path = temp_dir / "repo.zip"
 
     # Write ZIP content
@@ -133,8 +223,11 @@ def download_and_extract_repo(repo: str, branch: str = DEFAULT_BRANCH) -> Path:
     extract_dir = temp_dir / "extracted"
     extract_dir.mkdir(exist_ok=True)
 
-    with zipfile.ZipFile(zip_path, "r") as zip_ref:
-        zip_ref.extractall(extract_dir)
+    with span("download.extract", bytes=len(response.content)):
+        with zipfile.ZipFile(zip_path, "r") as zip_ref:
+            zip_ref.extractall(extract_dir)
+
+    zip_path.unlink(missing_ok=True)
 
     # Find the extracted repository directory (should be the only directory)
     repo_dirs = [d for d in extract_dir.iterdir() if d.is_dir()]
@@ -145,11 +238,69 @@ def download_and_extract_repo(repo: str, branch: str = DEFAULT_BRANCH) -> Path:
     repo_dir = repo_dirs[0]
     log.info("repository extracted", path=str(repo_dir))
 
+    etag = response.headers.get("ETag")
+    if archive_dir is not None and etag:
+        state = {
+            "etag": etag,
+            "repo_dir": repo_dir.name,
+            "files": _snapshot_files(extract_dir),
+        }
+        (archive_dir / ARCHIVE_STATE_FILENAME).write_text(json.dumps(state))
+
     return repo_dir
 
 
+def copy_file(source: Path, target: Path, link_mode: LinkMode = LinkMode.copy) -> None:
+    """Materialize a single file using the requested link mode.
+
+    `copy` uses shutil.copyfile, which streams through sendfile/copy_file_range where
+    available instead of loading the file into memory. Linking modes fall back to a
+    regular copy when the filesystem does not support them.
+
+    The materialized file is recorded in the active manifest, if any.
+    """
+    _materialize_file(source, target, link_mode)
+    record_existing_file(target)
+
+
+def _materialize_file(source: Path, target: Path, link_mode: LinkMode) -> None:
+    """Link or copy a file, falling back to a regular copy when linking fails.
+
+    The target is removed first. It may be a hard link into the archive store from an
+    earlier download, and writing through it would overwrite the store.
+    """
+    target.unlink(missing_ok=True)
+
+    if link_mode in (LinkMode.reflink, LinkMode.auto):
+        try:
+            _reflink_file(source, target)
+            return
+        except (ImportError, OSError) as e:
+            log.debug("reflink failed, copying", file=str(target), error=str(e))
+
+    if link_mode == LinkMode.hardlink:
+        try:
+            os.link(source, target)
+            return
+        except OSError as e:
+            log.debug("hardlink failed, copying", file=str(target), error=str(e))
+
+    shutil.copyfile(source, target)
+
+
+def _reflink_file(source: Path, target: Path) -> None:
+    """Clone a file with a copy-on-write reflink (Linux FICLONE)."""
+    import fcntl
+
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+
+
 def copy_instruction_files(
-    repo_dir: Path, instruction_types: list[str], target_dir: Path
+    repo_dir: Path,
+    instruction_types: list[str],
+    target_dir: Path,
+    link_mode: LinkMode = LinkMode.copy,
 ):
     """Copy instruction files from the repository to the target directory."""
     copied_items = []
@@ -182,6 +333,7 @@ def copy_instruction_files(
                     target_subdir,
                     config.get("exclude_patterns", []),
                     config.get("include_patterns", []),
+                    link_mode,
                 )
                 copied_items.append(f"{dir_name}/")
 
@@ -198,20 +350,24 @@ def copy_instruction_files(
                 # Create parent directories if needed
                 target_file.parent.mkdir(parents=True, exist_ok=True)
 
-                # Copy file
-                target_file.write_bytes(source_file.read_bytes())
+                copy_file(source_file, target_file, link_mode)
                 copied_items.append(file_name)
 
         # Copy recursive files (search throughout repository)
         for file_pattern in config.get("recursive_files", []):
-            copied_recursive = copy_recursive_files(repo_dir, target_dir, file_pattern)
+            copied_recursive = copy_recursive_files(
+                repo_dir, target_dir, file_pattern, link_mode
+            )
             copied_items.extend(copied_recursive)
 
     return copied_items
 
 
 def copy_recursive_files(
-    repo_dir: Path, target_dir: Path, file_pattern: str
+    repo_dir: Path,
+    target_dir: Path,
+    file_pattern: str,
+    link_mode: LinkMode = LinkMode.copy,
 ) -> list[str]:
     """Recursively copy files matching pattern, preserving directory structure.
 
@@ -222,6 +378,7 @@ def copy_recursive_files(
         repo_dir: Source repository directory
         target_dir: Target directory to copy to
         file_pattern: File pattern to search for (e.g., "AGENTS.md")
+        link_mode: How to materialize each file (copy, hardlink, reflink, auto)
 
     Returns:
         List of copied file paths relative to target_dir
@@ -251,7 +408,7 @@ def copy_recursive_files(
         )
 
         # Copy file (parent directory already exists)
-        target_file.write_bytes(source_file.read_bytes())
+        copy_file(source_file, target_file, link_mode)
         copied_items.append(str(relative_path))
 
     return copied_items
@@ -262,6 +419,7 @@ def copy_directory_contents(
     target_dir: Path,
     exclude_patterns: list[str],
     include_patterns: list[str] = [],
+    link_mode: LinkMode = LinkMode.copy,
 ):
     """Recursively copy directory contents, excluding specified patterns."""
     for item in source_dir.rglob("*"):
@@ -305,7 +463,7 @@ def copy_directory_contents(
 
             target_file = target_dir / relative_path
             target_file.parent.mkdir(parents=True, exist_ok=True)
-            target_file.write_bytes(item.read_bytes())
+            copy_file(item, target_file, link_mode)
 
 
 def download_main(
@@ -324,6 +482,13 @@ def download_main(
     target_dir: Annotated[
         str, typer.Option("--target", "-t", help="Target directory to download to")
     ] = ".",
+    link_mode: Annotated[
+        LinkMode,
+        typer.Option(
+            "--link-mode",
+            help="How to materialize downloaded files: copy, hardlink, reflink, or auto (reflink with copy fallback)",
+        ),
+    ] = LinkMode.copy,
 ):
     """Download LLM instruction files from GitHub repositories.
 
@@ -347,6 +512,10 @@ def download_main(
     \b
     # Download to a specific directory
     llm_ide_rules download --target ./my-project
+
+    \b
+    # Hard link files from the cached archive store instead of copying
+    llm_ide_rules download --link-mode hardlink
     """
     # Use default types if none specified
     if not instruction_types:
@@ -379,108 +548,118 @@ def download_main(
         branch=branch,
         instruction_types=instruction_types,
         target_dir=str(target_path),
+        link_mode=link_mode.value,
     )
 
-    # Download and extract repository
-    repo_dir = download_and_extract_repo(repo, branch)
-
-    try:
-        # Copy instruction files
-        copied_items = [
-            f"Downloaded: {item}"
-            for item in copy_instruction_files(repo_dir, instruction_types, target_path)
-        ]
-
-        # Check for source files (instructions.md, commands.md) and copy them if available
-        # These are needed for 'explode' logic
-        source_files = ["instructions.md", "commands.md"]
-        sources_copied = False
-
-        # Only copy source files if we have at least one agent that uses explode
-        has_explode_agent = any(t in VALID_AGENTS for t in instruction_types)
-
-        if has_explode_agent:
-            for source_file in source_files:
-                src = repo_dir / source_file
-                dst = target_path / source_file
-                if src.exists():
-                    log.info("copying source file", source=str(src), target=str(dst))
-                    dst.parent.mkdir(parents=True, exist_ok=True)
-
-                    if source_file in ["instructions.md", "commands.md"]:
-                        marker = "<!-- END CLONED INSTRUCTIONS -->"
-                        local_custom_content = ""
-
-                        if dst.exists():
-                            local_content = dst.read_text(encoding="utf-8")
-                            if marker in local_content:
-                                local_custom_content = local_content.split(marker, 1)[1]
-
-                        remote_content = src.read_text(encoding="utf-8")
-                        if marker not in remote_content:
-                            remote_content += f"\n\n{marker}\n"
-
-                        dst.write_text(
-                            remote_content + local_custom_content, encoding="utf-8"
-                        )
-                    else:
-                        dst.write_bytes(src.read_bytes())
-
-                    copied_items.append(f"Downloaded: {source_file}")
-                    sources_copied = True
-
-        # Generate rule files locally for supported agents
-        explodable_agents = [t for t in instruction_types if t in VALID_AGENTS]
+    # Linked files must come from a persistent store on the same filesystem as the target
+    archive_dir = None
+    if link_mode != LinkMode.copy:
+        archive_dir = get_archive_store_dir(repo, branch)
+
+    if link_mode == LinkMode.hardlink:
+        typer.secho(
+            "Warning: hard linked files share their data with the archive cache; "
+            "editing one in place edits the cache too. "
+            "Use --link-mode reflink or auto for copy-on-write files.",
+            fg=typer.colors.YELLOW,
+            err=True,
+        )
 
-        if explodable_agents:
-            if not sources_copied:
-                # Check if they existed in target already?
-                if not (target_path / "instructions.md").exists():
-                    log.warning(
-                        "source file instructions.md missing, generation might fail"
+    # Download and extract repository
+    repo_dir = download_and_extract_repo(repo, branch, archive_dir)
+
+    # Record copied and generated files so delete can target exactly these outputs
+    with recording_manifest(target_path):
+        try:
+            # Copy instruction files
+            with span("download.copy", link_mode=link_mode.value) as copy_span:
+                copied_items = [
+                    f"Downloaded: {item}"
+                    for item in copy_instruction_files(
+                        repo_dir, instruction_types, target_path, link_mode
                     )
+                ]
+                copy_span.set(items=len(copied_items))
+
+            # Check for source files (instructions.md, commands.md) and copy them if available
+            # These are needed for 'explode' logic
+            source_files = ["instructions.md", "commands.md"]
+            sources_copied = False
+
+            # Only copy source files if we have at least one agent that uses explode
+            has_explode_agent = any(t in VALID_AGENTS for t in instruction_types)
+
+            if has_explode_agent:
+                for source_file in source_files:
+                    src = repo_dir / source_file
+                    dst = target_path / source_file
+                    if src.exists():
+                        log.info(
+                            "copying source file", source=str(src), target=str(dst)
+                        )
+                        dst.parent.mkdir(parents=True, exist_ok=True)
+
+                        if source_file in ["instructions.md", "commands.md"]:
+                            # Stream the remote file and keep the local tail
+                            write_preserving_tail(dst, src, INSTRUCTIONS_MARKER)
+                        else:
+                            copy_file(src, dst, link_mode)
+
+                        copied_items.append(f"Downloaded: {source_file}")
+                        sources_copied = True
+
+            # Generate rule files locally for supported agents
+            explodable_agents = [t for t in instruction_types if t in VALID_AGENTS]
+
+            if explodable_agents:
+                if not sources_copied:
+                    # Check if they existed in target already?
+                    if not (target_path / "instructions.md").exists():
+                        log.warning(
+                            "source file instructions.md missing, generation might fail"
+                        )
 
-            for agent in explodable_agents:
-                log.info("generating rules locally", agent=agent)
-                try:
-                    explode_implementation(
-                        input_file="instructions.md",
-                        agent=agent,
-                        working_dir=target_path,
-                    )
-                    copied_items.append(f"Generated: {agent} rules")
-                except Exception as e:
-                    log.error("failed to generate rules", agent=agent, error=str(e))
-                    typer.echo(
-                        f"Warning: Failed to generate rules for {agent}: {e}", err=True
-                    )
+                for agent in explodable_agents:
+                    log.info("generating rules locally", agent=agent)
+                    try:
+                        explode_implementation(
+                            input_file="instructions.md",
+                            agent=agent,
+                            working_dir=target_path,
+                        )
+                        copied_items.append(f"Generated: {agent} rules")
+                    except Exception as e:
+                        log.error("failed to generate rules", agent=agent, error=str(e))
+                        typer.echo(
+                            f"Warning: Failed to generate rules for {agent}: {e}",
+                            err=True,
+                        )
 
-        if copied_items:
-            success_msg = f"Downloaded/Generated items in {target_path}:"
-            typer.echo(typer.style(success_msg, fg=typer.colors.GREEN))
-            for item in copied_items:
-                typer.echo(f"  - {item}")
-        else:
-            log.info("no files were copied or generated")
-
-            # Build list of expected files
-            expected_files = []
-            for inst_type in instruction_types:
-                config = INSTRUCTION_TYPES[inst_type]
-                expected_files.extend(config.get("directories", []))
-                expected_files.extend(config.get("files", []))
-                expected_files.extend(config.get("recursive_files", []))
-
-            error_msg = "No matching instruction files found in the repository."
-            typer.echo(typer.style(error_msg, fg=typer.colors.RED), err=True)
-
-            if expected_files:
-                typer.echo("\nExpected files/directories:", err=True)
-                for expected in expected_files:
-                    typer.echo(f"  - {expected}", err=True)
-
-    finally:
-        # Clean up temporary directory
-        import shutil
-
-        shutil.rmtree(repo_dir.parent.parent, ignore_errors=True)
+            if copied_items:
+                success_msg = f"Downloaded/Generated items in {target_path}:"
+                typer.echo(typer.style(success_msg, fg=typer.colors.GREEN))
+                for item in copied_items:
+                    typer.echo(f"  - {item}")
+            else:
+                log.info("no files were copied or generated")
+
+                # Build list of expected files
+                expected_files = []
+                for inst_type in instruction_types:
+                    config = INSTRUCTION_TYPES[inst_type]
+                    expected_files.extend(config.get("directories", []))
+                    expected_files.extend(config.get("files", []))
+                    expected_files.extend(config.get("recursive_files", []))
+
+                error_msg = "No matching instruction files found in the repository."
+                typer.echo(typer.style(error_msg, fg=typer.colors.RED), err=True)
+
+                if expected_files:
+                    typer.echo("\nExpected files/directories:", err=True)
+                    for expected in expected_files:
+                        typer.echo(f"  - {expected}", err=True)
+
+        finally:
+            # Clean up temporary directory, the archive store is kept for future links
+            if archive_dir is None:
+                shutil.rmtree(repo_dir.parent.parent, ignore_errors=True)
@@ -1,19 +1,45 @@
 """Explode command: Convert instruction file to separate rule files."""
 
+import difflib
+import hashlib
 from pathlib import Path
+from typing import NamedTuple
 from typing_extensions import Annotated
 
 import typer
 
-from llm_ide_rules.agents import get_agent
+from llm_ide_rules.agents import get_agent, get_plugin_agents
 from llm_ide_rules.agents.base import (
     BaseAgent,
+    NormalizedSection,
+    SectionContent,
+    normalize_section,
     replace_header_with_proper_casing,
     write_rule_file,
 )
+from llm_ide_rules.compact import CompactOptions, compact_sources
+from llm_ide_rules.fs import (
+    FileSystem,
+    OverlayFileSystem,
+    get_filesystem,
+    using_filesystem,
+)
 from llm_ide_rules.log import log
-from llm_ide_rules.constants import header_to_filename, VALID_AGENTS
+from llm_ide_rules.manifest import (
+    MANIFEST_FILENAME,
+    hash_file,
+    load_manifest,
+    recording_manifest,
+)
+from llm_ide_rules.constants import (
+    COMMANDS_MARKER,
+    INSTRUCTIONS_MARKER,
+    VALID_AGENTS,
+    header_to_filename,
+)
 from llm_ide_rules.markdown_parser import parse_sections
+from llm_ide_rules.timing import span
+from llm_ide_rules.utils import read_text_before_marker
 
 
 def process_command_section(
@@ -28,36 +54,44 @@ def process_command_section(
 
     filename = header_to_filename(section_name)
     section_content = replace_header_with_proper_casing(section_content, section_name)
+    section = normalize_section(section_content)
 
     for agent in agents:
         if agent.commands_dir:
-            agent.write_command(
-                section_content, filename, dirs[agent.name], section_name
-            )
+            with span(f"explode.render.{agent.name}", section=section_name):
+                agent.write_command(section, filename, dirs[agent.name], section_name)
 
     return True
 
 
 def process_unmapped_as_always_apply(
     section_name: str,
-    section_content: list[str],
+    section_content: SectionContent,
     rule_agents: list[tuple[BaseAgent, Path]],
 ) -> bool:
     """Process an unmapped section as an always-apply rule."""
-    if not any(line.strip() for line in section_content):
-        return False
+    if isinstance(section_content, NormalizedSection):
+        section = section_content
+    else:
+        if not any(line.strip() for line in section_content):
+            return False
+
+        section_content = replace_header_with_proper_casing(
+            section_content, section_name
+        )
+        section = normalize_section(section_content)
 
     filename = header_to_filename(section_name)
-    section_content = replace_header_with_proper_casing(section_content, section_name)
 
     for agent, rules_dir in rule_agents:
-        agent.write_rule(
-            section_content,
-            filename,
-            rules_dir,
-            glob_pattern=None,
-            description=section_name,
-        )
+        with span(f"explode.render.{agent.name}", section=section_name):
+            agent.write_rule(
+                section,
+                filename,
+                rules_dir,
+                glob_pattern=None,
+                description=section_name,
+            )
 
     return True
 
@@ -78,20 +112,255 @@ def get_always_apply_rule_agents(
     ]
 
 
+class ProjectedOutput(NamedTuple):
+    """A file explode would write, described without rendering its content."""
+
+    path: Path
+    agent: str
+    kind: str  # "general", "rule", "command" or "root_doc"
+    section: str | None = None
+    glob_pattern: str | None = None
+
+
+def get_valid_agents() -> list[str]:
+    """Get every --agent value explode accepts, including plugin agents."""
+    return [*VALID_AGENTS, *get_plugin_agents()]
+
+
+def is_valid_agent(agent: str) -> bool:
+    """Check an --agent value, only scanning plugins for names that are not built in."""
+    return agent in VALID_AGENTS or agent in get_plugin_agents()
+
+
+def get_agent_names(agent: str) -> list[str]:
+    """Expand an --agent value into the agent adapters explode runs."""
+    if agent == "all":
+        return [
+            "cursor",
+            "github",
+            "claude",
+            "gemini",
+            "opencode",
+            "agents",
+            "antigravity",
+            "grok",
+        ]
+
+    agent_names = [agent]
+    # OpenCode uses AGENTS.md, so enable the agents adapter automatically
+    if agent in ["opencode"] and "agents" not in agent_names:
+        agent_names.append("agents")
+
+    return agent_names
+
+
+def read_instruction_sources(input_path: Path) -> tuple[str, str]:
+    """Read instructions and the sibling commands.md, dropping content after the markers.
+
+    Raises:
+        FileNotFoundError: if the instructions file does not exist
+    """
+    # Only the part before the marker is read, content after it is local
+    input_text, marker = read_text_before_marker(input_path, INSTRUCTIONS_MARKER)
+    if marker:
+        log.info("ignoring content after marker in instructions file", marker=marker)
+
+    commands_path = input_path.parent / "commands.md"
+    commands_text = ""
+    if get_filesystem().exists(commands_path):
+        log.info("found commands file", commands_file=str(commands_path))
+
+        # Also strip marker for commands.md
+        commands_text, marker = read_text_before_marker(
+            commands_path, COMMANDS_MARKER, INSTRUCTIONS_MARKER
+        )
+        if marker:
+            log.info("ignoring content after marker in commands file", marker=marker)
+
+    return input_text, commands_text
+
+
+def project_explode_outputs(
+    input_text: str,
+    commands_text: str,
+    agent_names: list[str],
+    working_dir: Path,
+    agents_filename: str = "AGENTS.md",
+) -> list[ProjectedOutput]:
+    """List the files explode would write, in time proportional to the section count.
+
+    Mirrors explode_implementation using each agent's path declarations instead of
+    rendering content, so ignores, delete and stats can share one source of truth.
+    """
+    general, instruction_sections = parse_sections(input_text)
+    agent_instances = {name: get_agent(name) for name in agent_names}
+
+    outputs: list[ProjectedOutput] = []
+
+    if any(line.strip() for line in general):
+        for agent_name in ("cursor", "github", "claude"):
+            if agent_name not in agent_instances:
+                continue
+
+            general_path = agent_instances[agent_name].get_general_instructions_path(
+                working_dir
+            )
+            if general_path:
+                outputs.append(ProjectedOutput(general_path, agent_name, "general"))
+
+    rules_sections: dict[str, list[str]] = {}
+    section_globs: dict[str, str | None] = {}
+
+    for section_name, section_data in instruction_sections.items():
+        if not section_data.has_content:
+            continue
+
+        rules_sections[section_name] = section_data.content
+        section_globs[section_name] = section_data.glob_pattern
+        filename = header_to_filename(section_name)
+
+        for agent_name, agent_inst in agent_instances.items():
+            if not agent_inst.rules_dir:
+                continue
+
+            rule_path = agent_inst.get_rule_file_path(
+                agent_inst.get_rules_path(working_dir), filename
+            )
+            outputs.append(
+                ProjectedOutput(
+                    rule_path,
+                    agent_name,
+                    "rule",
+                    section_name,
+                    section_data.glob_pattern,
+                )
+            )
+
+    if commands_text:
+        _, command_sections_data = parse_sections(commands_text)
+
+        for section_name, section_data in command_sections_data.items():
+            if not section_data.has_content:
+                continue
+
+            filename = header_to_filename(section_name)
+            for agent_name, agent_inst in agent_instances.items():
+                if not agent_inst.commands_dir:
+                    continue
+
+                command_path = agent_inst.get_command_file_path(
+                    agent_inst.get_commands_path(working_dir), filename
+                )
+                outputs.append(
+                    ProjectedOutput(command_path, agent_name, "command", section_name)
+                )
+
+    for agent_name, agent_inst in agent_instances.items():
+        filename = agents_filename if agent_name == "agents" else "AGENTS.md"
+        for root_doc_path in agent_inst.get_root_doc_paths(
+            general, rules_sections, working_dir, section_globs, filename
+        ):
+            outputs.append(ProjectedOutput(root_doc_path, agent_name, "root_doc"))
+
+    # Aliases (e.g. grok for antigravity) project onto the same files
+    unique_outputs: dict[Path, ProjectedOutput] = {}
+    for output in outputs:
+        unique_outputs.setdefault(output.path, output)
+
+    return list(unique_outputs.values())
+
+
+def loads_general_instructions(
+    input_text: str, agent_name: str, working_dir: Path, agents_filename: str
+) -> bool:
+    """Check whether an agent gets the general instructions in an always-loaded file.
+
+    That file is the agent's general rule, or the root AGENTS.md or GEMINI.md.
+    """
+    return any(
+        output.kind == "general"
+        or (output.kind == "root_doc" and output.path.parent == working_dir)
+        for output in project_explode_outputs(
+            input_text, "", [agent_name], working_dir, agents_filename
+        )
+    )
+
+
+def compact_sources_by_agent(
+    input_text: str,
+    commands_text: str,
+    agent_names: list[str],
+    working_dir: Path,
+    compact: CompactOptions,
+    agents_filename: str = "AGENTS.md",
+) -> list[tuple[list[str], str, str]]:
+    """Compact the sources once per group of agents loading the same instructions.
+
+    Agents without the general instructions (e.g. antigravity) keep every sentence
+    repeating them.
+
+    Returns:
+        List of (agent names, input text, commands text)
+    """
+    with_general = compact_sources(input_text, commands_text, compact)
+    if not compact.dedupe and not compact.factor_shared:
+        return [(agent_names, *with_general)]
+
+    loading = [
+        agent_name
+        for agent_name in agent_names
+        if loads_general_instructions(
+            with_general[0], agent_name, working_dir, agents_filename
+        )
+    ]
+    others = [agent_name for agent_name in agent_names if agent_name not in loading]
+
+    groups = []
+    if loading:
+        groups.append((loading, *with_general))
+    if others:
+        without_general = compact_sources(
+            input_text, commands_text, compact, general_loaded=False
+        )
+        groups.append((others, *without_general))
+    return groups
+
+
 def explode_implementation(
     input_file: str = "instructions.md",
     agent: str = "all",
     working_dir: Path | None = None,
     agents_filename: str = "AGENTS.md",
+    fs: FileSystem | None = None,
+    compact: CompactOptions | None = None,
+) -> None:
+    """Core implementation of explode command.
+
+    Files are read and written through fs when given (e.g. a MemoryFileSystem to
+    render without touching disk), otherwise through the active filesystem. Sources
+    are compacted before they are parsed when compact is given.
+    """
+    with using_filesystem(fs), span("explode", agent=agent):
+        _explode(input_file, agent, working_dir, agents_filename, compact=compact)
+
+
+def _explode(
+    input_file: str,
+    agent: str,
+    working_dir: Path | None,
+    agents_filename: str,
+    report: bool = True,
+    compact: CompactOptions | None = None,
 ) -> None:
-    """Core implementation of explode command."""
+    """Run explode against the active filesystem, printing a summary if report is set."""
     if working_dir is None:
         working_dir = Path.cwd()
 
-    if agent not in VALID_AGENTS:
-        log.error("invalid agent", agent=agent, valid_agents=VALID_AGENTS)
+    if not is_valid_agent(agent):
+        valid_agents = get_valid_agents()
+        log.error("invalid agent", agent=agent, valid_agents=valid_agents)
         error_msg = (
-            f"Invalid agent '{agent}'. Must be one of: {', '.join(VALID_AGENTS)}"
+            f"Invalid agent '{agent}'. Must be one of: {', '.join(valid_agents)}"
         )
         typer.echo(typer.style(error_msg, fg=typer.colors.RED), err=True)
         raise typer.Exit(1)
@@ -104,23 +373,7 @@ def explode_implementation(
     )
 
     # Initialize only the agents we need
-    agents_to_process = []
-    if agent == "all":
-        agents_to_process = [
-            "cursor",
-            "github",
-            "claude",
-            "gemini",
-            "opencode",
-            "agents",
-            "antigravity",
-            "grok",
-        ]
-    else:
-        agents_to_process = [agent]
-        # OpenCode uses AGENTS.md, so enable the agents adapter automatically
-        if agent in ["opencode"] and "agents" not in agents_to_process:
-            agents_to_process.append("agents")
+    agents_to_process = get_agent_names(agent)
 
     # Initialize agents and create directories
     agent_instances = {}
@@ -141,41 +394,120 @@ def explode_implementation(
     input_path = working_dir / input_file
 
     try:
-        input_text = input_path.read_text()
-
-        # Strip marker and everything after it if present
-        marker = "<!-- END CLONED INSTRUCTIONS -->"
-        if marker in input_text:
-            log.info(
-                "ignoring content after marker in instructions file", marker=marker
-            )
-            input_text = input_text.split(marker, 1)[0]
+        with span("explode.read") as read_span:
+            input_text, commands_text = read_instruction_sources(input_path)
+            read_span.set(bytes=len(input_text.encode()) + len(commands_text.encode()))
     except FileNotFoundError:
         log.error("input file not found", input_file=str(input_path))
         error_msg = f"Input file not found: {input_path}"
         typer.echo(typer.style(error_msg, fg=typer.colors.RED), err=True)
         raise typer.Exit(1)
 
-    commands_path = input_path.parent / "commands.md"
-    commands_text = ""
-    if commands_path.exists():
-        commands_text = commands_path.read_text()
-        log.info("found commands file", commands_file=str(commands_path))
+    groups = [(agents_to_process, input_text, commands_text)]
+    if compact is not None:
+        with span("explode.compact", dedupe=compact.dedupe):
+            groups = compact_sources_by_agent(
+                input_text,
+                commands_text,
+                agents_to_process,
+                working_dir,
+                compact,
+                agents_filename,
+            )
 
-        # Also strip marker for commands.md
-        commands_marker = "<!-- END CLONED COMMANDS -->"
-        if commands_marker in commands_text:
-            log.info(
-                "ignoring content after marker in commands file",
-                marker=commands_marker,
+    rules_count = commands_count = 0
+    # Record every generated file so delete can target exactly these outputs
+    with recording_manifest(working_dir):
+        for group_agents, group_input_text, group_commands_text in groups:
+            group_rules_count, group_commands_count = _write_explode_outputs(
+                group_input_text,
+                group_commands_text,
+                {name: agent_instances[name] for name in group_agents},
+                agent_dirs,
+                working_dir,
+                agents_filename,
+            )
+            rules_count = max(rules_count, group_rules_count)
+            commands_count = max(commands_count, group_commands_count)
+
+    if not report:
+        return
+
+    # Build log message and user output based on processed agents
+    log_data = {"agent": agent}
+    created_dirs = []
+
+    for agent_name in agents_to_process:
+        if "rules" in agent_dirs[agent_name]:
+            log_data[f"{agent_name}_rules"] = str(agent_dirs[agent_name]["rules"])
+        if "commands" in agent_dirs[agent_name]:
+            log_data[f"{agent_name}_commands"] = str(agent_dirs[agent_name]["commands"])
+        if agent_dirs[agent_name]:
+            dir_name = ".agents/" if agent_name in {"antigravity", "grok"} else f".{agent_name}/"
+            created_dirs.append(dir_name)
+        # else: agent has no directories (e.g., agents which only generates root doc)
+
+    created_dirs = list(dict.fromkeys(created_dirs))
+
+    if "gemini" in agent_instances:
+        if not agent_instances["gemini"].check_gemini_config(working_dir):
+            typer.secho(
+                "Warning: Gemini CLI configuration missing for GEMINI.md.",
+                fg=typer.colors.YELLOW,
+            )
+            typer.secho(
+                "Run this command to configure it:",
+                fg=typer.colors.YELLOW,
+            )
+            typer.secho(
+                "  llm-ide-rules config",
+                fg=typer.colors.YELLOW,
             )
-            commands_text = commands_text.split(commands_marker, 1)[0]
-        elif marker in commands_text:
-            log.info("ignoring content after marker in commands file", marker=marker)
-            commands_text = commands_text.split(marker, 1)[0]
 
+    # Build summary message
+    parts = []
+    if rules_count > 0:
+        rules_word = "rule" if rules_count == 1 else "rules"
+        parts.append(f"{rules_count} {rules_word}")
+    if commands_count > 0:
+        commands_word = "command" if commands_count == 1 else "commands"
+        parts.append(f"{commands_count} {commands_word}")
+
+    if not parts:
+        success_msg = "Created root documentation files"
+        typer.echo(typer.style(success_msg, fg=typer.colors.GREEN))
+        return
+
+    counts_msg = "Created " + " and ".join(parts)
+
+    if created_dirs:
+        if len(created_dirs) == 1:
+            success_msg = f"{counts_msg} in {created_dirs[0]} directory"
+        else:
+            success_msg = f"{counts_msg} across {len(created_dirs)} directories"
+        typer.echo(typer.style(success_msg, fg=typer.colors.GREEN))
+    else:
+        success_msg = f"{counts_msg} in root documentation files"
+        typer.echo(typer.style(success_msg, fg=typer.colors.GREEN))
+
+
+def _write_explode_outputs(
+    input_text: str,
+    commands_text: str,
+    agent_instances: dict[str, BaseAgent],
+    agent_dirs: dict[str, dict[str, Path]],
+    working_dir: Path,
+    agents_filename: str,
+) -> tuple[int, int]:
+    """Write every rule, command and root doc of the given agents.
+
+    Returns:
+        Tuple of (rules count, commands count)
+    """
     # Parse instructions
-    general, instruction_sections = parse_sections(input_text)
+    with span("explode.parse") as parse_span:
+        general, instruction_sections = parse_sections(input_text)
+        parse_span.set(sections=len(instruction_sections))
 
     # Calculate counts for reporting
     rules_count = 0
@@ -183,7 +515,7 @@ def explode_implementation(
         rules_count += 1
 
     for section_data in instruction_sections.values():
-        if any(line.strip() for line in section_data.content):
+        if section_data.has_content:
             rules_count += 1
 
     # Process general instructions for agents that support rules
@@ -196,36 +528,45 @@ alwaysApply: true
 ---
 """
         if "cursor" in agent_instances:
-            write_rule_file(
-                agent_dirs["cursor"]["rules"] / "general.mdc", general_header, general
-            )
+            with span("explode.render.cursor"):
+                write_rule_file(
+                    agent_dirs["cursor"]["rules"] / "general.mdc",
+                    general_header,
+                    general,
+                )
         if "github" in agent_instances:
-            agent_instances["github"].write_general_instructions(general, working_dir)
+            with span("explode.render.github"):
+                agent_instances["github"].write_general_instructions(
+                    general, working_dir
+                )
         if "claude" in agent_instances:
-            agent_instances["claude"].write_rule(
-                general,
-                "general",
-                agent_dirs["claude"]["rules"],
-                glob_pattern=None,
-                description="General Instructions",
-            )
+            with span("explode.render.claude"):
+                agent_instances["claude"].write_rule(
+                    general,
+                    "general",
+                    agent_dirs["claude"]["rules"],
+                    glob_pattern=None,
+                    description="General Instructions",
+                )
 
     # Process sections for agents that support rules
     rules_sections: dict[str, list[str]] = {}
     section_globs: dict[str, str | None] = {}
 
     for section_name, section_data in instruction_sections.items():
+        if not section_data.has_content:
+            continue
+
         content = section_data.content
         glob_pattern = section_data.glob_pattern
 
-        if not any(line.strip() for line in content):
-            continue
-
         rules_sections[section_name] = content
         section_globs[section_name] = glob_pattern
         filename = header_to_filename(section_name)
 
         section_content = replace_header_with_proper_casing(content, section_name)
+        # Trim, description and header extraction run once, agents only format
+        section = normalize_section(section_content, glob_pattern)
 
         if glob_pattern is None:
             # No directive = alwaysApply
@@ -234,7 +575,7 @@ alwaysApply: true
             if rule_agents:
                 process_unmapped_as_always_apply(
                     section_name,
-                    section_content,
+                    section,
                     rule_agents,
                 )
         else:
@@ -243,13 +584,14 @@ alwaysApply: true
                 if "rules" not in agent_dirs[agent_name]:
                     continue
 
-                agent_instances[agent_name].write_rule(
-                    section_content,
-                    filename,
-                    agent_dirs[agent_name]["rules"],
-                    glob_pattern,
-                    description=section_name,
-                )
+                with span(f"explode.render.{agent_name}", section=section_name):
+                    agent_instances[agent_name].write_rule(
+                        section,
+                        filename,
+                        agent_dirs[agent_name]["rules"],
+                        glob_pattern,
+                        description=section_name,
+                    )
 
     # Process commands for all agents
     command_sections_data = {}
@@ -260,103 +602,203 @@ alwaysApply: true
 
         # Calculate commands count
         for section_data in command_sections_data.values():
-            if any(line.strip() for line in section_data.content):
+            if section_data.has_content:
                 commands_count += 1
 
         agents_with_commands = [
-            agent_instances[name]
-            for name in agents_to_process
-            if agent_instances[name].commands_dir
+            agent_inst
+            for agent_inst in agent_instances.values()
+            if agent_inst.commands_dir
         ]
         command_dirs = {
             name: agent_dirs[name]["commands"]
-            for name in agents_to_process
+            for name in agent_instances
             if "commands" in agent_dirs[name]
         }
 
         for section_name, section_data in command_sections_data.items():
-            command_sections[section_name] = section_data.content
+            content = section_data.content
+            command_sections[section_name] = content
             process_command_section(
-                section_name, section_data.content, agents_with_commands, command_dirs
+                section_name,
+                content,
+                agents_with_commands,
+                command_dirs,
             )
 
     # Generate root documentation for agents that support it
     for agent_name, agent_inst in agent_instances.items():
         # Special case for 'agents' adapter to use custom filename
-        if agent_name == "agents":
-            agent_inst.generate_root_doc(
-                general,
-                rules_sections,
-                command_sections,
-                working_dir,
-                section_globs=section_globs,
-                filename=agents_filename,
-            )
-        else:
+        root_doc_kwargs = (
+            {"filename": agents_filename} if agent_name == "agents" else {}
+        )
+        with span(f"explode.root_doc.{agent_name}"):
             agent_inst.generate_root_doc(
                 general,
                 rules_sections,
                 command_sections,
                 working_dir,
                 section_globs=section_globs,
+                **root_doc_kwargs,
             )
 
-    # Build log message and user output based on processed agents
-    log_data = {"agent": agent}
-    created_dirs = []
+    return rules_count, commands_count
 
-    for agent_name in agents_to_process:
-        if "rules" in agent_dirs[agent_name]:
-            log_data[f"{agent_name}_rules"] = str(agent_dirs[agent_name]["rules"])
-        if "commands" in agent_dirs[agent_name]:
-            log_data[f"{agent_name}_commands"] = str(agent_dirs[agent_name]["commands"])
-        if agent_dirs[agent_name]:
-            dir_name = ".agents/" if agent_name in {"antigravity", "grok"} else f".{agent_name}/"
-            created_dirs.append(dir_name)
-        # else: agent has no directories (e.g., agents which only generates root doc)
 
-    created_dirs = list(dict.fromkeys(created_dirs))
+class StaleOutput(NamedTuple):
+    """A generated file whose content differs from what explode would write."""
 
-    if "gemini" in agent_instances:
-        if not agent_instances["gemini"].check_gemini_config(working_dir):
-            typer.secho(
-                "Warning: Gemini CLI configuration missing for GEMINI.md.",
-                fg=typer.colors.YELLOW,
-            )
-            typer.secho(
-                "Run this command to configure it:",
-                fg=typer.colors.YELLOW,
-            )
-            typer.secho(
-                "  llm-ide-rules config",
-                fg=typer.colors.YELLOW,
+    path: Path  # relative to the working directory
+    status: str  # "missing" or "modified"
+    added_lines: int = 0
+    removed_lines: int = 0
+
+
+def _describe_modified(
+    file_path: Path, relative_path: Path, expected: bytes
+) -> StaleOutput:
+    """Summarize how a stale file differs from its rendered content."""
+    try:
+        current_lines = get_filesystem().read_text(file_path).splitlines()
+        expected_lines = expected.decode("utf-8").splitlines()
+    except (OSError, UnicodeDecodeError):
+        return StaleOutput(relative_path, "modified")
+
+    added = removed = 0
+    matcher = difflib.SequenceMatcher(
+        None, current_lines, expected_lines, autojunk=False
+    )
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag != "equal":
+            removed += i2 - i1
+            added += j2 - j1
+
+    return StaleOutput(relative_path, "modified", added, removed)
+
+
+def render_explode_outputs(
+    input_file: str,
+    agent: str,
+    working_dir: Path,
+    agents_filename: str = "AGENTS.md",
+    compact: CompactOptions | None = None,
+) -> OverlayFileSystem:
+    """Run explode on an overlay of the active filesystem, keeping every write in memory.
+
+    Reads see the real project, so nested AGENTS.md placement matches a real run.
+    """
+    overlay = OverlayFileSystem(get_filesystem())
+    with using_filesystem(overlay):
+        _explode(
+            input_file,
+            agent,
+            working_dir,
+            agents_filename,
+            report=False,
+            compact=compact,
+        )
+    return overlay
+
+
+def read_rendered_outputs(
+    input_file: str,
+    agent: str,
+    working_dir: Path,
+    compact: CompactOptions | None = None,
+) -> list[tuple[ProjectedOutput, bytes]]:
+    """Render explode's outputs in memory, each paired with its projection.
+
+    A file is listed once for every agent that loads it, with that agent in its
+    projection. Agents sharing files (e.g. opencode loading the AGENTS.md of the agents
+    adapter, or grok and antigravity) each get their own entry.
+
+    Raises:
+        FileNotFoundError: if the instructions file does not exist
+    """
+    input_text, commands_text = read_instruction_sources(working_dir / input_file)
+    agent_names = get_agent_names(agent)
+    groups = [(agent_names, input_text, commands_text)]
+    if compact is not None:
+        groups = compact_sources_by_agent(
+            input_text, commands_text, agent_names, working_dir, compact
+        )
+
+    # Adapters are projected one by one, aliases write the same paths
+    projected: dict[str, list[ProjectedOutput]] = {}
+    for group_agents, group_input_text, group_commands_text in groups:
+        for agent_name in group_agents:
+            projected[agent_name] = project_explode_outputs(
+                group_input_text, group_commands_text, [agent_name], working_dir
             )
 
-    # Build summary message
-    parts = []
-    if rules_count > 0:
-        rules_word = "rule" if rules_count == 1 else "rules"
-        parts.append(f"{rules_count} {rules_word}")
-    if commands_count > 0:
-        commands_word = "command" if commands_count == 1 else "commands"
-        parts.append(f"{commands_count} {commands_word}")
+    overlay = render_explode_outputs(input_file, agent, working_dir, compact=compact)
 
-    if not parts:
-        success_msg = "Created root documentation files"
-        typer.echo(typer.style(success_msg, fg=typer.colors.GREEN))
-        return
+    rendered = []
+    loading_agents = agent_names if agent == "all" else [agent]
+    for loading_agent in loading_agents:
+        seen: set[Path] = set()
+        for adapter in get_agent_names(loading_agent):
+            for output in projected[adapter]:
+                if output.path in seen:
+                    continue
+                seen.add(output.path)
+                try:
+                    data = overlay.read_bytes(output.path)
+                except FileNotFoundError:
+                    # Projected but not rendered, e.g. a root doc without content
+                    continue
+                rendered.append((output._replace(agent=loading_agent), data))
+    return rendered
 
-    counts_msg = "Created " + " and ".join(parts)
 
-    if created_dirs:
-        if len(created_dirs) == 1:
-            success_msg = f"{counts_msg} in {created_dirs[0]} directory"
-        else:
-            success_msg = f"{counts_msg} across {len(created_dirs)} directories"
-        typer.echo(typer.style(success_msg, fg=typer.colors.GREEN))
-    else:
-        success_msg = f"{counts_msg} in root documentation files"
-        typer.echo(typer.style(success_msg, fg=typer.colors.GREEN))
+def check_explode_outputs(
+    input_file: str = "instructions.md",
+    agent: str = "all",
+    working_dir: Path | None = None,
+    agents_filename: str = "AGENTS.md",
+    compact: CompactOptions | None = None,
+) -> tuple[int, list[StaleOutput]]:
+    """Compare every file explode would write with the working tree, writing nothing.
+
+    Explode runs against an overlay that reads the project but keeps writes in memory.
+    Each output is compared by size first, then by sha256. The hash recorded in the
+    manifest is reused while a file's size and mtime are unchanged, so up-to-date files
+    are usually not read at all, and other files are hashed in a streaming pass.
+
+    Returns:
+        Tuple of (number of outputs checked, stale outputs)
+    """
+    if working_dir is None:
+        working_dir = Path.cwd()
+
+    fs = get_filesystem()
+    with span("explode.check", agent=agent):
+        overlay = render_explode_outputs(
+            input_file, agent, working_dir, agents_filename, compact
+        )
+
+    manifest = load_manifest(working_dir)
+    rendered = overlay.files(working_dir)
+    rendered.pop(Path(MANIFEST_FILENAME), None)
+
+    stale: list[StaleOutput] = []
+    for relative_path, expected in sorted(rendered.items()):
+        file_path = working_dir / relative_path
+        try:
+            stat = fs.stat(file_path)
+            if stat.size == len(expected):
+                digest = manifest.cached_digest(
+                    relative_path.as_posix(), stat
+                ) or hash_file(file_path)
+                if digest == hashlib.sha256(expected).hexdigest():
+                    continue
+        except OSError:
+            stale.append(StaleOutput(relative_path, "missing"))
+            continue
+
+        stale.append(_describe_modified(file_path, relative_path, expected))
+
+    return len(rendered), stale
 
 
 def explode_main(
@@ -371,6 +813,130 @@ def explode_main(
             help="Agent to explode for (cursor, github, claude, gemini, or all)",
         ),
     ] = "all",
+    check: Annotated[
+        bool,
+        typer.Option(
+            "--check",
+            help="Verify generated files are up to date without writing; exit 1 if any are stale",
+        ),
+    ] = False,
+    workspace: Annotated[
+        bool,
+        typer.Option(
+            "--workspace",
+            help="Explode every project below the current directory that has its own input file",
+        ),
+    ] = False,
+    jobs: Annotated[
+        int | None,
+        typer.Option(
+            "--jobs",
+            "-j",
+            help="Worker processes for --workspace (default: CPU count)",
+        ),
+    ] = None,
+    compact: Annotated[
+        bool,
+        typer.Option(
+            "--compact",
+            help="Drop blank lines, decorative markdown and redundant whitespace to save tokens",
+        ),
+    ] = False,
+    dedupe: Annotated[
+        bool,
+        typer.Option(
+            "--dedupe",
+            help="Compact and drop sentences repeating the always-loaded instructions",
+        ),
+    ] = False,
+    factor_shared: Annotated[
+        bool,
+        typer.Option(
+            "--factor-shared",
+            help="Compact and move blocks repeated across sections into the general instructions",
+        ),
+    ] = False,
 ) -> None:
     """Convert instruction file to separate rule files."""
-    explode_implementation(input_file, agent, Path.cwd())
+    compact_options = None
+    if compact or dedupe or factor_shared:
+        compact_options = CompactOptions(dedupe, factor_shared)
+
+    if workspace:
+        explode_workspace_main(input_file, agent, check, jobs, compact_options)
+        return
+
+    run_explode(input_file, agent, check, compact_options)
+
+
+def run_explode(
+    input_file: str,
+    agent: str,
+    check: bool = False,
+    compact: CompactOptions | None = None,
+) -> None:
+    """Explode in the current directory, or verify its generated files with check."""
+    if not check:
+        explode_implementation(input_file, agent, Path.cwd(), compact=compact)
+        return
+
+    checked_count, stale = check_explode_outputs(
+        input_file, agent, Path.cwd(), compact=compact
+    )
+    if not stale:
+        success_msg = f"All {checked_count} generated files are up to date"
+        typer.echo(typer.style(success_msg, fg=typer.colors.GREEN))
+        return
+
+    log.info("generated files are out of date", stale=len(stale))
+    error_msg = f"{len(stale)} of {checked_count} generated files are out of date:"
+    typer.echo(typer.style(error_msg, fg=typer.colors.RED), err=True)
+    for output in stale:
+        if output.status == "missing":
+            detail = "missing"
+        else:
+            detail = f"modified (+{output.added_lines} -{output.removed_lines} lines)"
+        typer.echo(f"  {output.path.as_posix()}: {detail}", err=True)
+
+    typer.echo("Run 'llm-ide-rules explode' to regenerate them.", err=True)
+    raise typer.Exit(1)
+
+
+def explode_workspace_main(
+    input_file: str,
+    agent: str,
+    check: bool,
+    jobs: int | None,
+    compact: CompactOptions | None = None,
+) -> None:
+    """Explode (or check) every project of the workspace rooted at the current directory."""
+    import time
+
+    from llm_ide_rules.workspace import (
+        echo_workspace_report,
+        explode_workspace,
+        find_workspace_projects,
+    )
+
+    if not is_valid_agent(agent):
+        valid_agents = get_valid_agents()
+        error_msg = (
+            f"Invalid agent '{agent}'. Must be one of: {', '.join(valid_agents)}"
+        )
+        typer.echo(typer.style(error_msg, fg=typer.colors.RED), err=True)
+        raise typer.Exit(1)
+
+    root = Path.cwd()
+    start = time.perf_counter()
+    projects = find_workspace_projects(root, input_file)
+    if not projects:
+        error_msg = f"No projects with {input_file} found below {root}"
+        typer.echo(typer.style(error_msg, fg=typer.colors.RED), err=True)
+        raise typer.Exit(1)
+
+    results = explode_workspace(projects, input_file, agent, check, jobs, compact)
+    failed_count = echo_workspace_report(
+        results, root, time.perf_counter() - start, check
+    )
+    if failed_count:
+        raise typer.Exit(1)
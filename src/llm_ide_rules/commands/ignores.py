@@ -1,13 +1,98 @@
 import typer
 from pathlib import Path
 from typing_extensions import Annotated
-from unittest.mock import patch
-from contextlib import redirect_stdout, redirect_stderr
-import io
-import sys
 import re
 
-from llm_ide_rules.commands.explode import explode_implementation
+from llm_ide_rules.agents import get_agent
+from llm_ide_rules.commands.delete import iter_directory_files
+from llm_ide_rules.commands.explode import (
+    get_agent_names,
+    project_explode_outputs,
+    read_instruction_sources,
+)
+from llm_ide_rules.log import log
+from llm_ide_rules.manifest import MANIFEST_FILENAME
+
+
+def get_agent_output_dirs(agent_names: list[str]) -> set[str]:
+    """Get the rules and commands directories owned by the given agents."""
+    output_dirs: set[str] = set()
+    for agent_name in agent_names:
+        agent_inst = get_agent(agent_name)
+        for dir_name in (agent_inst.rules_dir, agent_inst.commands_dir):
+            if dir_name:
+                output_dirs.add(dir_name.strip("/"))
+
+    return output_dirs
+
+
+def expand_ignore_patterns(
+    patterns: list[str], relative_files: set[str], base_dir: Path
+) -> set[str]:
+    """Expand ignore patterns into the generated or on-disk files they match."""
+    expanded: set[str] = set()
+    for pattern in patterns:
+        if not pattern.endswith("/"):
+            expanded.add(pattern)
+            continue
+
+        expanded.update(f for f in relative_files if f.startswith(pattern))
+        expanded.update(
+            path.relative_to(base_dir).as_posix()
+            for path in iter_directory_files(base_dir / pattern)
+        )
+
+    return expanded
+
+
+def compact_ignore_patterns(
+    relative_files: list[str], base_dir: Path, output_dirs: set[str]
+) -> list[str]:
+    """Collapse agent output directories that only hold generated files into one pattern.
+
+    A directory at or below one of output_dirs becomes `dir/` when every file on disk
+    below it is generated. Files next to hand-written ones keep per-file entries. If the
+    expanded patterns do not match exactly the same paths, the per-file list is returned.
+    """
+    generated = set(relative_files)
+
+    candidate_dirs: set[str] = set()
+    for relative_file in generated:
+        parts = relative_file.split("/")[:-1]
+        for depth in range(1, len(parts) + 1):
+            dir_name = "/".join(parts[:depth])
+            if any(
+                dir_name == output_dir or dir_name.startswith(f"{output_dir}/")
+                for output_dir in output_dirs
+            ):
+                candidate_dirs.add(dir_name)
+
+    collapsed_dirs: list[str] = []
+    # Shallowest first so a collapsed directory absorbs its subdirectories
+    for dir_name in sorted(candidate_dirs, key=lambda d: (d.count("/"), d)):
+        if any(dir_name.startswith(f"{parent}/") for parent in collapsed_dirs):
+            continue
+
+        on_disk = (
+            path.relative_to(base_dir).as_posix()
+            for path in iter_directory_files(base_dir / dir_name)
+        )
+        if all(relative_file in generated for relative_file in on_disk):
+            collapsed_dirs.append(dir_name)
+
+    patterns = [f"{dir_name}/" for dir_name in collapsed_dirs]
+    patterns.extend(
+        relative_file
+        for relative_file in relative_files
+        if not any(relative_file.startswith(f"{d}/") for d in collapsed_dirs)
+    )
+    patterns.sort()
+
+    if expand_ignore_patterns(patterns, generated, base_dir) != generated:
+        log.warning("compacted ignore patterns differ from generated files")
+        return sorted(relative_files)
+
+    return patterns
 
 
 def ignores_main(
@@ -29,66 +114,55 @@ def ignores_main(
             help="Print the list of files to stdout instead of updating .gitignore",
         ),
     ] = False,
+    compact: Annotated[
+        bool,
+        typer.Option(
+            "--compact",
+            help="Collapse directories holding only generated files into one pattern",
+        ),
+    ] = False,
 ) -> None:
-    """Generate a list of files that should be ignored by dry-running the explode command.
+    """Generate a list of files that should be ignored from the files explode would write.
 
-    This command uses `unittest.mock.patch` to intercept file system operations (`write_text`, `mkdir`)
-    from the `explode` command. This allows us to reuse the exact logic of `explode` to determine
-    which files *would* be created, without actually creating them or modifying the `explode` implementation
-    to support a dry-run flag.
+    Output paths are projected from the parsed instructions using each agent's path
+    declarations, so nothing is rendered or written to disk.
     """
+    cwd = Path.cwd()
+    input_path = Path(input_file)
 
-    ignored_files = []
-
-    def mock_write_text(self, data, encoding=None, errors=None):
-        # Instead of writing to disk, we record the path that would have been written
-        ignored_files.append(self)
-        return len(data)
-
-    def mock_mkdir(self, mode=0o777, parents=False, exist_ok=False):
-        # We suppress directory creation
-        pass
-
-    # Capture stdout/stderr to suppress explode output (logs, success messages)
-    f_out = io.StringIO()
-    f_err = io.StringIO()
-
-    exit_exception = None
+    try:
+        input_text, commands_text = read_instruction_sources(input_path)
+    except FileNotFoundError:
+        log.error("input file not found", input_file=str(input_path))
+        error_msg = f"Input file not found: {input_path}"
+        typer.echo(typer.style(error_msg, fg=typer.colors.RED), err=True)
+        raise typer.Exit(1)
 
     try:
-        # We patch Path.write_text and Path.mkdir to intercept file creation calls.
-        # This is a creative way to "dry run" the explode command without refactoring it.
-        with (
-            patch(
-                "pathlib.Path.write_text", autospec=True, side_effect=mock_write_text
-            ),
-            patch("pathlib.Path.mkdir", autospec=True, side_effect=mock_mkdir),
-            redirect_stdout(f_out),
-            redirect_stderr(f_err),
-        ):
-            explode_implementation(input_file, agent, Path.cwd())
-
-    except typer.Exit as e:
-        exit_exception = e
-
-    if exit_exception and exit_exception.exit_code != 0:
-        # If explode failed, print captured stderr to real stderr and re-raise
-        print(f_err.getvalue(), file=sys.stderr)
-        raise exit_exception
+        agent_names = get_agent_names(agent)
+        outputs = project_explode_outputs(input_text, commands_text, agent_names, cwd)
+    except ValueError as e:
+        typer.echo(typer.style(f"Error: {e}", fg=typer.colors.RED), err=True)
+        raise typer.Exit(1)
 
     # Process files to relative paths with forward slashes
-    cwd = Path.cwd()
     relative_files = []
-    for file_path in ignored_files:
+    for output in outputs:
         try:
-            rel_path = file_path.relative_to(cwd).as_posix()
-            relative_files.append(rel_path)
+            relative_files.append(output.path.relative_to(cwd).as_posix())
         except ValueError:
-            relative_files.append(file_path.as_posix())
+            relative_files.append(output.path.as_posix())
+
+    # The manifest is written alongside the generated files
+    relative_files.append(MANIFEST_FILENAME)
 
     # Sort files to ensure stable output
     relative_files.sort()
 
+    if compact:
+        output_dirs = get_agent_output_dirs(agent_names)
+        relative_files = compact_ignore_patterns(relative_files, cwd, output_dirs)
+
     if print_output:
         for f in relative_files:
             print(f)
@@ -123,4 +197,5 @@ def ignores_main(
         new_content += ignores_block + "\n"
 
     gitignore_path.write_text(new_content)
-    typer.echo(f"Updated .gitignore with {len(relative_files)} ignored files.")
+    noun = "ignore patterns" if compact else "ignored files"
+    typer.echo(f"Updated .gitignore with {len(relative_files)} {noun}.")
@@ -1,14 +1,26 @@
 """Implode command: Bundle rule files into a single instruction file."""
 
+from pathlib import Path
 from typing_extensions import Annotated
 
 import typer
 
 from llm_ide_rules.agents import get_agent
+from llm_ide_rules.agents.base import BaseAgent
+from llm_ide_rules.fs import get_filesystem
 from llm_ide_rules.log import log
+from llm_ide_rules.timing import span
 from llm_ide_rules.utils import find_project_root
 
 
+def _bundle(agent: BaseAgent, kind: str, output_path: Path, **kwargs) -> bool:
+    """Bundle an agent's rules or commands into output_path, timing the phase."""
+    with span(f"implode.bundle_{kind}.{agent.name}"):
+        if kind == "rules":
+            return agent.bundle_rules(output_path, **kwargs)
+        return agent.bundle_commands(output_path, **kwargs)
+
+
 def cursor(
     output: Annotated[
         str, typer.Argument(help="Output file for rules")
@@ -18,6 +30,7 @@ def cursor(
 
     agent = get_agent("cursor")
     base_dir = find_project_root()
+    fs = get_filesystem()
 
     rules_dir = agent.rules_dir
     if not rules_dir:
@@ -31,28 +44,28 @@ def cursor(
     )
 
     rules_path = base_dir / rules_dir
-    if not rules_path.exists():
+    if not fs.exists(rules_path):
         log.error("cursor rules directory not found", rules_dir=str(rules_path))
         error_msg = f"Cursor rules directory not found: {rules_path}"
         typer.echo(typer.style(error_msg, fg=typer.colors.RED), err=True)
         raise typer.Exit(1)
 
     output_path = base_dir / output
-    rules_written = agent.bundle_rules(output_path)
+    rules_written = _bundle(agent, "rules", output_path)
     if rules_written:
         success_msg = f"Bundled cursor rules into {output}"
         typer.echo(typer.style(success_msg, fg=typer.colors.GREEN))
     else:
-        output_path.unlink(missing_ok=True)
+        fs.unlink(output_path, missing_ok=True)
         log.info("no cursor rules to bundle")
 
     commands_output_path = base_dir / "commands.md"
-    commands_written = agent.bundle_commands(commands_output_path)
+    commands_written = _bundle(agent, "commands", commands_output_path)
     if commands_written:
         success_msg = "Bundled cursor commands into commands.md"
         typer.echo(typer.style(success_msg, fg=typer.colors.GREEN))
     else:
-        commands_output_path.unlink(missing_ok=True)
+        fs.unlink(commands_output_path, missing_ok=True)
 
 
 def github(
@@ -64,6 +77,7 @@ def github(
 
     agent = get_agent("github")
     base_dir = find_project_root()
+    fs = get_filesystem()
 
     rules_dir = agent.rules_dir
     if not rules_dir:
@@ -77,7 +91,7 @@ def github(
     )
 
     rules_path = base_dir / rules_dir
-    if not rules_path.exists():
+    if not fs.exists(rules_path):
         log.error(
             "github instructions directory not found", instructions_dir=str(rules_path)
         )
@@ -86,21 +100,21 @@ def github(
         raise typer.Exit(1)
 
     output_path = base_dir / output
-    instructions_written = agent.bundle_rules(output_path)
+    instructions_written = _bundle(agent, "rules", output_path)
     if instructions_written:
         success_msg = f"Bundled github instructions into {output}"
         typer.echo(typer.style(success_msg, fg=typer.colors.GREEN))
     else:
-        output_path.unlink(missing_ok=True)
+        fs.unlink(output_path, missing_ok=True)
         log.info("no github instructions to bundle")
 
     commands_output_path = base_dir / "commands.md"
-    prompts_written = agent.bundle_commands(commands_output_path)
+    prompts_written = _bundle(agent, "commands", commands_output_path)
     if prompts_written:
         success_msg = "Bundled github prompts into commands.md"
         typer.echo(typer.style(success_msg, fg=typer.colors.GREEN))
     else:
-        commands_output_path.unlink(missing_ok=True)
+        fs.unlink(commands_output_path, missing_ok=True)
 
 
 def claude(
@@ -112,6 +126,7 @@ def claude(
 
     agent = get_agent("claude")
     base_dir = find_project_root()
+    fs = get_filesystem()
 
     rules_dir = agent.rules_dir
     if not rules_dir:
@@ -125,28 +140,28 @@ def claude(
     )
 
     rules_path = base_dir / rules_dir
-    if not rules_path.exists():
+    if not fs.exists(rules_path):
         log.error("claude code rules directory not found", rules_dir=str(rules_path))
         error_msg = f"Claude Code rules directory not found: {rules_path}"
         typer.echo(typer.style(error_msg, fg=typer.colors.RED), err=True)
         raise typer.Exit(1)
 
     output_path = base_dir / output
-    instructions_written = agent.bundle_rules(output_path)
+    instructions_written = _bundle(agent, "rules", output_path)
     if instructions_written:
         success_msg = f"Bundled claude rules into {output}"
         typer.echo(typer.style(success_msg, fg=typer.colors.GREEN))
     else:
-        output_path.unlink(missing_ok=True)
+        fs.unlink(output_path, missing_ok=True)
         log.info("no claude rules to bundle")
 
     commands_output_path = base_dir / "commands.md"
-    commands_written = agent.bundle_commands(commands_output_path)
+    commands_written = _bundle(agent, "commands", commands_output_path)
     if commands_written:
         success_msg = "Bundled claude commands into commands.md"
         typer.echo(typer.style(success_msg, fg=typer.colors.GREEN))
     else:
-        commands_output_path.unlink(missing_ok=True)
+        fs.unlink(commands_output_path, missing_ok=True)
 
 
 def _bundle_dot_agents(
@@ -156,6 +171,7 @@ def _bundle_dot_agents(
     """Shared implementation for antigravity/grok (the .agents layout provider)."""
     agent = get_agent("antigravity")  # the underlying impl
     base_dir = find_project_root()
+    fs = get_filesystem()
 
     rules_dir = agent.rules_dir
     if not rules_dir:
@@ -170,28 +186,28 @@ def _bundle_dot_agents(
     )
 
     rules_path = base_dir / rules_dir
-    if not rules_path.exists():
+    if not fs.exists(rules_path):
         log.error("rules directory not found", provider=label, rules_dir=str(rules_path))
         error_msg = f"{label.title()} rules directory not found: {rules_path}"
         typer.echo(typer.style(error_msg, fg=typer.colors.RED), err=True)
         raise typer.Exit(1)
 
     output_path = base_dir / output
-    instructions_written = agent.bundle_rules(output_path)
+    instructions_written = _bundle(agent, "rules", output_path)
     if instructions_written:
         success_msg = f"Bundled {label} rules into {output}"
         typer.echo(typer.style(success_msg, fg=typer.colors.GREEN))
     else:
-        output_path.unlink(missing_ok=True)
+        fs.unlink(output_path, missing_ok=True)
         log.info("no rules to bundle", provider=label)
 
     commands_output_path = base_dir / "commands.md"
-    commands_written = agent.bundle_commands(commands_output_path)
+    commands_written = _bundle(agent, "commands", commands_output_path)
     if commands_written:
         success_msg = f"Bundled {label} skills into commands.md"
         typer.echo(typer.style(success_msg, fg=typer.colors.GREEN))
     else:
-        commands_output_path.unlink(missing_ok=True)
+        fs.unlink(commands_output_path, missing_ok=True)
 
 
 def antigravity(
@@ -219,6 +235,7 @@ def gemini(
 
     agent = get_agent("gemini")
     base_dir = find_project_root()
+    fs = get_filesystem()
 
     commands_dir = agent.commands_dir
     if not commands_dir:
@@ -231,7 +248,7 @@ def gemini(
     )
 
     commands_path = base_dir / commands_dir
-    if not commands_path.exists():
+    if not fs.exists(commands_path):
         log.error(
             "gemini cli commands directory not found", commands_dir=str(commands_path)
         )
@@ -240,17 +257,17 @@ def gemini(
         raise typer.Exit(1)
 
     output_path = base_dir / output
-    commands_written = agent.bundle_commands(output_path)
+    commands_written = _bundle(agent, "commands", output_path)
     if commands_written:
         success_msg = f"Bundled gemini commands into {output}"
         typer.echo(typer.style(success_msg, fg=typer.colors.GREEN))
     else:
-        output_path.unlink(missing_ok=True)
+        fs.unlink(output_path, missing_ok=True)
         log.info("no gemini commands to bundle")
 
     # Gemini uses GEMINI.md for rules, so bundle them too
     instructions_output_path = base_dir / "instructions.md"
-    rules_written = agent.bundle_rules(instructions_output_path)
+    rules_written = _bundle(agent, "rules", instructions_output_path)
     if rules_written:
         success_msg = "Bundled Gemini rules (GEMINI.md) into instructions.md"
         typer.echo(typer.style(success_msg, fg=typer.colors.GREEN))
@@ -271,16 +288,17 @@ def agents(
 
     agent = get_agent("agents")
     base_dir = find_project_root()
+    fs = get_filesystem()
 
     log.info("bundling files", filename=filename)
 
     output_path = base_dir / output
-    rules_written = agent.bundle_rules(output_path, filename=filename)
+    rules_written = _bundle(agent, "rules", output_path, filename=filename)
     if rules_written:
         success_msg = f"Bundled {filename} files into {output}"
         typer.echo(typer.style(success_msg, fg=typer.colors.GREEN))
     else:
-        output_path.unlink(missing_ok=True)
+        fs.unlink(output_path, missing_ok=True)
         log.info(f"no {filename} files to bundle")
 
 
@@ -291,6 +309,7 @@ def opencode(
 
     agent = get_agent("opencode")
     base_dir = find_project_root()
+    fs = get_filesystem()
 
     log.info(
         "bundling opencode commands",
@@ -298,7 +317,7 @@ def opencode(
     )
 
     commands_path = base_dir / agent.commands_dir if agent.commands_dir else None
-    if not commands_path or not commands_path.exists():
+    if not commands_path or not fs.exists(commands_path):
         log.error(
             "opencode commands directory not found", commands_dir=str(commands_path)
         )
@@ -307,18 +326,18 @@ def opencode(
         raise typer.Exit(1)
 
     output_path = base_dir / output
-    commands_written = agent.bundle_commands(output_path)
+    commands_written = _bundle(agent, "commands", output_path)
     if commands_written:
         success_msg = f"Bundled opencode commands into {output}"
         typer.echo(typer.style(success_msg, fg=typer.colors.GREEN))
     else:
-        output_path.unlink(missing_ok=True)
+        fs.unlink(output_path, missing_ok=True)
         log.info("no opencode commands to bundle")
 
     # OpenCode uses AGENTS.md for rules, so bundle them too
     agents_agent = get_agent("agents")
     instructions_output_path = base_dir / "instructions.md"
-    rules_written = agents_agent.bundle_rules(instructions_output_path)
+    rules_written = _bundle(agents_agent, "rules", instructions_output_path)
     if rules_written:
         success_msg = "Bundled OpenCode rules (AGENTS.md) into instructions.md"
         typer.echo(typer.style(success_msg, fg=typer.colors.GREEN))
@@ -0,0 +1,59 @@
+"""Serve command: Run a resident daemon that the CLI forwards commands to."""
+
+import socket
+from pathlib import Path
+
+import typer
+from typing_extensions import Annotated
+
+from llm_ide_rules.client import get_socket_path
+from llm_ide_rules.daemon import DaemonServer
+from llm_ide_rules.log import log
+
+
+def is_daemon_running(socket_path: Path) -> bool:
+    """Check whether a daemon is accepting connections on the socket."""
+    if not socket_path.exists():
+        return False
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        try:
+            conn.connect(str(socket_path))
+        except OSError:
+            return False
+
+    return True
+
+
+def serve_main(
+    socket_path: Annotated[
+        str | None,
+        typer.Option(
+            "--socket",
+            help="Unix socket path (default: $LLM_IDE_RULES_SOCKET or a per-user runtime path)",
+        ),
+    ] = None,
+) -> None:
+    """Keep a warm process serving explode, implode, ignores and delete requests.
+
+    While it runs, the CLI forwards those commands over the socket instead of paying
+    interpreter start-up and imports on every call. Set LLM_IDE_RULES_NO_DAEMON=1 to
+    always run locally.
+    """
+    path = Path(socket_path or get_socket_path())
+
+    if is_daemon_running(path):
+        error_msg = f"A daemon is already listening on {path}"
+        typer.echo(typer.style(error_msg, fg=typer.colors.RED), err=True)
+        raise typer.Exit(1)
+
+    server = DaemonServer(path)
+    log.info("daemon listening", socket=str(path))
+    typer.echo(f"Listening on {path} (Ctrl+C to stop)")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,218 @@
+"""Stats command: Report the context size of the files explode generates."""
+
+from pathlib import Path
+from typing import NamedTuple
+
+import typer
+from typing_extensions import Annotated
+
+from llm_ide_rules.commands.explode import (
+    ProjectedOutput,
+    is_valid_agent,
+    read_rendered_outputs,
+)
+from llm_ide_rules.compact import CompactOptions
+from llm_ide_rules.globs import MANUAL_GLOB
+from llm_ide_rules.log import log
+from llm_ide_rules.tokens import TOKEN_ESTIMATORS, TokenEstimator, get_token_estimator
+
+# When an agent loads a generated file into a request
+LOAD_ALWAYS = "always"
+LOAD_GLOB = "glob"
+LOAD_MANUAL = "manual"
+LOAD_ORDER = (LOAD_ALWAYS, LOAD_GLOB, LOAD_MANUAL)
+
+
+class OutputStats(NamedTuple):
+    """Size of one generated file."""
+
+    path: Path
+    agent: str
+    load: str
+    bytes: int
+    tokens: int
+
+
+class LoadTotals(NamedTuple):
+    """Size of everything an agent loads in one way (always, on glob or manually)."""
+
+    agent: str
+    load: str
+    files: int
+    bytes: int
+    tokens: int
+
+
+def classify_load(output: ProjectedOutput, working_dir: Path) -> str:
+    """Tell whether an output is loaded always, for matching files, or on request."""
+    if output.kind == "general":
+        return LOAD_ALWAYS
+    if output.kind == "command":
+        return LOAD_MANUAL
+    if output.kind == "root_doc":
+        # Nested AGENTS.md files only load when working below their directory
+        return LOAD_ALWAYS if output.path.parent == working_dir else LOAD_GLOB
+    if output.glob_pattern is None:
+        return LOAD_ALWAYS
+    if output.glob_pattern == MANUAL_GLOB:
+        return LOAD_MANUAL
+    return LOAD_GLOB
+
+
+def collect_output_stats(
+    input_file: str,
+    agent: str,
+    working_dir: Path,
+    estimator: TokenEstimator,
+    compact: CompactOptions | None = None,
+) -> list[OutputStats]:
+    """Render explode's outputs in memory and measure each one, writing nothing.
+
+    Raises:
+        FileNotFoundError: if the instructions file does not exist
+    """
+    stats = [
+        OutputStats(
+            output.path.relative_to(working_dir),
+            output.agent,
+            classify_load(output, working_dir),
+            len(data),
+            estimator.count(data.decode("utf-8")),
+        )
+        for output, data in read_rendered_outputs(
+            input_file, agent, working_dir, compact
+        )
+    ]
+
+    return sorted(
+        stats, key=lambda s: (s.agent, LOAD_ORDER.index(s.load), s.path.as_posix())
+    )
+
+
+def summarize_loads(stats: list[OutputStats]) -> list[LoadTotals]:
+    """Total the files, bytes and tokens of each agent by how they are loaded."""
+    totals: dict[tuple[str, str], list[int]] = {}
+    for item in stats:
+        total = totals.setdefault((item.agent, item.load), [0, 0, 0])
+        total[0] += 1
+        total[1] += item.bytes
+        total[2] += item.tokens
+
+    return [
+        LoadTotals(agent, load, *total)
+        for (agent, load), total in sorted(
+            totals.items(), key=lambda kv: (kv[0][0], LOAD_ORDER.index(kv[0][1]))
+        )
+    ]
+
+
+def stats_main(
+    input_file: Annotated[
+        str, typer.Argument(help="Input markdown file")
+    ] = "instructions.md",
+    agent: Annotated[
+        str,
+        typer.Option(
+            "--agent",
+            "-a",
+            help="Agent to measure (cursor, github, claude, gemini, opencode, agents, antigravity, grok, or all)",
+        ),
+    ] = "all",
+    estimator_name: Annotated[
+        str,
+        typer.Option(
+            "--estimator",
+            help=f"Token estimator: {', '.join(TOKEN_ESTIMATORS)}, or a module:Class path",
+        ),
+    ] = "heuristic",
+    budget: Annotated[
+        int | None,
+        typer.Option(
+            "--budget",
+            help="Exit 1 when an agent's always-loaded files exceed this many tokens",
+        ),
+    ] = None,
+    show_files: Annotated[
+        bool,
+        typer.Option("--files", help="Also list the size of every generated file"),
+    ] = False,
+    compact: Annotated[
+        bool,
+        typer.Option("--compact", help="Measure the output of explode --compact"),
+    ] = False,
+    dedupe: Annotated[
+        bool,
+        typer.Option("--dedupe", help="Measure the output of explode --dedupe"),
+    ] = False,
+    factor_shared: Annotated[
+        bool,
+        typer.Option(
+            "--factor-shared", help="Measure the output of explode --factor-shared"
+        ),
+    ] = False,
+) -> None:
+    """Report bytes and estimated tokens each agent loads always, on glob, or manually.
+
+    Always-loaded files (general instructions, rules without globs and the root
+    AGENTS.md) are sent with every request, so their size drives latency and cost.
+    Nothing is written: outputs are rendered in memory.
+    """
+    working_dir = Path.cwd()
+
+    if not is_valid_agent(agent):
+        error_msg = f"Invalid agent '{agent}'"
+        typer.echo(typer.style(error_msg, fg=typer.colors.RED), err=True)
+        raise typer.Exit(1)
+
+    try:
+        estimator = get_token_estimator(estimator_name)
+    except ValueError as e:
+        typer.echo(typer.style(f"Error: {e}", fg=typer.colors.RED), err=True)
+        raise typer.Exit(1)
+
+    compact_options = None
+    if compact or dedupe or factor_shared:
+        compact_options = CompactOptions(dedupe, factor_shared)
+
+    try:
+        stats = collect_output_stats(
+            input_file, agent, working_dir, estimator, compact_options
+        )
+    except FileNotFoundError:
+        log.error("input file not found", input_file=input_file)
+        error_msg = f"Input file not found: {working_dir / input_file}"
+        typer.echo(typer.style(error_msg, fg=typer.colors.RED), err=True)
+        raise typer.Exit(1)
+
+    if show_files:
+        path_width = max([len("File"), *(len(s.path.as_posix()) for s in stats)])
+        typer.echo(
+            f"{'File':<{path_width}}  {'Agent':<12}  {'Load':<6}  {'Bytes':>8}  {'Tokens':>7}"
+        )
+        for item in stats:
+            typer.echo(
+                f"{item.path.as_posix():<{path_width}}  {item.agent:<12}  {item.load:<6}"
+                f"  {item.bytes:>8}  {item.tokens:>7}"
+            )
+        typer.echo("")
+
+    totals = summarize_loads(stats)
+    typer.echo(f"{'Agent':<12}  {'Load':<6}  {'Files':>5}  {'Bytes':>8}  {'Tokens':>7}")
+    for total in totals:
+        typer.echo(
+            f"{total.agent:<12}  {total.load:<6}  {total.files:>5}"
+            f"  {total.bytes:>8}  {total.tokens:>7}"
+        )
+    typer.echo(f"\nTokens estimated with the {estimator_name} estimator.")
+
+    if budget is None:
+        return
+
+    over_budget = [
+        total for total in totals if total.load == LOAD_ALWAYS and total.tokens > budget
+    ]
+    for total in over_budget:
+        error_msg = f"{total.agent} always loads {total.tokens} tokens, over the budget of {budget}"
+        typer.echo(typer.style(error_msg, fg=typer.colors.RED), err=True)
+    if over_budget:
+        raise typer.Exit(1)
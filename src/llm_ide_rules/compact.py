@@ -0,0 +1,252 @@
+"""Compact instruction sources to reduce the tokens agents load.
+
+Generated rules are injected into model requests, so compacting drops what costs
+tokens without changing the instructions: repeated blank lines, trailing whitespace,
+decorative markdown (horizontal rules, HTML comments, bold markers and closing
+heading hashes), and `*`/`+` list markers become `-`. Fenced code blocks, inline code
+and `globs:` directives are left untouched.
+
+With dedupe, sentences an agent has already loaded are dropped. Sections without
+globs are loaded with every request, and so are the general instructions for agents
+that get them, so any other section or command repeating one of their sentences
+loses the repeat. With factor_shared, blocks repeated across sections move into the
+general instructions, for agents that get them.
+"""
+
+import re
+from typing import NamedTuple
+
+from llm_ide_rules.duplicates import factor_shared_blocks
+from llm_ide_rules.markdown_parser import parse_sections
+
+# Sentences shorter than this are too generic to deduplicate
+MIN_DEDUPE_WORDS = 4
+
+_FENCE = re.compile(r"^\s{0,3}(`{3,}|~{3,})")
+_HORIZONTAL_RULE = re.compile(r"^\s{0,3}([-*_])(?:\s*\1){2,}\s*$")
+_HTML_COMMENT = re.compile(r"<!--.*?-->")
+_BULLET = re.compile(r"^(\s*)[*+](\s+)")
+_CLOSING_HASHES = re.compile(r"^(#{1,6}\s.*?)\s+#+$")
+_BOLD = re.compile(r"(?<![\w*/])\*\*(?=[^\s*])(.+?)(?<=[^\s*])\*\*(?![\w*/])")
+_INLINE_CODE = re.compile(r"(`+).+?\1")
+_LINE_PREFIX = re.compile(r"^\s*(?:>\s*)*(?:[-*+]\s+|\d+[.)]\s+)?")
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+")
+
+
+class CompactOptions(NamedTuple):
+    """How explode compacts its sources."""
+
+    # Drop sentences repeating the always-loaded instructions
+    dedupe: bool = False
+    # Move blocks repeated across sections into the general instructions
+    factor_shared: bool = False
+
+
+def _outside_inline_code(text: str, transform) -> str:
+    """Apply transform to the parts of a line that are not inline code."""
+    parts = []
+    position = 0
+    for match in _INLINE_CODE.finditer(text):
+        parts.append(transform(text[position : match.start()]))
+        parts.append(match.group(0))
+        position = match.end()
+    parts.append(transform(text[position:]))
+    return "".join(parts)
+
+
+def _is_verbatim(line: str) -> bool:
+    """Check whether a line must be kept exactly as written."""
+    return line.lstrip().lower().startswith("globs:") or line.lstrip().startswith("|")
+
+
+def compact_text(text: str) -> str:
+    """Remove blank lines, whitespace and markdown that only decorate the text."""
+    lines: list[str] = []
+    fence = None
+
+    for line in text.splitlines():
+        if fence:
+            lines.append(line)
+            if line.strip().startswith(fence):
+                fence = None
+            continue
+
+        match = _FENCE.match(line)
+        if match:
+            fence = match.group(1)
+            lines.append(line)
+            continue
+
+        line = _outside_inline_code(line, lambda part: _HTML_COMMENT.sub("", part))
+        line = line.rstrip()
+        previous_blank = not lines or not lines[-1].strip()
+
+        if not line:
+            if not previous_blank:
+                lines.append("")
+            continue
+
+        # A rule right below text underlines a setext heading, keep it
+        if previous_blank and _HORIZONTAL_RULE.match(line):
+            continue
+
+        # The directive is removed from the output, along with the blank line above
+        if line.lstrip().lower().startswith("globs:") and lines and previous_blank:
+            lines.pop()
+
+        if not _is_verbatim(line):
+            line = _BULLET.sub(r"\1-\2", line)
+            line = _CLOSING_HASHES.sub(r"\1", line)
+            line = _outside_inline_code(line, lambda part: _BOLD.sub(r"\1", part))
+        lines.append(line)
+
+    while fence is None and lines and not lines[-1].strip():
+        lines.pop()
+    if not lines:
+        return ""
+    return "\n".join(lines) + "\n"
+
+
+def _sentence_key(sentence: str) -> str | None:
+    """Key identifying a sentence for deduplication, None if it is too short to drop."""
+    words = sentence.lower().split()
+    if len(words) < MIN_DEDUPE_WORDS or sentence[0].islower():
+        return None
+    return " ".join(words)
+
+
+def _is_body(line: str) -> bool:
+    """Check whether a line is content rather than a blank line, heading or directive."""
+    stripped = line.strip()
+    return bool(stripped) and not stripped.startswith("#") and not _is_verbatim(line)
+
+
+def _section_ranges(lines: list[str], text: str) -> list[tuple[int, int, bool]]:
+    """Line ranges of the text before the first section and of each section.
+
+    Each range tells whether it is always loaded: the text before the first section
+    is, and so is every section without globs.
+    """
+    _, sections = parse_sections(text)
+    first_start = min(
+        (data.start_line for data in sections.values()), default=len(lines)
+    )
+    ranges = [(0, first_start, True)]
+    ranges.extend(
+        (data.start_line, data.end_line, data.glob_pattern is None)
+        for data in sections.values()
+    )
+    return ranges
+
+
+def _dedupe_lines(lines: list[str], loaded: set[str], remember: bool) -> list[str]:
+    """Drop sentences of lines already in loaded, adding the kept ones if remember.
+
+    Lines keep their text unless a sentence is dropped from them. A section whose
+    every sentence is already loaded is kept whole, so no rule or command is emptied.
+    """
+    kept_lines = []
+    section_keys: set[str] = set()
+    fence = None
+
+    for line in lines:
+        if fence:
+            kept_lines.append(line)
+            if line.strip().startswith(fence):
+                fence = None
+            continue
+
+        match = _FENCE.match(line)
+        if match:
+            fence = match.group(1)
+            kept_lines.append(line)
+            continue
+
+        if not line.strip() or line.lstrip().startswith("#") or _is_verbatim(line):
+            kept_lines.append(line)
+            continue
+
+        prefix = _LINE_PREFIX.match(line).group(0)
+        sentences = []
+        dropped = False
+        for sentence in _SENTENCE_BREAK.split(line[len(prefix) :].strip()):
+            key = _sentence_key(sentence)
+            if key is not None:
+                if key in loaded or key in section_keys:
+                    dropped = True
+                    continue
+                section_keys.add(key)
+            sentences.append(sentence)
+
+        if not dropped:
+            kept_lines.append(line)
+        elif sentences:
+            ending = line[len(line.rstrip("\r\n")) :]
+            kept_lines.append(prefix + " ".join(sentences) + ending)
+
+    if remember:
+        loaded.update(section_keys)
+    if any(_is_body(line) for line in lines) and not any(
+        _is_body(line) for line in kept_lines
+    ):
+        return lines
+    return kept_lines
+
+
+def dedupe_sentences(
+    input_text: str, commands_text: str, general_loaded: bool = True
+) -> tuple[str, str]:
+    """Drop sentences repeating the always-loaded instructions from other sections.
+
+    Sentences repeated within one section are dropped too. Without general_loaded,
+    the agent never sees the general instructions, so their sentences are kept
+    wherever else they appear.
+    """
+    lines = input_text.splitlines(keepends=True)
+    ranges = _section_ranges(lines, input_text)
+    # The general instructions are the text before the first section
+    ranges[0] = (*ranges[0][:2], general_loaded)
+
+    # Always-loaded ranges go first, so every other section is deduped against them
+    loaded: set[str] = set()
+    deduped: list[list[str]] = [[] for _ in ranges]
+    for index in sorted(range(len(ranges)), key=lambda index: not ranges[index][2]):
+        start, end, always = ranges[index]
+        deduped[index] = _dedupe_lines(lines[start:end], loaded, remember=always)
+    input_text = "".join(line for section_lines in deduped for line in section_lines)
+
+    # Commands are deduped one by one, so none of them is emptied
+    command_lines = commands_text.splitlines(keepends=True)
+    commands_text = "".join(
+        line
+        for start, end, _ in _section_ranges(command_lines, commands_text)
+        for line in _dedupe_lines(command_lines[start:end], loaded, remember=False)
+    )
+    return input_text, commands_text
+
+
+def compact_sources(
+    input_text: str,
+    commands_text: str,
+    options: CompactOptions,
+    general_loaded: bool = True,
+) -> tuple[str, str]:
+    """Compact the instructions and commands text before explode parses them.
+
+    general_loaded tells whether the agent loads the general instructions with every
+    request, see dedupe_sentences. Shared blocks are only factored into them when it
+    does, other agents keep them in each section.
+    """
+    input_text = compact_text(input_text)
+    commands_text = compact_text(commands_text)
+    if not options.dedupe and not options.factor_shared:
+        return input_text, commands_text
+
+    if options.factor_shared and general_loaded:
+        input_text = factor_shared_blocks(input_text)
+    if options.dedupe:
+        input_text, commands_text = dedupe_sentences(
+            input_text, commands_text, general_loaded
+        )
+    # Dropped lines can leave blank lines next to each other
+    return compact_text(input_text), compact_text(commands_text)
@@ -1,5 +1,9 @@
 """Shared constants for explode and implode functionality."""
 
+# Content after these markers is local to the project and preserved across downloads
+INSTRUCTIONS_MARKER = "<!-- END CLONED INSTRUCTIONS -->"
+COMMANDS_MARKER = "<!-- END CLONED COMMANDS -->"
+
 VALID_AGENTS = ["cursor", "github", "claude", "gemini", "opencode", "agents", "antigravity", "grok", "all"]
 
 
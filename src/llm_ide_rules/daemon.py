@@ -0,0 +1,117 @@
+"""Resident daemon serving CLI requests over a Unix domain socket.
+
+`llm-ide-rules serve` keeps a warm process with every module imported and parse and
+settings caches populated. The console script (llm_ide_rules.client) forwards
+explode, implode, ignores and delete invocations to it when the socket exists, and
+falls back to running locally whenever the daemon is unavailable.
+
+Protocol: the client sends one JSON line {"version", "argv", "cwd", "env"} and the
+daemon replies with one JSON line {"exit_code", "stdout", "stderr"} (or {"error"}
+when it refuses the request). Requests are handled one at a time because each one
+runs in the client's working directory and environment.
+"""
+
+import io
+import json
+import os
+import socketserver
+import sys
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+
+from llm_ide_rules.client import get_protocol_version
+from llm_ide_rules.log import log
+
+
+def run_cli(argv: list[str]) -> tuple[int, str, str]:
+    """Run the CLI in-process, capturing its output.
+
+    Returns:
+        Tuple of (exit_code, stdout, stderr)
+    """
+    import click
+
+    from llm_ide_rules.cli import app
+
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    exit_code = 0
+
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            result = app(args=argv, prog_name="llm-ide-rules", standalone_mode=False)
+            if isinstance(result, int):
+                exit_code = result
+        except click.exceptions.Exit as e:
+            exit_code = e.exit_code
+        except click.ClickException as e:
+            e.show(file=stderr)
+            exit_code = e.exit_code
+        except click.exceptions.Abort:
+            stderr.write("Aborted!\n")
+            exit_code = 1
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else 1
+        except Exception:
+            traceback.print_exc(file=stderr)
+            exit_code = 1
+
+    return exit_code, stdout.getvalue(), stderr.getvalue()
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    """Serve a single forwarded CLI invocation."""
+
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+
+        if request.get("version") != get_protocol_version():
+            self._reply({"error": "version mismatch"})
+            return
+
+        original_cwd = os.getcwd()
+        original_env = dict(os.environ)
+        original_stdin = sys.stdin
+        try:
+            os.chdir(request["cwd"])
+            # Commands read tokens, home and cache paths from the client's environment
+            if "env" in request:
+                os.environ.clear()
+                os.environ.update(request["env"])
+                os.environ.setdefault("LOG_LEVEL", "WARNING")
+            # A previous request may have changed the level, e.g. with --verbose
+            log.configure()
+            # Prompts cannot reach the client's terminal, make them abort instead
+            sys.stdin = io.StringIO("")
+            exit_code, stdout, stderr = run_cli(list(request["argv"]))
+        finally:
+            sys.stdin = original_stdin
+            os.chdir(original_cwd)
+            os.environ.clear()
+            os.environ.update(original_env)
+            log.configure()
+
+        self._reply({"exit_code": exit_code, "stdout": stdout, "stderr": stderr})
+
+    def _reply(self, response: dict) -> None:
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """Unix socket server handling requests serially."""
+
+    def __init__(self, socket_path: Path):
+        self.socket_path = socket_path
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        # A socket left behind by a daemon that did not shut down cleanly
+        socket_path.unlink(missing_ok=True)
+        super().__init__(str(socket_path), RequestHandler)
+        os.chmod(socket_path, 0o600)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
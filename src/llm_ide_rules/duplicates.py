@@ -0,0 +1,252 @@
+"""Find blocks of rule content repeated across sections and generated files.
+
+Documents are split into blocks (sentence lines, list items and fenced code blocks)
+and each block is hashed by its normalized text. A paragraph is split after every
+line ending a sentence, so a sentence on its own line matches wherever it appears,
+while a sentence wrapped over several lines stays one block. A hash index finds every
+repeated block in one pass, and matches are extended over the following blocks so a
+run of repeated lines is reported once, at its full length. Headings, front matter
+and `globs:` directives are not content and never match.
+"""
+
+import hashlib
+import re
+from collections.abc import Iterable
+from typing import NamedTuple
+
+from llm_ide_rules.markdown_parser import parse_sections
+
+# Blocks with fewer words are too generic to factor out of their sections
+MIN_FACTOR_WORDS = 4
+
+_FENCE = re.compile(r"^\s{0,3}(`{3,}|~{3,})")
+_LIST_ITEM = re.compile(r"^\s*(?:[-*+]|\d+[.)])\s+")
+_SENTENCE_END = re.compile(r"[.!?]\s*$")
+
+
+class Block(NamedTuple):
+    """Lines [start, end) of a document holding sentences, a list item or code block."""
+
+    start: int
+    end: int
+    key: bytes
+
+
+class Document(NamedTuple):
+    """Text scanned for duplicates, e.g. one section or one generated file."""
+
+    name: str
+    text: str
+
+
+class Occurrence(NamedTuple):
+    """Where a duplicated block appears."""
+
+    document: str
+    line: int  # 1-based
+
+
+class DuplicateBlock(NamedTuple):
+    """A run of blocks appearing in several places."""
+
+    text: str
+    occurrences: list[Occurrence]
+
+
+def _block_key(lines: list[str], code: bool = False) -> bytes:
+    """Hash a block by its text, ignoring case, whitespace and list markers.
+
+    Code keeps its case and line structure, only trailing whitespace is ignored.
+    """
+    if code:
+        normalized = "\n".join(line.rstrip() for line in lines)
+    else:
+        text = " ".join(_LIST_ITEM.sub("", line, count=1) for line in lines)
+        normalized = " ".join(text.lower().split())
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).digest()
+
+
+def _is_directive(line: str) -> bool:
+    """Check for lines that structure a document rather than instruct."""
+    stripped = line.lstrip()
+    return stripped.startswith("#") or stripped.lower().startswith("globs:")
+
+
+def split_blocks(lines: list[str]) -> list[Block]:
+    """Split lines into sentence, list item and fenced code blocks."""
+    blocks: list[Block] = []
+    start = None
+    fence = None
+    in_item = False
+
+    def close(end: int, code: bool = False) -> None:
+        nonlocal start
+        if start is not None:
+            blocks.append(Block(start, end, _block_key(lines[start:end], code)))
+            start = None
+
+    first_line = 0
+    # Front matter of generated rule files
+    if lines and lines[0].strip() == "---":
+        first_line = next(
+            (i + 1 for i in range(1, len(lines)) if lines[i].strip() == "---"), 0
+        )
+
+    for index in range(first_line, len(lines)):
+        line = lines[index]
+        if fence:
+            if line.strip().startswith(fence):
+                fence = None
+                close(index + 1, code=True)
+            continue
+
+        match = _FENCE.match(line)
+        if match:
+            close(index)
+            fence = match.group(1)
+            start = index
+            continue
+
+        if not line.strip() or _is_directive(line):
+            close(index)
+            continue
+
+        # Each list item starts its own block, continuation lines stay with it
+        if _LIST_ITEM.match(line):
+            close(index)
+            in_item = True
+        elif (
+            start is not None and not in_item and _SENTENCE_END.search(lines[index - 1])
+        ):
+            close(index)
+        if start is None:
+            start = index
+            in_item = bool(_LIST_ITEM.match(line))
+
+    close(len(lines), code=fence is not None)
+    return blocks
+
+
+def find_duplicate_blocks(documents: Iterable[Document]) -> list[DuplicateBlock]:
+    """Find every maximal run of blocks that appears more than once.
+
+    Runs are extended from each pair of matching blocks while the following blocks
+    match too, so only pairs whose previous blocks differ start a run.
+    """
+    documents = list(documents)
+    lines = [document.text.splitlines(keepends=True) for document in documents]
+    blocks = [split_blocks(document_lines) for document_lines in lines]
+
+    index: dict[bytes, list[tuple[int, int]]] = {}
+    for doc, document_blocks in enumerate(blocks):
+        for position, block in enumerate(document_blocks):
+            index.setdefault(block.key, []).append((doc, position))
+
+    def key_at(doc: int, position: int) -> bytes | None:
+        if 0 <= position < len(blocks[doc]):
+            return blocks[doc][position].key
+        return None
+
+    runs: dict[tuple[bytes, ...], set[tuple[int, int]]] = {}
+    for occurrences in index.values():
+        for i, (doc, position) in enumerate(occurrences):
+            for other_doc, other_position in occurrences[i + 1 :]:
+                previous = key_at(doc, position - 1)
+                if previous is not None and previous == key_at(
+                    other_doc, other_position - 1
+                ):
+                    continue
+
+                length = 1
+                while (
+                    (doc, position + length) != (other_doc, other_position)
+                    and key_at(doc, position + length) is not None
+                    and key_at(doc, position + length)
+                    == key_at(other_doc, other_position + length)
+                ):
+                    length += 1
+
+                run = tuple(
+                    block.key for block in blocks[doc][position : position + length]
+                )
+                runs.setdefault(run, set()).update(
+                    {(doc, position), (other_doc, other_position)}
+                )
+
+    duplicates = []
+    for run, starts in runs.items():
+        doc, position = min(starts)
+        first, last = blocks[doc][position], blocks[doc][position + len(run) - 1]
+        duplicates.append(
+            DuplicateBlock(
+                "".join(lines[doc][first.start : last.end]),
+                [
+                    Occurrence(documents[d].name, blocks[d][p].start + 1)
+                    for d, p in sorted(starts)
+                ],
+            )
+        )
+
+    return duplicates
+
+
+def factor_shared_blocks(input_text: str) -> str:
+    """Move blocks repeated across sections into the general instructions.
+
+    The general instructions are loaded with every request, so a block appearing in
+    several sections (or already in the general instructions) is kept there once and
+    removed from the sections.
+    """
+    general, sections = parse_sections(input_text)
+    lines = input_text.splitlines(keepends=True)
+    general_blocks = split_blocks(general)
+    general_keys = {block.key for block in general_blocks}
+
+    section_blocks = [
+        (data.start_line, split_blocks(lines[data.start_line : data.end_line]))
+        for data in sections.values()
+    ]
+    sections_by_key: dict[bytes, set[int]] = {}
+    for section_index, (_, blocks) in enumerate(section_blocks):
+        for block in blocks:
+            sections_by_key.setdefault(block.key, set()).add(section_index)
+
+    removed: set[int] = set()
+    factored: list[str] = []
+    previous_item = False
+    previous_end = None
+    for offset, blocks in section_blocks:
+        for block in blocks:
+            block_lines = lines[offset + block.start : offset + block.end]
+            if len("".join(block_lines).split()) < MIN_FACTOR_WORDS:
+                continue
+            if block.key not in general_keys and len(sections_by_key[block.key]) < 2:
+                continue
+
+            removed.update(range(offset + block.start, offset + block.end))
+            if block.key not in general_keys:
+                general_keys.add(block.key)
+                # Consecutive list items stay one list, and lines adjacent in their
+                # section stay one paragraph, other blocks become paragraphs
+                is_item = bool(_LIST_ITEM.match(block_lines[0]))
+                adjacent = offset + block.start == previous_end
+                if factored and not (is_item and previous_item) and not adjacent:
+                    factored.append("\n")
+                factored.append("".join(block_lines).rstrip("\n") + "\n")
+                previous_item = is_item
+                previous_end = offset + block.end
+
+    if not factored and not removed:
+        return input_text
+
+    general_text = "".join(general).rstrip("\n")
+    factored_text = "".join(factored)
+    if general_text:
+        factored_text = f"{general_text}\n\n{factored_text}"
+
+    body = "".join(
+        line
+        for number, line in enumerate(lines[len(general) :], len(general))
+        if number not in removed
+    )
+    return f"{factored_text}\n{body}" if body else factored_text
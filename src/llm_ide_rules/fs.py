@@ -0,0 +1,494 @@
+"""Pluggable filesystem used by agents, explode, implode and delete.
+
+Every read and write of rule files goes through the active FileSystem. The default
+is the real disk; a MemoryFileSystem renders into a mapping of path -> bytes instead,
+which lets the library be embedded (e.g. rendering many projects in a service) without
+temporary directories or any disk I/O.
+
+The active filesystem is held in a context variable, like the active manifest, so it
+does not have to be passed through every agent method. Worker threads do not inherit
+it; code that fans out to threads must capture get_filesystem() first.
+"""
+
+import errno
+import fnmatch
+import io
+import os
+import shutil
+import tempfile
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import BinaryIO, NamedTuple
+
+# Read once while importing, os.umask can only be read by changing it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+class FileStat(NamedTuple):
+    """The parts of a stat result the tool relies on."""
+
+    size: int
+    mtime_ns: int
+
+
+class FileSystem(ABC):
+    """Operations on files and directories used when reading and writing rules."""
+
+    @abstractmethod
+    def open(self, path: Path, mode: str = "rb") -> BinaryIO:
+        """Open a file in binary mode ("rb" or "wb")."""
+        ...
+
+    @abstractmethod
+    def read_bytes(self, path: Path) -> bytes:
+        """Read a whole file."""
+        ...
+
+    @abstractmethod
+    def write_bytes(self, path: Path, data: bytes) -> None:
+        """Write a whole file, creating parent directories as needed."""
+        ...
+
+    @abstractmethod
+    def stat(self, path: Path) -> FileStat:
+        """Get the size and modification time of a file."""
+        ...
+
+    @abstractmethod
+    def exists(self, path: Path) -> bool: ...
+
+    @abstractmethod
+    def is_file(self, path: Path) -> bool: ...
+
+    @abstractmethod
+    def is_dir(self, path: Path) -> bool: ...
+
+    @abstractmethod
+    def mkdir(self, path: Path) -> None:
+        """Create a directory and its parents, doing nothing if it exists."""
+        ...
+
+    @abstractmethod
+    def unlink(self, path: Path, missing_ok: bool = False) -> None: ...
+
+    @abstractmethod
+    def rmdir(self, path: Path) -> None:
+        """Remove an empty directory, raising OSError otherwise."""
+        ...
+
+    @abstractmethod
+    def rmtree(self, path: Path) -> None:
+        """Remove a directory and everything below it."""
+        ...
+
+    @abstractmethod
+    def replace(self, source: Path, target: Path) -> None:
+        """Move source over target, keeping target's permission bits if it exists."""
+        ...
+
+    @abstractmethod
+    def glob(self, path: Path, pattern: str) -> Iterator[Path]:
+        """Match entries below a directory, as Path.glob does."""
+        ...
+
+    @abstractmethod
+    def walk_files(self, path: Path) -> Iterator[Path]:
+        """Yield every file below a directory."""
+        ...
+
+    def resolve(self, path: Path) -> Path:
+        """Get the path a write to path lands on, following symlinks."""
+        return path
+
+    def make_temp_file(self, directory: Path, name: str) -> Path:
+        """Get a new file path in directory, unique even across threads."""
+        return directory / f".{name}.{uuid.uuid4().hex}.tmp"
+
+    def read_text(self, path: Path) -> str:
+        return self.read_bytes(path).decode("utf-8")
+
+    def write_text(self, path: Path, content: str) -> None:
+        self.write_bytes(path, content.encode("utf-8"))
+
+    def rglob(self, path: Path, pattern: str) -> Iterator[Path]:
+        return self.glob(path, f"**/{pattern}")
+
+
+class DiskFileSystem(FileSystem):
+    """The real filesystem."""
+
+    def open(self, path: Path, mode: str = "rb") -> BinaryIO:
+        return open(path, mode)  # type: ignore[return-value]
+
+    def read_bytes(self, path: Path) -> bytes:
+        return path.read_bytes()
+
+    def write_bytes(self, path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+    def stat(self, path: Path) -> FileStat:
+        result = path.stat()
+        return FileStat(result.st_size, result.st_mtime_ns)
+
+    def exists(self, path: Path) -> bool:
+        return path.exists()
+
+    def is_file(self, path: Path) -> bool:
+        return path.is_file()
+
+    def is_dir(self, path: Path) -> bool:
+        return path.is_dir()
+
+    def mkdir(self, path: Path) -> None:
+        path.mkdir(parents=True, exist_ok=True)
+
+    def unlink(self, path: Path, missing_ok: bool = False) -> None:
+        path.unlink(missing_ok=missing_ok)
+
+    def rmdir(self, path: Path) -> None:
+        path.rmdir()
+
+    def rmtree(self, path: Path) -> None:
+        shutil.rmtree(path)
+
+    def replace(self, source: Path, target: Path) -> None:
+        if target.exists():
+            shutil.copymode(target, source)
+        os.replace(source, target)
+
+    def resolve(self, path: Path) -> Path:
+        return path.resolve()
+
+    def make_temp_file(self, directory: Path, name: str) -> Path:
+        fd, temp_name = tempfile.mkstemp(
+            prefix=f".{name}.", suffix=".tmp", dir=directory
+        )
+        os.close(fd)
+        # mkstemp creates the file private, new outputs get the usual permissions
+        os.chmod(temp_name, 0o666 & ~_UMASK)
+        return Path(temp_name)
+
+    def glob(self, path: Path, pattern: str) -> Iterator[Path]:
+        return path.glob(pattern)
+
+    def rglob(self, path: Path, pattern: str) -> Iterator[Path]:
+        return path.rglob(pattern)
+
+    def walk_files(self, path: Path) -> Iterator[Path]:
+        # os.walk does a single scandir pass per directory
+        for dir_path, _dir_names, file_names in os.walk(path):
+            for file_name in file_names:
+                yield Path(dir_path, file_name)
+
+
+class _MemoryWriter(io.BytesIO):
+    """Buffer that stores its contents in a MemoryFileSystem when closed."""
+
+    def __init__(self, fs: "MemoryFileSystem", path: Path):
+        super().__init__()
+        self._fs = fs
+        self._path = path
+
+    def close(self) -> None:
+        if not self.closed:
+            self._fs.write_bytes(self._path, self.getvalue())
+        super().close()
+
+
+class MemoryFileSystem(FileSystem):
+    """A filesystem held entirely in memory.
+
+    Paths are made absolute against the current directory, so relative and absolute
+    spellings of a path refer to the same entry. Directories exist implicitly for every
+    stored file. glob() supports name patterns, optionally prefixed with "**/".
+    """
+
+    def __init__(self, files: Mapping[Path | str, bytes | str] | None = None):
+        self._files: dict[Path, bytes] = {}
+        self._mtimes: dict[Path, int] = {}
+        self._dirs: set[Path] = {Path("/")}
+
+        for path, data in (files or {}).items():
+            if isinstance(data, str):
+                data = data.encode("utf-8")
+            self.write_bytes(Path(path), data)
+
+    @staticmethod
+    def _key(path: Path) -> Path:
+        return Path(os.path.abspath(path))
+
+    def _missing(self, path: Path) -> FileNotFoundError:
+        return FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), str(path))
+
+    def files(self, root: Path | None = None) -> dict[Path, bytes]:
+        """Get the stored files, relative to root when given (limited to files below it)."""
+        if root is None:
+            return dict(self._files)
+
+        root = self._key(root)
+        return {
+            path.relative_to(root): data
+            for path, data in self._files.items()
+            if path.is_relative_to(root)
+        }
+
+    def open(self, path: Path, mode: str = "rb") -> BinaryIO:
+        if mode == "rb":
+            return io.BytesIO(self.read_bytes(path))
+        if mode == "wb":
+            return _MemoryWriter(self, path)
+        raise ValueError(f"Unsupported mode: {mode}")
+
+    def read_bytes(self, path: Path) -> bytes:
+        try:
+            return self._files[self._key(path)]
+        except KeyError:
+            raise self._missing(path) from None
+
+    def write_bytes(self, path: Path, data: bytes) -> None:
+        key = self._key(path)
+        if key in self._dirs:
+            raise IsADirectoryError(errno.EISDIR, os.strerror(errno.EISDIR), str(path))
+
+        self._dirs.update(key.parents)
+        self._files[key] = bytes(data)
+        # Strictly increasing, so a rewrite within one clock tick is still detected
+        previous = self._mtimes.get(key, 0)
+        self._mtimes[key] = max(time.time_ns(), previous + 1)
+
+    def stat(self, path: Path) -> FileStat:
+        key = self._key(path)
+        if key in self._files:
+            return FileStat(len(self._files[key]), self._mtimes[key])
+        if key in self._dirs:
+            return FileStat(0, 0)
+        raise self._missing(path)
+
+    def exists(self, path: Path) -> bool:
+        key = self._key(path)
+        return key in self._files or key in self._dirs
+
+    def is_file(self, path: Path) -> bool:
+        return self._key(path) in self._files
+
+    def is_dir(self, path: Path) -> bool:
+        return self._key(path) in self._dirs
+
+    def mkdir(self, path: Path) -> None:
+        key = self._key(path)
+        if key in self._files:
+            raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), str(path))
+
+        self._dirs.add(key)
+        self._dirs.update(key.parents)
+
+    def unlink(self, path: Path, missing_ok: bool = False) -> None:
+        key = self._key(path)
+        if key not in self._files:
+            if missing_ok:
+                return
+            raise self._missing(path)
+
+        del self._files[key]
+        del self._mtimes[key]
+
+    def _children(self, key: Path) -> Iterator[Path]:
+        for entry in (*self._files, *self._dirs):
+            if entry.parent == key and entry != key:
+                yield entry
+
+    def rmdir(self, path: Path) -> None:
+        key = self._key(path)
+        if key not in self._dirs:
+            raise self._missing(path)
+        if next(self._children(key), None) is not None:
+            raise OSError(errno.ENOTEMPTY, os.strerror(errno.ENOTEMPTY), str(path))
+
+        self._dirs.discard(key)
+
+    def rmtree(self, path: Path) -> None:
+        key = self._key(path)
+        if key not in self._dirs:
+            raise self._missing(path)
+
+        for file_path in [p for p in self._files if p.is_relative_to(key)]:
+            del self._files[file_path]
+            del self._mtimes[file_path]
+        self._dirs = {d for d in self._dirs if not d.is_relative_to(key)}
+
+    def replace(self, source: Path, target: Path) -> None:
+        data = self.read_bytes(source)
+        self.unlink(source)
+        self.write_bytes(target, data)
+
+    def glob(self, path: Path, pattern: str) -> Iterator[Path]:
+        recursive = pattern.startswith("**/")
+        name_pattern = pattern[3:] if recursive else pattern
+        if "/" in name_pattern:
+            raise ValueError(f"Unsupported glob pattern: {pattern}")
+
+        base = self._key(path)
+        # Yield paths spelled like the directory that was passed in, as Path.glob does
+        for entry in sorted({*self._files, *self._dirs}):
+            if entry == base or not entry.is_relative_to(base):
+                continue
+            if not recursive and entry.parent != base:
+                continue
+            if fnmatch.fnmatchcase(entry.name, name_pattern):
+                yield path / entry.relative_to(base)
+
+    def walk_files(self, path: Path) -> Iterator[Path]:
+        base = self._key(path)
+        for entry in sorted(self._files):
+            if entry.is_relative_to(base):
+                yield path / entry.relative_to(base)
+
+
+class OverlayFileSystem(MemoryFileSystem):
+    """Keeps writes in memory on top of a base filesystem that is only read.
+
+    Reads fall through to the base for anything not written or removed through the
+    overlay, so an operation sees the real project but changes none of it. files()
+    returns only what was written through the overlay.
+    """
+
+    def __init__(self, base: FileSystem):
+        super().__init__()
+        self.base = base
+        # Base paths (files or whole trees) removed through the overlay
+        self._removed: set[Path] = set()
+
+    def _hidden(self, key: Path) -> bool:
+        return key in self._removed or any(p in self._removed for p in key.parents)
+
+    def _in_base(self, path: Path) -> bool:
+        return not self._hidden(self._key(path))
+
+    def open(self, path: Path, mode: str = "rb") -> BinaryIO:
+        if mode == "rb" and self._key(path) not in self._files:
+            if not self._in_base(path):
+                raise self._missing(path)
+            return self.base.open(path, "rb")
+        return super().open(path, mode)
+
+    def read_bytes(self, path: Path) -> bytes:
+        if self._key(path) not in self._files:
+            if not self._in_base(path):
+                raise self._missing(path)
+            return self.base.read_bytes(path)
+        return super().read_bytes(path)
+
+    def write_bytes(self, path: Path, data: bytes) -> None:
+        super().write_bytes(path, data)
+        self._removed.discard(self._key(path))
+
+    def resolve(self, path: Path) -> Path:
+        # Writes land where they would on the base, e.g. behind a symlink
+        return self.base.resolve(path)
+
+    def stat(self, path: Path) -> FileStat:
+        key = self._key(path)
+        if key in self._files or (key in self._dirs and not self.base.exists(path)):
+            return super().stat(path)
+        if not self._in_base(path):
+            raise self._missing(path)
+        return self.base.stat(path)
+
+    def exists(self, path: Path) -> bool:
+        return super().exists(path) or (self._in_base(path) and self.base.exists(path))
+
+    def is_file(self, path: Path) -> bool:
+        return super().is_file(path) or (
+            self._in_base(path) and self.base.is_file(path)
+        )
+
+    def is_dir(self, path: Path) -> bool:
+        return super().is_dir(path) or (self._in_base(path) and self.base.is_dir(path))
+
+    def mkdir(self, path: Path) -> None:
+        if self.is_file(path):
+            raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), str(path))
+
+        super().mkdir(path)
+        self._removed.discard(self._key(path))
+
+    def unlink(self, path: Path, missing_ok: bool = False) -> None:
+        key = self._key(path)
+        in_base = self._in_base(path) and self.base.is_file(path)
+        if key not in self._files and not in_base:
+            if missing_ok:
+                return
+            raise self._missing(path)
+
+        super().unlink(path, missing_ok=True)
+        if in_base:
+            self._removed.add(key)
+
+    def rmdir(self, path: Path) -> None:
+        if not self.is_dir(path):
+            raise self._missing(path)
+        if next(self.glob(path, "*"), None) is not None:
+            raise OSError(errno.ENOTEMPTY, os.strerror(errno.ENOTEMPTY), str(path))
+
+        key = self._key(path)
+        self._dirs.discard(key)
+        self._removed.add(key)
+
+    def rmtree(self, path: Path) -> None:
+        if not self.is_dir(path):
+            raise self._missing(path)
+
+        key = self._key(path)
+        for file_path in [p for p in self._files if p.is_relative_to(key)]:
+            del self._files[file_path]
+            del self._mtimes[file_path]
+        self._dirs = {d for d in self._dirs if not d.is_relative_to(key)}
+        self._removed.add(key)
+
+    def _visible_base(self, paths: Iterator[Path]) -> set[Path]:
+        return {p for p in paths if self._in_base(p)}
+
+    def glob(self, path: Path, pattern: str) -> Iterator[Path]:
+        matches = set(super().glob(path, pattern))
+        if self._in_base(path) and self.base.is_dir(path):
+            matches |= self._visible_base(self.base.glob(path, pattern))
+        return iter(sorted(matches))
+
+    def walk_files(self, path: Path) -> Iterator[Path]:
+        files = set(super().walk_files(path))
+        if self._in_base(path) and self.base.is_dir(path):
+            files |= self._visible_base(self.base.walk_files(path))
+        return iter(sorted(files))
+
+
+DISK = DiskFileSystem()
+
+_active_filesystem: ContextVar[FileSystem] = ContextVar(
+    "active_filesystem", default=DISK
+)
+
+
+def get_filesystem() -> FileSystem:
+    """Get the filesystem reads and writes currently go through."""
+    return _active_filesystem.get()
+
+
+@contextmanager
+def using_filesystem(fs: FileSystem | None) -> Iterator[FileSystem]:
+    """Route file operations inside this block through fs (None keeps the current one)."""
+    if fs is None:
+        yield get_filesystem()
+        return
+
+    token = _active_filesystem.set(fs)
+    try:
+        yield fs
+    finally:
+        _active_filesystem.reset(token)
@@ -0,0 +1,346 @@
+"""Match section globs against project files.
+
+Globs are matched against paths relative to the project root, like Cursor and Copilot
+do: `*` and `?` stay within a path segment, `**` spans any number of directories,
+`[...]` is a character class and `{a,b}` expands to alternatives. A `globs:` value
+may list several globs separated by commas.
+
+GlobMatcher compiles every glob once and buckets them by the file extension they
+require, with one combined regex per bucket rejecting non-matching files in a single
+call. Each file is therefore only tested against the handful of globs that can match
+it, which keeps hundreds of globs against hundreds of thousands of files fast.
+
+DirectoryIndex resolves the directory part of globs (e.g. `packages/*/src` in
+`packages/*/src/**/*.ts`) to the project directories it names, for placing nested
+AGENTS.md files.
+"""
+
+import fnmatch
+import os
+import re
+import subprocess
+from collections.abc import Iterable
+from pathlib import Path
+from typing import NamedTuple
+
+from llm_ide_rules.fs import FileSystem, get_filesystem
+
+# Glob value of sections that are only applied when referenced explicitly
+MANUAL_GLOB = "manual"
+
+# Extension taken from a trailing "*.ext" segment, used to bucket globs
+_EXTENSION_SEGMENT = re.compile(r"^\*(\.[A-Za-z0-9_.-]+)$")
+
+
+def split_globs(glob_pattern: str | None) -> list[str]:
+    """Split a `globs:` value into its globs, ignoring commas inside braces."""
+    if not glob_pattern or glob_pattern == MANUAL_GLOB:
+        return []
+
+    globs = []
+    depth = 0
+    current = ""
+    for char in glob_pattern:
+        if char == "," and depth == 0:
+            globs.append(current)
+            current = ""
+            continue
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth = max(depth - 1, 0)
+        current += char
+    globs.append(current)
+
+    return [glob.strip() for glob in globs if glob.strip()]
+
+
+def expand_braces(glob: str) -> list[str]:
+    """Expand `{a,b}` alternatives, e.g. `*.{ts,tsx}` into `*.ts` and `*.tsx`."""
+    match = re.search(r"\{([^{}]*)\}", glob)
+    if not match:
+        return [glob]
+
+    head, tail = glob[: match.start()], glob[match.end() :]
+    return [
+        expanded
+        for option in match.group(1).split(",")
+        for expanded in expand_braces(head + option + tail)
+    ]
+
+
+def _translate_segment(segment: str) -> str:
+    """Translate one path segment of a glob into a regex."""
+    parts = []
+    i = 0
+    while i < len(segment):
+        char = segment[i]
+        if char == "*":
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "[" and "]" in segment[i + 2 :]:
+            end = segment.index("]", i + 2)
+            body = segment[i + 1 : end]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            parts.append(f"[{body.replace(chr(92), chr(92) * 2)}]")
+            i = end
+        else:
+            parts.append(re.escape(char))
+        i += 1
+
+    return "".join(parts)
+
+
+def glob_to_regex(glob: str) -> str:
+    """Translate a glob without braces into a regex matching whole relative paths."""
+    segments = glob.strip().removeprefix("./").strip("/").split("/")
+    parts = []
+    for index, segment in enumerate(segments):
+        is_last = index == len(segments) - 1
+        if segment == "**":
+            # Any number of directories, or anything at all when last
+            parts.append(".*" if is_last else "(?:[^/]+/)*")
+        else:
+            parts.append(_translate_segment(segment) + ("" if is_last else "/"))
+
+    return "".join(parts)
+
+
+def glob_extension(glob: str) -> str | None:
+    """Get the extension every path matched by glob must have, if any."""
+    last_segment = glob.rstrip("/").rsplit("/", 1)[-1]
+    match = _EXTENSION_SEGMENT.match(last_segment)
+    return match.group(1) if match else None
+
+
+def _path_extensions(path: str) -> list[str]:
+    """Every extension suffix of a path's name, e.g. `.test.ts` and `.ts`."""
+    name = path.rsplit("/", 1)[-1]
+    return [name[i:] for i, char in enumerate(name) if char == "." and i > 0]
+
+
+class GlobMatcher:
+    """Match paths against many globs at once."""
+
+    def __init__(self, globs: Iterable[str]):
+        self.globs: list[str] = list(dict.fromkeys(globs))
+
+        # Compiled (glob index, regex) pairs bucketed by required extension, None
+        # holding globs that can match any file name
+        buckets: dict[str | None, list[tuple[int, str]]] = {}
+        for index, glob in enumerate(self.globs):
+            for expanded in expand_braces(glob):
+                buckets.setdefault(glob_extension(expanded), []).append(
+                    (index, glob_to_regex(expanded))
+                )
+
+        self._buckets: dict[str | None, tuple[re.Pattern, list]] = {}
+        for extension, entries in buckets.items():
+            combined = re.compile("|".join(f"(?:{regex})" for _, regex in entries))
+            compiled = [(index, re.compile(regex)) for index, regex in entries]
+            self._buckets[extension] = (combined, compiled)
+
+    def match(self, path: str) -> set[int]:
+        """Get the indexes of every glob matching a relative POSIX path."""
+        matched: set[int] = set()
+        for key in (*_path_extensions(path), None):
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                continue
+
+            combined, compiled = bucket
+            if not combined.fullmatch(path):
+                continue
+
+            for index, regex in compiled:
+                if index not in matched and regex.fullmatch(path):
+                    matched.add(index)
+
+        return matched
+
+
+def has_wildcard(pattern: str) -> bool:
+    """Check whether a glob fragment contains wildcards."""
+    return any(char in pattern for char in "*?[")
+
+
+def glob_directory_prefix(glob: str) -> str:
+    """Get the directory part of a glob before its first `**`, e.g. `src/app`."""
+    if "**" not in glob:
+        return ""
+    return glob.split("**")[0].strip().removeprefix("./").strip("/")
+
+
+class DirectoryIndex:
+    """Subdirectories of a project, each directory listed once on first use.
+
+    Every lookup of a placement shares the listings, so resolving all sections costs
+    one listing per directory named by a glob instead of repeated existence checks.
+    """
+
+    def __init__(self, root: Path, fs: FileSystem | None = None):
+        self.root = root
+        self.fs = fs or get_filesystem()
+        self._subdirs: dict[Path, list[str]] = {}
+
+    def subdirs(self, path: Path) -> list[str]:
+        """Names of the directories directly below path."""
+        if path not in self._subdirs:
+            names = []
+            if self.fs.is_dir(path):
+                names = sorted(
+                    child.name
+                    for child in self.fs.glob(path, "*")
+                    if self.fs.is_dir(child)
+                )
+            self._subdirs[path] = names
+        return self._subdirs[path]
+
+    def match_dirs(self, pattern: str) -> list[Path]:
+        """Get every directory matching a relative pattern of literal or wildcard segments."""
+        matches = [self.root]
+        for segment in pattern.strip("/").split("/"):
+            if not segment:
+                continue
+            if has_wildcard(segment):
+                matches = [
+                    path / name
+                    for path in matches
+                    for name in self.subdirs(path)
+                    if fnmatch.fnmatchcase(name, segment)
+                ]
+            else:
+                matches = [
+                    path / segment for path in matches if segment in self.subdirs(path)
+                ]
+            if not matches:
+                break
+
+        return matches
+
+    def deepest_existing(self, pattern: str) -> Path:
+        """Get the deepest directory on the literal path leading up to pattern."""
+        current = self.root
+        for segment in pattern.strip("/").split("/"):
+            if not segment:
+                continue
+            if has_wildcard(segment) or segment not in self.subdirs(current):
+                break
+            current = current / segment
+        return current
+
+
+def list_project_files(root: Path) -> list[str]:
+    """List project files as POSIX paths relative to root.
+
+    Uses `git ls-files` (tracked plus untracked, not ignored files) inside a git
+    checkout, otherwise a walk skipping hidden, dependency and build directories.
+    """
+    from llm_ide_rules.workspace import WORKSPACE_SKIPPED_DIRS
+
+    try:
+        result = subprocess.run(
+            ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+            cwd=root,
+            capture_output=True,
+            check=True,
+        )
+        return sorted(
+            {os.fsdecode(path) for path in result.stdout.split(b"\0") if path}
+        )
+    except (OSError, subprocess.CalledProcessError):
+        pass
+
+    files = []
+    for dir_path, dir_names, file_names in os.walk(root):
+        dir_names[:] = [
+            name
+            for name in dir_names
+            if not name.startswith(".") and name not in WORKSPACE_SKIPPED_DIRS
+        ]
+        relative_dir = Path(dir_path).relative_to(root).as_posix()
+        prefix = "" if relative_dir == "." else f"{relative_dir}/"
+        files.extend(prefix + name for name in file_names)
+
+    return sorted(files)
+
+
+class SectionCoverage(NamedTuple):
+    """How many project files a section's globs match."""
+
+    section: str
+    globs: list[str]
+    file_count: int
+    # Globs of the section matching no file at all
+    dead_globs: list[str]
+
+
+class SectionOverlap(NamedTuple):
+    """Two sections whose globs match some of the same files."""
+
+    first: str
+    second: str
+    file_count: int
+    example: str
+
+
+def analyze_glob_coverage(
+    section_globs: dict[str, str | None], files: Iterable[str]
+) -> tuple[list[SectionCoverage], list[SectionOverlap]]:
+    """Count matches per section and find overlapping sections in one pass over files.
+
+    Sections without globs (always applied) and manual sections are skipped.
+    """
+    sections = {
+        section: split_globs(glob_pattern)
+        for section, glob_pattern in section_globs.items()
+        if split_globs(glob_pattern)
+    }
+
+    matcher = GlobMatcher(glob for globs in sections.values() for glob in globs)
+    glob_index = {glob: index for index, glob in enumerate(matcher.globs)}
+    sections_by_glob: dict[int, list[str]] = {}
+    for section, globs in sections.items():
+        for glob in globs:
+            sections_by_glob.setdefault(glob_index[glob], []).append(section)
+
+    glob_counts = [0] * len(matcher.globs)
+    section_counts = dict.fromkeys(sections, 0)
+    overlaps: dict[tuple[str, str], list] = {}
+
+    for path in files:
+        matched = matcher.match(path)
+        if not matched:
+            continue
+
+        matched_sections: set[str] = set()
+        for index in matched:
+            glob_counts[index] += 1
+            matched_sections.update(sections_by_glob[index])
+
+        for section in matched_sections:
+            section_counts[section] += 1
+
+        if len(matched_sections) > 1:
+            ordered = sorted(matched_sections)
+            for i, first in enumerate(ordered):
+                for second in ordered[i + 1 :]:
+                    overlap = overlaps.setdefault((first, second), [0, path])
+                    overlap[0] += 1
+
+    coverage = [
+        SectionCoverage(
+            section,
+            globs,
+            section_counts[section],
+            [glob for glob in globs if not glob_counts[glob_index[glob]]],
+        )
+        for section, globs in sections.items()
+    ]
+    overlap_list = [
+        SectionOverlap(first, second, count, example)
+        for (first, second), (count, example) in sorted(overlaps.items())
+    ]
+    return coverage, overlap_list
@@ -0,0 +1,439 @@
+"""Comment-preserving editor for JSONC files such as VS Code settings.json.
+
+The source is tokenized once into a flat list of tokens (whitespace and comments
+included) and parsed into a small concrete syntax tree of object members with their
+source offsets. A batch of updates is turned into non-overlapping text edits that are
+applied in a single pass, so everything outside the edited values is emitted untouched.
+"""
+
+import json
+import re
+from typing import Any, NamedTuple
+
+# Keys are either a literal top-level key ("chat.useAgentsMdFile", dots included, as
+# VS Code uses them) or a tuple path into nested objects (("context", "fileName")).
+JsoncKey = str | tuple[str, ...]
+
+TOKEN_PATTERN = re.compile(
+    r"""
+    (?P<whitespace>\s+)
+    | (?P<line_comment>//[^\n]*)
+    | (?P<block_comment>/\*.*?\*/)
+    | (?P<string>"(?:[^"\\]|\\.)*")
+    | (?P<punct>[{}\[\]:,])
+    | (?P<atom>[^\s{}\[\]:,"/]+)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+TRIVIA = {"whitespace", "line_comment", "block_comment"}
+DEFAULT_INDENT_UNIT = "  "
+
+
+class JsoncError(ValueError):
+    """Raised when a JSONC document cannot be parsed."""
+
+
+class Token(NamedTuple):
+    """A lexical token with its offsets in the source text."""
+
+    kind: str
+    start: int
+    end: int
+    text: str
+
+
+class Member(NamedTuple):
+    """A key/value pair inside an object."""
+
+    key: str
+    key_start: int
+    value_start: int
+    value_end: int
+    # Index of the value's last token, used to find what follows the member
+    value_last_token: int
+    value: "ObjectNode | None"
+
+
+class ObjectNode(NamedTuple):
+    """An object with its members, in source order."""
+
+    open_start: int
+    close_start: int
+    members: list[Member]
+
+
+class Edit(NamedTuple):
+    """Replace source[start:end] with text."""
+
+    start: int
+    end: int
+    text: str
+
+
+def tokenize(source: str) -> list[Token]:
+    """Split a JSONC document into tokens, keeping whitespace and comments."""
+    tokens: list[Token] = []
+    position = 0
+    while position < len(source):
+        match = TOKEN_PATTERN.match(source, position)
+        if match is None:
+            raise JsoncError(f"Unexpected character at offset {position}")
+
+        kind = match.lastgroup
+        assert kind is not None
+        tokens.append(Token(kind, match.start(), match.end(), match.group()))
+        position = match.end()
+
+    return tokens
+
+
+class _Parser:
+    """Recursive descent parser over the significant tokens."""
+
+    def __init__(self, tokens: list[Token]):
+        self.tokens = tokens
+        self.significant = [i for i, t in enumerate(tokens) if t.kind not in TRIVIA]
+        self.position = 0
+
+    def peek(self) -> Token | None:
+        if self.position >= len(self.significant):
+            return None
+        return self.tokens[self.significant[self.position]]
+
+    def advance(self) -> int:
+        index = self.significant[self.position]
+        self.position += 1
+        return index
+
+    def expect(self, text: str) -> int:
+        token = self.peek()
+        if token is None or token.text != text:
+            found = "end of file" if token is None else repr(token.text)
+            raise JsoncError(f"Expected {text!r}, found {found}")
+        return self.advance()
+
+    def parse_document(self) -> ObjectNode:
+        token = self.peek()
+        if token is None or token.text != "{":
+            raise JsoncError("Expected a top-level object")
+
+        node, _ = self.parse_value()
+        if self.peek() is not None:
+            raise JsoncError("Unexpected content after the top-level object")
+
+        assert node is not None
+        return node
+
+    def parse_value(self) -> tuple[ObjectNode | None, int]:
+        """Parse a value, returning its object node (if any) and last token index."""
+        token = self.peek()
+        if token is None:
+            raise JsoncError("Unexpected end of file")
+
+        if token.text == "{":
+            return self.parse_object()
+
+        if token.text == "[":
+            return None, self.parse_array()
+
+        if token.kind in ("string", "atom"):
+            return None, self.advance()
+
+        raise JsoncError(f"Unexpected {token.text!r} at offset {token.start}")
+
+    def parse_object(self) -> tuple[ObjectNode, int]:
+        open_index = self.expect("{")
+        members: list[Member] = []
+
+        while True:
+            token = self.peek()
+            if token is None:
+                raise JsoncError("Unterminated object")
+
+            if token.text == "}":
+                break
+
+            if token.kind != "string":
+                raise JsoncError(f"Expected a key at offset {token.start}")
+
+            key_index = self.advance()
+            self.expect(":")
+            value_first = self.peek()
+            if value_first is None:
+                raise JsoncError("Unexpected end of file")
+
+            value, last_index = self.parse_value()
+            members.append(
+                Member(
+                    key=json.loads(token.text),
+                    key_start=self.tokens[key_index].start,
+                    value_start=value_first.start,
+                    value_end=self.tokens[last_index].end,
+                    value_last_token=last_index,
+                    value=value,
+                )
+            )
+
+            # Commas are optional before the closing brace (trailing commas are JSONC)
+            token = self.peek()
+            if token is not None and token.text == ",":
+                self.advance()
+            elif token is None or token.text != "}":
+                raise JsoncError("Expected ',' or '}' after object member")
+
+        close_index = self.expect("}")
+        node = ObjectNode(
+            open_start=self.tokens[open_index].start,
+            close_start=self.tokens[close_index].start,
+            members=members,
+        )
+        return node, close_index
+
+    def parse_array(self) -> int:
+        self.expect("[")
+        while True:
+            token = self.peek()
+            if token is None:
+                raise JsoncError("Unterminated array")
+
+            if token.text == "]":
+                return self.advance()
+
+            self.parse_value()
+            token = self.peek()
+            if token is not None and token.text == ",":
+                self.advance()
+            elif token is None or token.text != "]":
+                raise JsoncError("Expected ',' or ']' after array element")
+
+
+def parse(source: str) -> tuple[list[Token], ObjectNode]:
+    """Tokenize and parse a JSONC document whose top-level value is an object."""
+    tokens = tokenize(source)
+    return tokens, _Parser(tokens).parse_document()
+
+
+def loads(source: str) -> Any:
+    """Load a JSONC document, ignoring comments and trailing commas."""
+    tokens = tokenize(source)
+    significant = [t for t in tokens if t.kind not in TRIVIA]
+
+    parts: list[str] = []
+    for i, token in enumerate(significant):
+        next_token = significant[i + 1] if i + 1 < len(significant) else None
+        if token.text == "," and (next_token is None or next_token.text in ("}", "]")):
+            continue
+        parts.append(token.text)
+
+    try:
+        return json.loads("".join(parts))
+    except json.JSONDecodeError as e:
+        raise JsoncError(str(e)) from e
+
+
+def nest_updates(updates: dict[JsoncKey, Any]) -> dict[str, Any]:
+    """Expand tuple-path keys into nested dictionaries."""
+    return {
+        key: value.to_plain() if isinstance(value, _Nested) else value
+        for key, value in _group_updates(updates).items()
+    }
+
+
+def _line_indent(source: str, offset: int) -> str:
+    """Get the leading whitespace of the line containing offset."""
+    line_start = source.rfind("\n", 0, offset) + 1
+    line = source[line_start:offset]
+    return line[: len(line) - len(line.lstrip())]
+
+
+def _render_value(value: Any, indent: str, unit: str) -> str:
+    """Serialize a value, indenting continuation lines to sit under indent."""
+    if not isinstance(value, (dict, list)) or not value:
+        return json.dumps(value)
+
+    return json.dumps(value, indent=len(unit)).replace("\n", "\n" + indent)
+
+
+def _value_equals(value_source: str, value: Any) -> bool:
+    """Check whether a value's source text already holds the given value."""
+    try:
+        current = loads(value_source)
+    except JsoncError:
+        return False
+
+    # json treats True == 1, compare types so booleans replace numbers
+    return type(current) is type(value) and current == value
+
+
+def _member_line_end(
+    source: str, tokens: list[Token], member: Member
+) -> tuple[int, bool]:
+    """Find where the member's line ends, after any comma and same-line comment.
+
+    Returns:
+        Tuple of (offset to insert new members at, whether a comma follows the value)
+    """
+    insert_at = member.value_end
+    has_comma = False
+    for token in tokens[member.value_last_token + 1 :]:
+        if token.kind == "whitespace" and "\n" not in token.text:
+            continue
+        if token.text == "," and not has_comma:
+            has_comma = True
+            insert_at = token.end
+            continue
+        if token.kind == "line_comment" or (
+            token.kind == "block_comment" and "\n" not in token.text
+        ):
+            insert_at = token.end
+            continue
+        break
+
+    return insert_at, has_comma
+
+
+class _Nested:
+    """Updates destined for members of a nested object."""
+
+    def __init__(self) -> None:
+        self.updates: dict[str, Any] = {}
+
+    def to_plain(self) -> dict[str, Any]:
+        return {
+            key: value.to_plain() if isinstance(value, _Nested) else value
+            for key, value in self.updates.items()
+        }
+
+
+def _object_edits(
+    source: str,
+    tokens: list[Token],
+    node: ObjectNode,
+    updates: dict[str, Any],
+    unit: str,
+) -> list[Edit]:
+    """Build the edits applying nested updates to one object."""
+    edits: list[Edit] = []
+    members = {member.key: member for member in node.members}
+    missing: dict[str, Any] = {}
+
+    for key, value in updates.items():
+        member = members.get(key)
+        if member is None:
+            missing[key] = value
+            continue
+
+        indent = _line_indent(source, member.key_start)
+        if isinstance(value, _Nested):
+            if member.value is not None:
+                edits.extend(
+                    _object_edits(source, tokens, member.value, value.updates, unit)
+                )
+                continue
+            value = value.to_plain()
+
+        # Equal values keep their original layout
+        if _value_equals(source[member.value_start : member.value_end], value):
+            continue
+
+        rendered = _render_value(value, indent, unit)
+        edits.append(Edit(member.value_start, member.value_end, rendered))
+
+    if not missing:
+        return edits
+
+    missing_plain = {
+        key: value.to_plain() if isinstance(value, _Nested) else value
+        for key, value in missing.items()
+    }
+
+    if node.members:
+        last = node.members[-1]
+        # An object written on one line gets its new members on that line too
+        if "\n" not in source[node.open_start : last.value_end]:
+            entries = [
+                f", {json.dumps(key)}: {json.dumps(value)}"
+                for key, value in missing_plain.items()
+            ]
+            edits.append(Edit(last.value_end, last.value_end, "".join(entries)))
+            return edits
+
+        indent = _line_indent(source, last.key_start)
+        insert_at, has_comma = _member_line_end(source, tokens, last)
+        if not has_comma:
+            edits.append(Edit(last.value_end, last.value_end, ","))
+
+        entries = [
+            f"\n{indent}{json.dumps(key)}: {_render_value(value, indent, unit)}"
+            for key, value in missing_plain.items()
+        ]
+        edits.append(Edit(insert_at, insert_at, ",".join(entries)))
+        return edits
+
+    outer_indent = _line_indent(source, node.open_start)
+    indent = outer_indent + unit
+    entries = [
+        f"\n{indent}{json.dumps(key)}: {_render_value(value, indent, unit)}"
+        for key, value in missing_plain.items()
+    ]
+    # Comments inside the empty object stay in place, members go after them
+    trivia = source[node.open_start + 1 : node.close_start]
+    insert_at = node.open_start + 1 + len(trivia.rstrip())
+    edits.append(
+        Edit(insert_at, node.close_start, ",".join(entries) + f"\n{outer_indent}")
+    )
+    return edits
+
+
+def _group_updates(updates: dict[JsoncKey, Any]) -> dict[str, Any]:
+    """Group path updates into a tree so each object is visited once."""
+    root = _Nested()
+    for key, value in updates.items():
+        path = (key,) if isinstance(key, str) else key
+        target = root
+        for segment in path[:-1]:
+            child = target.updates.get(segment)
+            if not isinstance(child, _Nested):
+                child = target.updates[segment] = _Nested()
+            target = child
+        target.updates[path[-1]] = value
+
+    return root.updates
+
+
+def _detect_indent_unit(source: str, node: ObjectNode) -> str:
+    """Guess the indentation unit from the first top-level member."""
+    if not node.members:
+        return DEFAULT_INDENT_UNIT
+
+    outer = _line_indent(source, node.open_start)
+    inner = _line_indent(source, node.members[0].key_start)
+    if len(inner) > len(outer) and inner.startswith(outer):
+        return inner[len(outer) :]
+
+    return DEFAULT_INDENT_UNIT
+
+
+def apply_updates(source: str, updates: dict[JsoncKey, Any]) -> str:
+    """Apply a batch of key updates to a JSONC document in a single pass.
+
+    Existing values are replaced in place and missing keys are appended to their
+    object, so comments, ordering and formatting elsewhere are preserved.
+
+    Raises:
+        JsoncError: if the document cannot be parsed
+    """
+    tokens, root = parse(source)
+    unit = _detect_indent_unit(source, root)
+    edits = _object_edits(source, tokens, root, _group_updates(updates), unit)
+
+    parts: list[str] = []
+    position = 0
+    for edit in sorted(edits, key=lambda e: (e.start, e.end)):
+        parts.append(source[position : edit.start])
+        parts.append(edit.text)
+        position = edit.end
+    parts.append(source[position:])
+
+    return "".join(parts)
@@ -1,14 +1,81 @@
 """Centralized logging configuration using structlog-config.
 
-This module configures structlog with opinionated defaults and exports a global logger.
-Import the `log` object from this module to use structured logging throughout the application.
+This module exports a global logger. Import the `log` object from this module to use
+structured logging throughout the application.
+
+structlog is configured on the first call that is actually emitted, not at import
+time, and calls below LOG_LEVEL (WARNING by default) return before touching
+structlog at all. Hot loops that build expensive arguments can check
+`log.is_enabled_for(logging.DEBUG)` once and skip the calls entirely.
 """
 
+import logging
 import os
+from typing import Any
 
 if "LOG_LEVEL" not in os.environ:
     os.environ["LOG_LEVEL"] = "WARNING"
 
-from structlog_config import configure_logger
 
-log = configure_logger()
+class LazyLogger:
+    """Logger proxy that configures structlog on first emitted call."""
+
+    def __init__(self):
+        self._logger: Any = None
+        self._level: int | None = None
+
+    @property
+    def level(self) -> int:
+        """Numeric level from LOG_LEVEL, read once until the logger is reconfigured."""
+        if self._level is None:
+            level = logging.getLevelName(os.environ["LOG_LEVEL"].upper())
+            # Levels logging does not know (e.g. TRACE) are left to structlog to filter
+            self._level = level if isinstance(level, int) else logging.NOTSET
+        return self._level
+
+    def is_enabled_for(self, level: int) -> bool:
+        """Check whether calls at level are emitted."""
+        return level >= self.level
+
+    def configure(self) -> None:
+        """Configure structlog now, picking up any change to LOG_LEVEL."""
+        from structlog_config import configure_logger
+
+        self._level = None
+        self._logger = configure_logger()
+
+    def _get_logger(self) -> Any:
+        if self._logger is None:
+            self.configure()
+        return self._logger
+
+    def debug(self, event: str, *args: Any, **kwargs: Any) -> None:
+        if self.level <= logging.DEBUG:
+            self._get_logger().debug(event, *args, **kwargs)
+
+    def info(self, event: str, *args: Any, **kwargs: Any) -> None:
+        if self.level <= logging.INFO:
+            self._get_logger().info(event, *args, **kwargs)
+
+    def warning(self, event: str, *args: Any, **kwargs: Any) -> None:
+        if self.level <= logging.WARNING:
+            self._get_logger().warning(event, *args, **kwargs)
+
+    def error(self, event: str, *args: Any, **kwargs: Any) -> None:
+        if self.level <= logging.ERROR:
+            self._get_logger().error(event, *args, **kwargs)
+
+    def exception(self, event: str, *args: Any, **kwargs: Any) -> None:
+        if self.level <= logging.ERROR:
+            self._get_logger().exception(event, *args, **kwargs)
+
+    def critical(self, event: str, *args: Any, **kwargs: Any) -> None:
+        if self.level <= logging.CRITICAL:
+            self._get_logger().critical(event, *args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        # Context helpers and anything else are delegated to the configured logger
+        return getattr(self._get_logger(), name)
+
+
+log = LazyLogger()
@@ -0,0 +1,178 @@
+"""Manifest of files produced by explode and download.
+
+The manifest records every generated file (relative path, size, sha256 and mtime) so
+that delete can target exactly those files without reparsing sources or walking the
+tree, and can leave alone files that were edited by hand after generation. While a
+file's size and mtime are unchanged its recorded hash is trusted instead of rehashing.
+"""
+
+import hashlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+from pydantic import BaseModel, Field, ValidationError
+
+from llm_ide_rules.fs import FileStat, get_filesystem
+
+MANIFEST_FILENAME = ".llm-ide-rules-manifest.json"
+
+
+class ManifestEntry(BaseModel):
+    """Fingerprint of a single generated file."""
+
+    sha256: str
+    size: int
+    # Modification time right after the file was written, if known
+    mtime_ns: int | None = None
+
+
+class Manifest(BaseModel):
+    """Generated files keyed by posix path relative to the project root."""
+
+    version: int = 1
+    files: dict[str, ManifestEntry] = Field(default_factory=dict)
+
+    def record(
+        self, relative_path: str, data: bytes, mtime_ns: int | None = None
+    ) -> None:
+        """Record the content that was written to a generated file."""
+        self.files[relative_path] = ManifestEntry(
+            sha256=hashlib.sha256(data).hexdigest(), size=len(data), mtime_ns=mtime_ns
+        )
+
+    def cached_digest(self, relative_path: str, stat: FileStat) -> str | None:
+        """Get the recorded hash of a file, if its size and mtime show it is unchanged."""
+        entry = self.files.get(relative_path)
+        if entry is None or entry.mtime_ns is None:
+            return None
+
+        if stat.size != entry.size or stat.mtime_ns != entry.mtime_ns:
+            return None
+
+        return entry.sha256
+
+    def is_unmodified(self, base_dir: Path, relative_path: str) -> bool:
+        """Check whether a generated file still matches the content that was written."""
+        entry = self.files.get(relative_path)
+        if entry is None:
+            return False
+
+        file_path = base_dir / relative_path
+        try:
+            stat = get_filesystem().stat(file_path)
+            if stat.size != entry.size:
+                return False
+
+            digest = self.cached_digest(relative_path, stat) or hash_file(file_path)
+        except OSError:
+            return False
+
+        return digest == entry.sha256
+
+
+def hash_file(path: Path) -> str:
+    """Get the sha256 of a file, streaming it instead of reading it into memory."""
+    with get_filesystem().open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+# (base_dir, manifest) for the explode/download operation currently writing files
+_active_manifest: ContextVar[tuple[Path, Manifest] | None] = ContextVar(
+    "active_manifest", default=None
+)
+
+
+def get_manifest_path(base_dir: Path) -> Path:
+    """Get the manifest path for a project directory."""
+    return base_dir / MANIFEST_FILENAME
+
+
+def load_manifest(base_dir: Path) -> Manifest:
+    """Load the manifest for a project, returning an empty manifest if missing or invalid."""
+    fs = get_filesystem()
+    manifest_path = get_manifest_path(base_dir)
+    if not fs.exists(manifest_path):
+        return Manifest()
+
+    try:
+        return Manifest.model_validate_json(fs.read_text(manifest_path))
+    except (OSError, ValueError, ValidationError):
+        return Manifest()
+
+
+def save_manifest(base_dir: Path, manifest: Manifest) -> None:
+    """Write the manifest, removing the file once nothing is tracked anymore."""
+    fs = get_filesystem()
+    manifest_path = get_manifest_path(base_dir)
+    if not manifest.files:
+        fs.unlink(manifest_path, missing_ok=True)
+        return
+
+    manifest.files = dict(sorted(manifest.files.items()))
+    fs.write_text(manifest_path, manifest.model_dump_json(indent=2) + "\n")
+
+
+@contextmanager
+def recording_manifest(base_dir: Path) -> Iterator[Manifest]:
+    """Record generated files written inside this block into the project manifest.
+
+    Nested blocks (e.g. explode running inside download) share the outermost manifest,
+    which is saved once when the outermost block exits.
+    """
+    active = _active_manifest.get()
+    if active is not None:
+        yield active[1]
+        return
+
+    manifest = load_manifest(base_dir)
+    original_files = dict(manifest.files)
+    token = _active_manifest.set((base_dir, manifest))
+    try:
+        yield manifest
+    finally:
+        _active_manifest.reset(token)
+        if manifest.files != original_files:
+            save_manifest(base_dir, manifest)
+
+
+def _relative_to_active(path: Path) -> tuple[Manifest, str] | None:
+    """Resolve a path against the active manifest, if one is recording."""
+    active = _active_manifest.get()
+    if active is None:
+        return None
+
+    base_dir, manifest = active
+    try:
+        return manifest, path.relative_to(base_dir).as_posix()
+    except ValueError:
+        return None
+
+
+def record_generated_file(path: Path, data: bytes) -> None:
+    """Record generated content for a file in the active manifest (no-op when inactive)."""
+    resolved = _relative_to_active(path)
+    if resolved is None:
+        return
+
+    manifest, relative_path = resolved
+    try:
+        mtime_ns = get_filesystem().stat(path).mtime_ns
+    except OSError:
+        mtime_ns = None
+
+    manifest.record(relative_path, data, mtime_ns)
+
+
+def record_existing_file(path: Path) -> None:
+    """Record a file already on disk (e.g. copied from an archive) in the active manifest."""
+    resolved = _relative_to_active(path)
+    if resolved is None:
+        return
+
+    manifest, relative_path = resolved
+    stat = get_filesystem().stat(path)
+    manifest.files[relative_path] = ManifestEntry(
+        sha256=hash_file(path), size=stat.size, mtime_ns=stat.mtime_ns
+    )
@@ -1,15 +1,74 @@
 """Markdown parsing utilities using markdown-it-py."""
 
-from typing import NamedTuple
+from functools import lru_cache
+from itertools import accumulate
 
 from markdown_it import MarkdownIt
 
 
-class SectionData(NamedTuple):
-    """Data for a parsed section."""
+class SectionData:
+    """Data for a parsed section.
 
-    content: list[str]
-    glob_pattern: str | None
+    Sections store line offsets into the source text shared by every section of a
+    document, so parsing does not copy lines. Content is materialized on access.
+    """
+
+    __slots__ = (
+        "_line_starts",
+        "_source",
+        "end_line",
+        "glob_pattern",
+        "skip_line",
+        "start_line",
+    )
+
+    def __init__(
+        self,
+        source: str,
+        line_starts: list[int],
+        start_line: int,
+        end_line: int,
+        glob_pattern: str | None = None,
+        skip_line: int | None = None,
+    ):
+        self._source = source
+        # Offset of every line start, plus len(source) as a sentinel
+        self._line_starts = line_starts
+        self.start_line = start_line
+        self.end_line = end_line
+        self.glob_pattern = glob_pattern
+        # Line holding the glob directive, excluded from the content
+        self.skip_line = skip_line
+
+    def __repr__(self) -> str:
+        return (
+            f"SectionData(lines={self.start_line}:{self.end_line}, "
+            f"glob_pattern={self.glob_pattern!r})"
+        )
+
+    def _span(self, start_line: int, end_line: int) -> str:
+        return self._source[self._line_starts[start_line] : self._line_starts[end_line]]
+
+    @property
+    def text(self) -> str:
+        """Section text without the glob directive."""
+        if self.skip_line is None:
+            return self._span(self.start_line, self.end_line)
+
+        return self._span(self.start_line, self.skip_line) + self._span(
+            self.skip_line + 1, self.end_line
+        )
+
+    @property
+    def content(self) -> list[str]:
+        """Section lines (header included) without the glob directive."""
+        return self.text.splitlines(keepends=True)
+
+    @property
+    def has_content(self) -> bool:
+        """Whether the section contains anything besides whitespace."""
+        text = self.text
+        return bool(text) and not text.isspace()
 
 
 def extract_glob_directive(
@@ -57,14 +116,23 @@ def extract_glob_directive(
 def parse_sections(text: str) -> tuple[list[str], dict[str, SectionData]]:
     """Parse markdown text into general section and named sections.
 
+    Results are cached by text, so a resident daemon re-running explode on an unchanged
+    file skips parsing. Callers get their own list and dict.
+
     Returns:
         Tuple of (general_lines, sections_dict) where:
         - general_lines: Lines before the first H2 header
         - sections_dict: Dict mapping section names to SectionData (content + glob_pattern)
     """
+    general_lines, sections = _parse_sections_cached(text)
+    return list(general_lines), dict(sections)
+
+
+@lru_cache(maxsize=16)
+def _parse_sections_cached(text: str) -> tuple[list[str], dict[str, SectionData]]:
+    """Parse markdown text, see parse_sections."""
     md = MarkdownIt()
     tokens = md.parse(text)
-    lines = text.splitlines(keepends=True)
 
     # Find all H2 headers
     section_starts = []
@@ -80,11 +148,19 @@ def parse_sections(text: str) -> tuple[list[str], dict[str, SectionData]]:
                     section_starts.append((start_line, header_content))
 
     if not section_starts:
-        return lines, {}
+        return text.splitlines(keepends=True), {}
+
+    # Line start offsets into the shared source, sections only keep line numbers
+    line_starts = [0]
+    line_starts.extend(accumulate(len(line) for line in text.splitlines(keepends=True)))
+    line_count = len(line_starts) - 1
+
+    def line_at(index: int) -> str:
+        return text[line_starts[index] : line_starts[index + 1]]
 
     # Extract general content (everything before first H2)
     first_section_start = section_starts[0][0]
-    general_lines = lines[:first_section_start]
+    general_lines = [line_at(i) for i in range(first_section_start)]
 
     # Extract named sections
     sections = {}
@@ -93,16 +169,29 @@ def parse_sections(text: str) -> tuple[list[str], dict[str, SectionData]]:
         if i + 1 < len(section_starts):
             end_line = section_starts[i + 1][0]
         else:
-            end_line = len(lines)
+            end_line = line_count
+
+        # Extract glob directive if present (same rules as extract_glob_directive)
+        glob_pattern = None
+        skip_line = None
+        header_idx = next(
+            (j for j in range(start_line, end_line) if line_at(j).startswith("## ")),
+            None,
+        )
+        if header_idx is not None:
+            for j in range(header_idx + 1, end_line):
+                line = line_at(j).strip()
+                if not line:
+                    continue
 
-        # Extract all lines for this section
-        section_content = lines[start_line:end_line]
+                if line.lower().startswith("globs:"):
+                    glob_pattern = line[6:].strip()
+                    skip_line = j
 
-        # Extract glob directive if present
-        filtered_content, glob_pattern = extract_glob_directive(section_content)
+                break
 
         sections[header_name] = SectionData(
-            content=filtered_content, glob_pattern=glob_pattern
+            text, line_starts, start_line, end_line, glob_pattern, skip_line
         )
 
     return general_lines, sections
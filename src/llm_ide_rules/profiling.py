@@ -0,0 +1,72 @@
+"""Profile a CLI run with cProfile and, optionally, tracemalloc.
+
+The global --profile FILE option dumps cProfile statistics of the command to FILE
+(load them with `python -m pstats FILE`, snakeviz or similar) and prints the hottest
+functions. --profile-memory also traces allocations and prints the peak and the top
+allocation sites, so performance reports can include data without patching the tool.
+"""
+
+import cProfile
+import io
+import pstats
+import tracemalloc
+from pathlib import Path
+
+import typer
+
+# Rows printed for the hottest functions and the largest allocation sites
+PROFILE_TOP_FUNCTIONS = 20
+PROFILE_TOP_ALLOCATIONS = 10
+
+
+class Profiler:
+    """Profile the calling thread between start() and stop()."""
+
+    def __init__(self, output: Path, memory: bool = False):
+        self.output = output
+        self.memory = memory
+        self._profile = cProfile.Profile()
+
+    def start(self) -> None:
+        """Start profiling, tracing allocations as well in memory mode."""
+        if self.memory:
+            tracemalloc.start()
+        self._profile.enable()
+
+    def stop(self) -> None:
+        """Stop profiling, write the stats file and print the report to stderr."""
+        self._profile.disable()
+
+        snapshot = None
+        peak = 0
+        if self.memory:
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        self._profile.dump_stats(self.output)
+
+        report = io.StringIO()
+        stats = pstats.Stats(self._profile, stream=report)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(PROFILE_TOP_FUNCTIONS)
+        typer.echo(report.getvalue().rstrip(), err=True)
+        typer.echo(f"\nWrote profile to {self.output}", err=True)
+
+        if snapshot is not None:
+            echo_allocations(snapshot, peak)
+
+
+def echo_allocations(snapshot: tracemalloc.Snapshot, peak: int) -> None:
+    """Print the traced memory peak and the largest allocation sites to stderr."""
+    typer.echo(f"\nPeak traced memory: {peak / 1024:.1f} KiB", err=True)
+    typer.echo("Top allocation sites:", err=True)
+
+    # Allocations made by tracemalloc itself are noise
+    snapshot = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+    for stat in snapshot.statistics("lineno")[:PROFILE_TOP_ALLOCATIONS]:
+        frame = stat.traceback[0]
+        typer.echo(
+            f"  {frame.filename}:{frame.lineno}: {stat.size / 1024:.1f} KiB"
+            f" in {stat.count} blocks",
+            err=True,
+        )
@@ -0,0 +1,220 @@
+"""Timing spans around the phases of a CLI run.
+
+Wrap a phase in span() to log its duration, together with counts such as files and
+bytes, through the structured logger at debug level. While recording is enabled (the
+global --timings and --trace options), finished spans are also collected process-wide,
+from every thread, and summarized in a table or exported as a trace once the command
+finishes.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import typer
+
+from llm_ide_rules.log import log
+
+
+class SpanRecord(NamedTuple):
+    """A finished span."""
+
+    name: str
+    # time.perf_counter() at the start of the span, in seconds. The clock is
+    # system-wide, so spans recorded by worker processes line up with the parent's
+    start: float
+    duration: float
+    pid: int
+    thread_id: int
+    attributes: dict[str, Any]
+
+
+class Span:
+    """A running span; counts and attributes can be added until it finishes."""
+
+    __slots__ = ("attributes", "name")
+
+    def __init__(self, name: str, attributes: dict[str, Any]):
+        self.name = name
+        self.attributes = attributes
+
+    def set(self, **attributes: Any) -> None:
+        """Set attributes, replacing earlier values."""
+        self.attributes.update(attributes)
+
+    def add(self, **counts: int) -> None:
+        """Add to counters such as files or bytes."""
+        for key, value in counts.items():
+            self.attributes[key] = self.attributes.get(key, 0) + value
+
+
+class SpanSummary(NamedTuple):
+    """Aggregated timings of every span sharing a name."""
+
+    name: str
+    count: int
+    total: float
+    max: float
+    files: int
+    bytes: int
+
+
+# Finished spans while recording, None when recording is off
+_records: list[SpanRecord] | None = None
+_records_lock = threading.Lock()
+
+
+def start_recording() -> None:
+    """Start collecting finished spans, discarding anything collected before."""
+    global _records
+    with _records_lock:
+        _records = []
+
+
+def stop_recording() -> list[SpanRecord]:
+    """Stop collecting spans and return the ones collected."""
+    global _records
+    with _records_lock:
+        records, _records = _records or [], None
+    return records
+
+
+def is_recording() -> bool:
+    """Check whether finished spans are being collected."""
+    return _records is not None
+
+
+def add_records(records: list[SpanRecord]) -> None:
+    """Merge spans recorded elsewhere, e.g. by a worker process, while recording."""
+    with _records_lock:
+        if _records is not None:
+            _records.extend(records)
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span]:
+    """Time a phase of the run, e.g. `with span("explode.parse") as s: s.set(sections=3)`."""
+    current = Span(name, attributes)
+    start = time.perf_counter()
+    try:
+        yield current
+    finally:
+        duration = time.perf_counter() - start
+        if log.is_enabled_for(logging.DEBUG):
+            log.debug(
+                "span finished",
+                span=name,
+                duration_ms=round(duration * 1000, 3),
+                **current.attributes,
+            )
+
+        if _records is not None:
+            record = SpanRecord(
+                name,
+                start,
+                duration,
+                os.getpid(),
+                threading.get_native_id(),
+                current.attributes,
+            )
+            with _records_lock:
+                if _records is not None:
+                    _records.append(record)
+
+
+def summarize_spans(records: list[SpanRecord]) -> list[SpanSummary]:
+    """Aggregate spans by name, slowest total first."""
+    grouped: dict[str, list[SpanRecord]] = {}
+    for record in records:
+        grouped.setdefault(record.name, []).append(record)
+
+    summaries = [
+        SpanSummary(
+            name,
+            len(group),
+            sum(record.duration for record in group),
+            max(record.duration for record in group),
+            sum(int(record.attributes.get("files", 0)) for record in group),
+            sum(int(record.attributes.get("bytes", 0)) for record in group),
+        )
+        for name, group in grouped.items()
+    ]
+    return sorted(summaries, key=lambda summary: summary.total, reverse=True)
+
+
+def echo_timings(records: list[SpanRecord]) -> None:
+    """Print a table of span timings to stderr.
+
+    Totals are inclusive, so a phase's time also appears in the phases containing it.
+    """
+    summaries = summarize_spans(records)
+    if not summaries:
+        typer.echo("No timings were recorded.", err=True)
+        return
+
+    name_width = max(len("Phase"), *(len(summary.name) for summary in summaries))
+    header = (
+        f"{'Phase':<{name_width}}  {'Count':>6}  {'Total ms':>10}  {'Max ms':>10}"
+        f"  {'Files':>6}  {'Bytes':>10}"
+    )
+    typer.echo(f"\n{header}", err=True)
+    typer.echo("-" * len(header), err=True)
+
+    for summary in summaries:
+        typer.echo(
+            f"{summary.name:<{name_width}}  {summary.count:>6}"
+            f"  {summary.total * 1000:>10.2f}  {summary.max * 1000:>10.2f}"
+            f"  {summary.files or '':>6}  {summary.bytes or '':>10}",
+            err=True,
+        )
+
+
+def write_trace(records: list[SpanRecord], path: Path) -> None:
+    """Write spans as a Chrome Trace Event Format file.
+
+    The file loads in chrome://tracing, Perfetto and speedscope, with one track per
+    process and thread so parallel work and I/O stalls are visible.
+    """
+    origin = min((record.start for record in records), default=0.0)
+    events: list[dict[str, Any]] = [
+        {
+            "name": "process_name",
+            "ph": "M",
+            "pid": pid,
+            "args": {"name": f"llm-ide-rules ({pid})"},
+        }
+        for pid in sorted({record.pid for record in records})
+    ]
+
+    for record in sorted(records, key=lambda record: record.start):
+        events.append(
+            {
+                "name": record.name,
+                "cat": record.name.split(".", 1)[0],
+                "ph": "X",
+                "ts": round((record.start - origin) * 1_000_000, 3),
+                "dur": round(record.duration * 1_000_000, 3),
+                "pid": record.pid,
+                "tid": record.thread_id,
+                "args": record.attributes,
+            }
+        )
+
+    trace = {"traceEvents": events, "displayTimeUnit": "ms"}
+    path.write_text(json.dumps(trace, default=str))
+
+
+def report_recording(timings: bool, trace_path: Path | None) -> None:
+    """Stop recording, then print the timings table and/or write the trace file."""
+    records = stop_recording()
+    if timings:
+        echo_timings(records)
+    if trace_path:
+        write_trace(records, trace_path)
+        typer.echo(f"Wrote {len(records)} spans to {trace_path}", err=True)
@@ -1,112 +1,189 @@
 """Utility functions for LLM IDE rules."""
 
-import re
+import json
+import mmap
+import shutil
+import threading
+import weakref
 from pathlib import Path
 from typing import Any
 
+from llm_ide_rules.fs import FileSystem, get_filesystem
+from llm_ide_rules.jsonc import (
+    JsoncError,
+    JsoncKey,
+    apply_updates,
+    loads,
+    nest_updates,
+)
 
-def modify_json_file(file_path: Path, updates: dict[str, Any]) -> bool:
-    """Modify a JSON/JSONC file by adding MISSING keys using string manipulation to preserve comments.
+# Parsed settings files per filesystem, keyed by path, with the (mtime_ns, size) they
+# were parsed at
+_settings_caches: weakref.WeakKeyDictionary[
+    FileSystem, dict[Path, tuple[tuple[int, int], Any]]
+] = weakref.WeakKeyDictionary()
+_settings_cache_lock = threading.Lock()
+
+
+def load_settings_file(file_path: Path) -> Any | None:
+    """Load a JSON/JSONC settings file, reusing the parsed result while it is unchanged.
+
+    Entries are keyed by path and validated against mtime and size, so repeated checks
+    (e.g. the Gemini config check on every explode) parse each file once. The returned
+    data is shared and must not be mutated.
+
+    Returns:
+        The parsed data, or None if the file is missing or cannot be parsed.
+    """
+    fs = get_filesystem()
+    try:
+        stat = fs.stat(file_path)
+    except OSError:
+        return None
+
+    signature = (stat.mtime_ns, stat.size)
+    with _settings_cache_lock:
+        settings_cache = _settings_caches.setdefault(fs, {})
+        cached = settings_cache.get(file_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    try:
+        data = loads(fs.read_text(file_path))
+    except (OSError, UnicodeDecodeError, JsoncError):
+        data = None
+
+    with _settings_cache_lock:
+        settings_cache[file_path] = (signature, data)
+
+    return data
+
+
+def modify_json_file(file_path: Path, updates: dict[JsoncKey, Any]) -> bool:
+    """Set keys in a JSON/JSONC file, preserving comments and formatting.
+
+    Keys are literal top-level keys (dots included, as VS Code uses them) or tuple
+    paths into nested objects such as ("context", "fileName"). All updates are applied
+    in a single pass over the tokenized file.
 
     Returns:
         bool: True if changes were written to the file, False otherwise.
+
+    Raises:
+        JsoncError: if the existing file cannot be parsed
     """
-    if not file_path.exists():
+    fs = get_filesystem()
+    if not fs.exists(file_path):
         # Create new file with standard JSON if it doesn't exist
-        import json
-
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_text(json.dumps(updates, indent=2))
+        fs.write_text(file_path, json.dumps(nest_updates(updates), indent=2))
         return True
 
-    original_content = file_path.read_text()
-    content = original_content
-
-    for key, value in updates.items():
-        # Prepare the value representation (basic JSON serialization)
-        if isinstance(value, bool):
-            val_str = "true" if value else "false"
-        elif isinstance(value, (int, float)):
-            val_str = str(value)
-        elif isinstance(value, str):
-            val_str = f'"{value}"'
-        else:
-            import json
-
-            val_str = json.dumps(value)
-
-        # Updated pattern:
-        # 1. Match key part: (["']?key["']?\s* : \s*)
-        # 2. Match value part: ([^,\n\r}]+?)
-        # 3. Lookahead to stop before a comma, newline, closing brace, or start of a comment
-        escaped_key = re.escape(key)
-        pattern_str = (
-            rf'(["\\]?{escaped_key}["\\]?\s*:\s*)([^,\n\r}}]+?)'
-            r"(?=\s*(?:,|\n|\r|\}|\/\/|\/\*))"
-        )
-        pattern = re.compile(pattern_str, re.MULTILINE)
-
-        match = pattern.search(content)
-        if match:
-            # Key exists, replace the value part
-            # full_match = match.group(0)
-            key_part = match.group(1)
-            # Replace the value part (group 2) with new value
-            new_entry = f"{key_part}{val_str}"
-            content = content[: match.start()] + new_entry + content[match.end() :]
-        else:
-            # Insert new key
-            last_brace_idx = content.rfind("}")
-            if last_brace_idx != -1:
-                insertion_point = last_brace_idx
-
-                # Look backwards for the first non-whitespace character before the brace
-                prev_char_idx = insertion_point - 1
-                while prev_char_idx >= 0 and content[prev_char_idx].isspace():
-                    prev_char_idx -= 1
-
-                # Detect indentation from the previous line if possible
-                line_start = content.rfind("\n", 0, insertion_point)
-                if line_start != -1:
-                    indent_match = re.match(r"^(\s*)", content[line_start + 1 :])
-                    indent = indent_match.group(1) if indent_match else "  "
-                else:
-                    indent = "  "
-
-                if prev_char_idx >= 0:
-                    prev_char = content[prev_char_idx]
-                    # If the last thing wasn't a comma or opening brace, we need a comma
-                    if prev_char not in ["{", ","]:
-                        new_entry = f',\n{indent}"{key}": {val_str}'
-                    else:
-                        new_entry = f'\n{indent}"{key}": {val_str}'
-
-                    content = (
-                        content[:insertion_point]
-                        + new_entry
-                        + content[insertion_point:]
-                    )
+    original_content = fs.read_text(file_path)
+    content = apply_updates(original_content, updates)
 
     if content != original_content:
-        file_path.write_text(content)
+        fs.write_text(file_path, content)
         return True
 
     return False
 
 
-def resolve_target_dir(base_dir: Path, glob_pattern: str | None) -> Path:
-    """Resolve the target directory for a glob pattern by finding the deepest existing directory."""
-    if not glob_pattern or "**" not in glob_pattern:
-        return base_dir
+# Read size for the chunked marker search fallback and for streaming file contents
+MARKER_SEARCH_CHUNK_SIZE = 1024 * 1024
+
 
-    prefix = glob_pattern.split("**")[0].strip("/")
-    potential_dir = base_dir / prefix
+def find_marker_offset(file_path: Path, marker: str) -> int | None:
+    """Find the byte offset where marker starts in a file without reading it into memory.
 
-    check_dir = potential_dir
-    while not check_dir.exists() and check_dir != base_dir:
-        check_dir = check_dir.parent
+    The file is memory-mapped when possible, falling back to a chunked search for
+    empty files and files that are not on disk.
 
-    return check_dir
+    Returns:
+        The offset of the first occurrence, or None if the marker is absent.
+    """
+    needle = marker.encode("utf-8")
+    with get_filesystem().open(file_path, "rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                offset = mapped.find(needle)
+                return offset if offset != -1 else None
+        except (OSError, ValueError):
+            pass
+
+        # Keep an overlap so a marker spanning two chunks is still found
+        f.seek(0)
+        overlap = b""
+        position = 0
+        while chunk := f.read(MARKER_SEARCH_CHUNK_SIZE):
+            window = overlap + chunk
+            offset = window.find(needle)
+            if offset != -1:
+                return position - len(overlap) + offset
+
+            position += len(chunk)
+            overlap = window[-(len(needle) - 1) :] if len(needle) > 1 else b""
+
+    return None
+
+
+def read_text_before_marker(file_path: Path, *markers: str) -> tuple[str, str | None]:
+    """Read a file up to the first of the given markers that it contains.
+
+    Markers are tried in order and only the prefix before the marker is read.
+
+    Returns:
+        Tuple of (text before the marker, marker that was found or None)
+    """
+    fs = get_filesystem()
+    for marker in markers:
+        offset = find_marker_offset(file_path, marker)
+        if offset is not None:
+            with fs.open(file_path, "rb") as f:
+                return f.read(offset).decode("utf-8"), marker
+
+    return fs.read_text(file_path), None
+
+
+def write_preserving_tail(output_file: Path, head: str | Path, marker: str) -> None:
+    """Write new content to a file, keeping whatever followed marker in the existing file.
+
+    head is either the new content or a file whose contents are streamed in. A marker
+    is appended after a head file that lacks one. The preserved tail is streamed from
+    the existing file into a temporary file that then replaces it, so neither the head
+    nor the tail has to be held in memory alongside the other. A symlinked output is
+    written through, replacing the file it points to.
+    """
+    fs = get_filesystem()
+    output_file = fs.resolve(output_file)
+    tail_offset = None
+    if fs.exists(output_file):
+        try:
+            tail_offset = find_marker_offset(output_file, marker)
+        except OSError:
+            # Fallback if file cannot be read
+            tail_offset = None
+
+    fs.mkdir(output_file.parent)
+    temp_file = fs.make_temp_file(output_file.parent, output_file.name)
+    try:
+        with fs.open(temp_file, "wb") as out:
+            if isinstance(head, Path):
+                with fs.open(head, "rb") as src:
+                    shutil.copyfileobj(src, out, MARKER_SEARCH_CHUNK_SIZE)
+                if find_marker_offset(head, marker) is None:
+                    out.write(f"\n\n{marker}\n".encode())
+            else:
+                out.write(head.encode("utf-8"))
+
+            if tail_offset is not None:
+                with fs.open(output_file, "rb") as existing:
+                    existing.seek(tail_offset + len(marker.encode("utf-8")))
+                    shutil.copyfileobj(existing, out, MARKER_SEARCH_CHUNK_SIZE)
+
+        fs.replace(temp_file, output_file)
+    except BaseException:
+        fs.unlink(temp_file, missing_ok=True)
+        raise
 
 
 def find_project_root(start_path: Path | None = None) -> Path:
@@ -114,20 +191,21 @@ def find_project_root(start_path: Path | None = None) -> Path:
     if start_path is None:
         start_path = Path.cwd()
 
+    fs = get_filesystem()
     path = start_path.resolve()
     # Check current directory and parents
     for parent in [path] + list(path.parents):
-        if (parent / ".git").exists():
+        if fs.exists(parent / ".git"):
             return parent
-        if (parent / "pyproject.toml").exists():
+        if fs.exists(parent / "pyproject.toml"):
             return parent
-        if (parent / ".cursor").exists():
+        if fs.exists(parent / ".cursor"):
             return parent
-        if (parent / ".claude").exists():
+        if fs.exists(parent / ".claude"):
             return parent
-        if (parent / ".gemini").exists():
+        if fs.exists(parent / ".gemini"):
             return parent
-        if (parent / ".github").exists():
+        if fs.exists(parent / ".github"):
             return parent
 
     return start_path  # Fallback to current directory
@@ -1,16 +1,22 @@
 """Version handling for llm-ide-rules."""
 
-from pathlib import Path
+import os
 
 __version__ = "0.13.0"
 
 
 def is_local_source_checkout() -> bool:
-    """Check if the code is running from a local source checkout."""
-    package_dir = Path(__file__).resolve().parent
-    repo_root = package_dir.parent.parent
+    """Check if the code is running from a local source checkout.
 
-    return (repo_root / ".git").exists() and (repo_root / "pyproject.toml").exists()
+    Uses os.path rather than pathlib, since the console script imports this before
+    deciding whether to import anything else.
+    """
+    package_dir = os.path.dirname(os.path.realpath(__file__))
+    repo_root = os.path.dirname(os.path.dirname(package_dir))
+
+    return os.path.exists(os.path.join(repo_root, ".git")) and os.path.exists(
+        os.path.join(repo_root, "pyproject.toml")
+    )
 
 
 def get_cli_version() -> str:
@@ -0,0 +1,224 @@
+"""Explode every project of a multi-project workspace in one invocation.
+
+Projects are directories holding their own instructions file. They are exploded on a
+process pool, so a monorepo pays interpreter start-up and imports once per worker
+instead of once per project, and the outcome of every project is collected into a
+single report.
+"""
+
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import NamedTuple
+
+import typer
+
+from llm_ide_rules.compact import CompactOptions
+from llm_ide_rules.log import log
+from llm_ide_rules.timing import (
+    SpanRecord,
+    add_records,
+    is_recording,
+    span,
+    start_recording,
+    stop_recording,
+)
+
+# Directories never searched for projects, in addition to hidden ones (which include
+# every agent output directory)
+WORKSPACE_SKIPPED_DIRS = {
+    "node_modules",
+    "__pycache__",
+    "venv",
+    "site-packages",
+    "dist",
+    "build",
+    "target",
+}
+
+
+class ProjectResult(NamedTuple):
+    """Outcome of running explode in one workspace project."""
+
+    project_dir: Path
+    exit_code: int
+    duration: float
+    stdout: str
+    stderr: str
+    # Spans recorded by a worker process, merged into the parent's recording
+    spans: tuple[SpanRecord, ...] = ()
+
+
+def find_workspace_projects(
+    root: Path, input_file: str = "instructions.md"
+) -> list[Path]:
+    """Find every directory below root that has its own input file.
+
+    Hidden, dependency and build directories are pruned before they are descended
+    into, so the walk never enters node_modules, virtualenvs or agent output.
+    """
+    nested_input = len(Path(input_file).parts) > 1
+    projects = []
+
+    for dir_path, dir_names, file_names in os.walk(root):
+        dir_names[:] = sorted(
+            name
+            for name in dir_names
+            if not name.startswith(".") and name not in WORKSPACE_SKIPPED_DIRS
+        )
+
+        if nested_input:
+            found = Path(dir_path, input_file).is_file()
+        else:
+            found = input_file in file_names
+
+        if found:
+            projects.append(Path(dir_path))
+
+    return projects
+
+
+def explode_project(
+    project_dir: Path,
+    input_file: str,
+    agent: str,
+    check: bool = False,
+    compact: CompactOptions | None = None,
+) -> ProjectResult:
+    """Run explode (or explode --check) in a project, capturing its output."""
+    import click
+
+    from llm_ide_rules.commands.explode import run_explode
+
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    exit_code = 0
+    original_cwd = os.getcwd()
+    start = time.perf_counter()
+
+    try:
+        os.chdir(project_dir)
+        with (
+            redirect_stdout(stdout),
+            redirect_stderr(stderr),
+            span("workspace.project", project=str(project_dir)),
+        ):
+            run_explode(input_file, agent, check, compact)
+    except click.exceptions.Exit as e:
+        exit_code = e.exit_code
+    except Exception as e:
+        stderr.write(f"{type(e).__name__}: {e}\n")
+        exit_code = 1
+    finally:
+        os.chdir(original_cwd)
+
+    duration = time.perf_counter() - start
+    return ProjectResult(
+        project_dir, exit_code, duration, stdout.getvalue(), stderr.getvalue()
+    )
+
+
+def _explode_project_in_worker(
+    project_dir: Path,
+    input_file: str,
+    agent: str,
+    check: bool,
+    compact: CompactOptions | None,
+    record: bool,
+) -> ProjectResult:
+    """Explode a project in a pool worker, returning its spans when recording."""
+    if not record:
+        return explode_project(project_dir, input_file, agent, check, compact)
+
+    # Forked workers inherit the parent's spans, start over so none are duplicated
+    start_recording()
+    result = explode_project(project_dir, input_file, agent, check, compact)
+    return result._replace(spans=tuple(stop_recording()))
+
+
+def explode_workspace(
+    projects: list[Path],
+    input_file: str,
+    agent: str,
+    check: bool = False,
+    jobs: int | None = None,
+    compact: CompactOptions | None = None,
+) -> list[ProjectResult]:
+    """Explode each project on a process pool, returning results in project order."""
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    jobs = max(1, min(jobs, len(projects)))
+
+    log.info("exploding workspace", projects=len(projects), jobs=jobs, check=check)
+
+    if jobs == 1:
+        return [
+            explode_project(project_dir, input_file, agent, check, compact)
+            for project_dir in projects
+        ]
+
+    count = len(projects)
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        results = list(
+            pool.map(
+                _explode_project_in_worker,
+                projects,
+                [input_file] * count,
+                [agent] * count,
+                [check] * count,
+                [compact] * count,
+                [is_recording()] * count,
+            )
+        )
+
+    for result in results:
+        add_records(list(result.spans))
+
+    return results
+
+
+def _last_line(text: str) -> str:
+    """Get the last non-empty line of captured output, which holds the summary."""
+    lines = [line for line in text.splitlines() if line.strip()]
+    return lines[-1].strip() if lines else ""
+
+
+def echo_workspace_report(
+    results: list[ProjectResult], root: Path, elapsed: float, check: bool = False
+) -> int:
+    """Print one line per project and a summary.
+
+    Returns:
+        The number of projects that failed (or are stale, in check mode)
+    """
+    failed = [result for result in results if result.exit_code != 0]
+
+    for result in results:
+        relative_dir = result.project_dir.relative_to(root).as_posix()
+        timing = f"({result.duration:.2f}s)"
+
+        if result.exit_code == 0:
+            typer.echo(f"  {relative_dir}: {_last_line(result.stdout)} {timing}")
+            continue
+
+        status = "stale" if check else "failed"
+        typer.echo(
+            typer.style(f"  {relative_dir}: {status} {timing}", fg=typer.colors.RED),
+            err=True,
+        )
+        for line in result.stderr.splitlines():
+            typer.echo(f"      {line}", err=True)
+
+    verb = "Checked" if check else "Exploded"
+    summary = f"{verb} {len(results)} projects in {elapsed:.2f}s"
+    if not failed:
+        typer.echo(typer.style(summary, fg=typer.colors.GREEN))
+    else:
+        status = "are out of date" if check else "failed"
+        summary += f"; {len(failed)} {status}"
+        typer.echo(typer.style(summary, fg=typer.colors.RED), err=True)
+
+    return len(failed)
@@ -0,0 +1,90 @@
+"""Test the lazy agent registry and entry-point plugins."""
+
+import importlib
+import subprocess
+import sys
+from importlib.metadata import EntryPoint
+
+import pytest
+from typer.testing import CliRunner
+
+from llm_ide_rules import app
+from llm_ide_rules.agents import (
+    ENTRY_POINT_GROUP,
+    get_agent,
+    get_agent_class,
+    get_all_agents,
+    get_plugin_agents,
+)
+from llm_ide_rules.agents.cursor import CursorAgent
+
+# The package re-exports the implode `agents` command under the same name
+agent_registry = importlib.import_module("llm_ide_rules.agents")
+
+
+class PluginAgent(CursorAgent):
+    """Agent registered through an entry point."""
+
+    name = "myide"
+    rules_dir = ".myide/rules"
+    commands_dir = None
+
+
+@pytest.fixture
+def plugin_entry_points(monkeypatch):
+    """Register PluginAgent, plus one trying to shadow a built-in agent."""
+    registered = [
+        EntryPoint("myide", f"{__name__}:PluginAgent", ENTRY_POINT_GROUP),
+        EntryPoint("cursor", f"{__name__}:PluginAgent", ENTRY_POINT_GROUP),
+    ]
+    monkeypatch.setattr(
+        "importlib.metadata.entry_points",
+        lambda group: registered if group == ENTRY_POINT_GROUP else [],
+    )
+    get_plugin_agents.cache_clear()
+    monkeypatch.setattr(agent_registry, "_agent_classes", {})
+    yield
+    get_plugin_agents.cache_clear()
+
+
+def test_only_requested_agents_are_imported():
+    """Test importing the CLI and using one agent imports just that adapter."""
+    code = (
+        "import sys, llm_ide_rules; from llm_ide_rules.agents import get_agent; "
+        "get_agent('grok'); "
+        "print(sorted(m for m in sys.modules if m.startswith('llm_ide_rules.agents.')))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+    assert output.strip() == (
+        "['llm_ide_rules.agents.antigravity', 'llm_ide_rules.agents.base']"
+    )
+
+
+def test_registry_resolves_aliases_and_legacy_names():
+    """Test aliases share a class and AGENTS still maps every built-in agent."""
+    assert get_agent_class("grok") is get_agent_class("antigravity")
+    assert agent_registry.AGENTS["cursor"] is CursorAgent
+    assert agent_registry.CursorAgent is CursorAgent
+    assert len(get_all_agents()) == 8
+
+    with pytest.raises(ValueError, match="Unknown agent: missing"):
+        get_agent("missing")
+
+
+def test_plugin_agents_are_registered(plugin_entry_points, tmp_path, monkeypatch):
+    """Test entry-point agents can be used by name but cannot replace built-ins."""
+    assert get_plugin_agents() == {"myide": f"{__name__}:PluginAgent"}
+    assert isinstance(get_agent("myide"), PluginAgent)
+    assert type(get_agent("cursor")) is CursorAgent
+    assert "myide" in [agent.name for agent in get_all_agents()]
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("LLM_IDE_RULES_NO_DAEMON", "1")
+    (tmp_path / "instructions.md").write_text("# Rules\n\n## Python\n\nUse types.\n")
+
+    result = CliRunner().invoke(app, ["explode", "--agent", "myide"])
+    assert result.exit_code == 0, result.output
+    assert (tmp_path / ".myide/rules/python.mdc").exists()
@@ -142,3 +142,53 @@ Rule 2.
         content = lib_agents.read_text()
         assert "## Rule1" in content
         assert "## Rule2" in content
+
+
+def test_agents_splitting_fans_out_wildcard_directories(tmp_path, monkeypatch):
+    """Test wildcards in a glob's directory place the section in every match."""
+    monkeypatch.chdir(tmp_path)
+    for directory in ["packages/api/src", "packages/web/src", "packages/docs", "libs"]:
+        Path(directory).mkdir(parents=True)
+
+    Path("instructions.md").write_text(
+        """# General Instructions
+General.
+
+## TypeScript
+globs: packages/*/src/**/*.ts
+Use strict mode.
+
+## Python
+globs: {apps,libs}/**/*.py
+Use type hints.
+
+## Services
+globs: services/*/**/*.go
+Handle errors.
+"""
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(app, ["ignores", "--print", "--agent", "agents"])
+    assert result.exit_code == 0
+    assert result.stdout.split() == [
+        ".llm-ide-rules-manifest.json",
+        "AGENTS.md",
+        "libs/AGENTS.md",
+        "packages/api/src/AGENTS.md",
+        "packages/web/src/AGENTS.md",
+    ]
+
+    result = runner.invoke(app, ["explode", "instructions.md", "--agent", "agents"])
+    assert result.exit_code == 0
+
+    for package in ["api", "web"]:
+        content = Path(f"packages/{package}/src/AGENTS.md").read_text()
+        assert "## TypeScript" in content
+        assert "General." not in content
+    assert not Path("packages/docs/AGENTS.md").exists()
+    assert "## Python" in Path("libs/AGENTS.md").read_text()
+
+    root_content = Path("AGENTS.md").read_text()
+    assert "## Services" in root_content
+    assert "## TypeScript" not in root_content
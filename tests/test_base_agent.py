@@ -6,6 +6,7 @@ from llm_ide_rules.agents.base import (
     extract_description_and_filter_content,
     get_ordered_files,
     get_ordered_files_github,
+    normalize_section,
     replace_header_with_proper_casing,
     resolve_header_from_stem,
     strip_header,
@@ -403,3 +404,53 @@ def test_extract_description_and_filter_content_trims_result():
 
     assert description == "Fix tests"
     assert filtered == ["Run pytest\n"]
+
+
+def test_normalize_section_fields():
+    """Test a section is trimmed and split into description, header and body once."""
+    content = [
+        "\n",
+        "## Fix Tests\n",
+        "\n",
+        "Description: Fix failing tests\n",
+        "\n",
+        "Run pytest.\n",
+        "\n",
+    ]
+
+    section = normalize_section(content, "**/*.py")
+
+    assert section.lines == content[1:6]
+    assert section.description == "Fix failing tests"
+    assert section.filtered == ["## Fix Tests\n", "\n", "\n", "Run pytest.\n"]
+    assert section.header == "Fix Tests"
+    assert section.body == ["Run pytest.\n"]
+    assert section.glob_pattern == "**/*.py"
+
+
+def test_agents_render_normalized_sections_like_line_lists(tmp_path):
+    """Test writers produce identical files from raw lines and normalized sections."""
+    from llm_ide_rules.agents import get_all_agents
+
+    content = ["## Fix Tests\n", "\n", "Description: Fix it\n", "\n", "Run it.\n"]
+
+    for agent in get_all_agents():
+        outputs = []
+        for variant, section in (
+            ("raw", list(content)),
+            ("normalized", normalize_section(content)),
+        ):
+            base = tmp_path / agent.name / variant
+            if agent.rules_dir:
+                agent.write_rule(section, "fix-tests", base / "rules", "*.py")
+            if agent.commands_dir:
+                agent.write_command(section, "fix-tests", base / "commands", "Fix")
+            outputs.append(
+                {
+                    p.relative_to(base): p.read_text()
+                    for p in base.rglob("*")
+                    if p.is_file()
+                }
+            )
+
+        assert outputs[0] == outputs[1]
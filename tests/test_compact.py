@@ -0,0 +1,202 @@
+"""Test compacting instruction sources."""
+
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from llm_ide_rules import app
+from llm_ide_rules.compact import (
+    CompactOptions,
+    compact_sources,
+    compact_text,
+    dedupe_sentences,
+)
+
+
+def test_compact_text_drops_decoration():
+    """Test blank lines, rules, comments and bold markers are dropped."""
+    text = (
+        "# Title #\n"
+        "\n"
+        "\n"
+        "**Always** run `**kept**` checks.   \n"
+        "<!-- note -->\n"
+        "\n"
+        "***\n"
+        "\n"
+        "* First\n"
+        "  + Nested\n"
+        "Setext\n"
+        "---\n"
+    )
+
+    assert compact_text(text) == (
+        "# Title\n\nAlways run `**kept**` checks.\n\n- First\n  - Nested\nSetext\n---\n"
+    )
+
+
+def test_compact_text_keeps_code_fences_and_globs():
+    """Test fenced code and glob directives are copied verbatim."""
+    text = (
+        "## Python\n"
+        "\n"
+        "globs: src/**/*.py, **/*.pyi\n"
+        "\n"
+        "```python\n"
+        "* **not a list**  \n"
+        "\n"
+        "\n"
+        "```\n"
+    )
+
+    assert compact_text(text) == (
+        "## Python\n"
+        "globs: src/**/*.py, **/*.pyi\n"
+        "\n"
+        "```python\n"
+        "* **not a list**  \n"
+        "\n"
+        "\n"
+        "```\n"
+    )
+
+
+def test_dedupe_sentences_against_always_loaded():
+    """Test sections drop sentences the always-loaded instructions already contain."""
+    input_text = (
+        "# Instructions\n"
+        "\n"
+        "- Always write tests for new code.\n"
+        "\n"
+        "## Python\n"
+        "\n"
+        "globs: **/*.py\n"
+        "\n"
+        "Always write tests for new code. Use type hints everywhere.\n"
+        "- Prefer small pure functions.\n"
+        "- Prefer small pure functions.\n"
+        "\n"
+        "## Style\n"
+        "\n"
+        "- Prefer small pure functions.\n"
+    )
+    commands_text = "## Fix\n\nAlways write tests for new code.\nRun it.\n"
+
+    deduped, commands = dedupe_sentences(input_text, commands_text)
+
+    # Style has no globs, so it is always loaded and keeps its sentence
+    assert deduped == (
+        "# Instructions\n"
+        "\n"
+        "- Always write tests for new code.\n"
+        "\n"
+        "## Python\n"
+        "\n"
+        "globs: **/*.py\n"
+        "\n"
+        "Use type hints everywhere.\n"
+        "\n"
+        "## Style\n"
+        "\n"
+        "- Prefer small pure functions.\n"
+    )
+    assert commands == "## Fix\n\nRun it.\n"
+
+
+def test_compact_sources_without_dedupe():
+    """Test repeated sentences are kept unless dedupe is enabled."""
+    input_text = (
+        "Use type hints everywhere.\n\n## Python\n\n"
+        "Use type hints everywhere.\nPrefer small pure functions.\n"
+    )
+
+    compacted, _ = compact_sources(input_text, "", CompactOptions())
+    assert compacted == input_text
+
+    deduped, _ = compact_sources(input_text, "", CompactOptions(dedupe=True))
+    assert deduped == (
+        "Use type hints everywhere.\n\n## Python\n\nPrefer small pure functions.\n"
+    )
+
+
+def test_dedupe_sentences_never_empties_a_section_or_command():
+    """Test sections and commands made only of loaded sentences are kept whole."""
+    input_text = (
+        "Always review the diff before committing.\n"
+        "\n"
+        "## Style\n"
+        "\n"
+        "globs: **/*.py\n"
+        "\n"
+        "Always review the diff before committing.\n"
+    )
+    commands_text = (
+        "## Review\n\nAlways review the diff before committing.\n"
+        "## Fix\n\nAlways review the diff before committing.  Then fix it now.\r\n"
+    )
+
+    deduped, commands = dedupe_sentences(input_text, commands_text)
+
+    assert deduped == input_text
+    assert commands == (
+        "## Review\n\nAlways review the diff before committing.\n"
+        "## Fix\n\nThen fix it now.\r\n"
+    )
+
+
+def test_dedupe_sentences_keeps_unchanged_lines_verbatim():
+    """Test lines without a dropped sentence keep their spacing and line ending."""
+    input_text = "Run the tests first.  Then commit the change.\r\n## Python\n"
+
+    deduped, _ = dedupe_sentences(input_text, "")
+
+    assert deduped == input_text
+
+
+def test_explode_compact_check(tmp_path, monkeypatch):
+    """Test explode --compact writes compact rules that --check compares against."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("LLM_IDE_RULES_NO_DAEMON", "1")
+    Path("instructions.md").write_text(
+        "# Instructions\n\n**Always** write tests.\n\n\n---\n\n## Python\n\n"
+        "globs: **/*.py\n\n* Use type hints.\n"
+    )
+    runner = CliRunner()
+
+    result = runner.invoke(app, ["explode", "--compact", "--agent", "claude"])
+    assert result.exit_code == 0, result.output
+
+    python_rule = Path(".claude/rules/python.md").read_text()
+    assert python_rule.endswith("## Python\n\n- Use type hints.\n")
+    general_rule = Path(".claude/rules/general.md").read_text()
+    assert general_rule == "# Instructions\n\nAlways write tests.\n"
+
+    result = runner.invoke(app, ["explode", "--compact", "--check", "-a", "claude"])
+    assert result.exit_code == 0, result.output
+
+    result = runner.invoke(app, ["explode", "--check", "--agent", "claude"])
+    assert result.exit_code == 1
+
+
+def test_explode_dedupe_keeps_general_sentences_for_antigravity(tmp_path, monkeypatch):
+    """Test sentences are only deduped against instructions the agent loads."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("LLM_IDE_RULES_NO_DAEMON", "1")
+    Path("instructions.md").write_text(
+        "# Instructions\n\nAlways write tests for new code.\n\n## Python\n\n"
+        "globs: **/*.py\n\nAlways write tests for new code. Use type hints.\n"
+    )
+
+    result = CliRunner().invoke(app, ["explode", "--dedupe"])
+    assert result.exit_code == 0, result.output
+
+    # Antigravity never gets the general instructions, so the sentence must stay
+    antigravity_rule = Path(".agents/rules/python.md").read_text()
+    assert "Always write tests for new code. Use type hints." in antigravity_rule
+    claude_rule = Path(".claude/rules/python.md").read_text()
+    assert "Always write tests" not in claude_rule
+    assert "Use type hints." in claude_rule
+    assert "Always write tests" in Path(".claude/rules/general.md").read_text()
+
+    result = CliRunner().invoke(app, ["explode", "--dedupe", "--check"])
+    assert result.exit_code == 0, result.output
@@ -6,6 +6,8 @@ import json
 from pathlib import Path
 from typer.testing import CliRunner
 from llm_ide_rules import app
+from llm_ide_rules.agents import get_all_agents
+from llm_ide_rules.utils import load_settings_file
 
 
 from unittest.mock import patch
@@ -101,3 +103,44 @@ def test_config_all_agents():
         assert "Configured gemini" in result.stdout
         # Add checks for other agents if applicable, but gemini is a safe bet
         assert Path(".gemini/settings.json").exists()
+        assert Path(".vscode/settings.json").exists()
+
+        # Output follows agent order even though configurators run concurrently
+        lines = [line for line in result.stdout.splitlines() if line.strip()]
+        names = [line.split()[1] for line in lines]
+        assert names == [a.name for a in get_all_agents() if a.name != "agents"]
+
+
+def test_load_settings_file_reuses_parsed_data_until_changed(tmp_path):
+    """Test parsed settings are cached by path and invalidated when the file changes."""
+    settings_path = tmp_path / "settings.json"
+    settings_path.write_text(
+        '{\n  // comment\n  "context": {"fileName": "GEMINI.md"}\n}'
+    )
+
+    first = load_settings_file(settings_path)
+    assert first == {"context": {"fileName": "GEMINI.md"}}
+
+    with patch("llm_ide_rules.utils.loads") as mock_loads:
+        assert load_settings_file(settings_path) is first
+        mock_loads.assert_not_called()
+
+    settings_path.write_text('{"context": {"fileName": ["AGENTS.md"]}}')
+    assert load_settings_file(settings_path) == {"context": {"fileName": ["AGENTS.md"]}}
+    assert load_settings_file(tmp_path / "missing.json") is None
+
+
+def test_config_writes_to_active_filesystem(tmp_path, monkeypatch):
+    """Test configurators running on worker threads write to the active filesystem."""
+    from llm_ide_rules.commands.config import config_main
+    from llm_ide_rules.fs import MemoryFileSystem, using_filesystem
+
+    monkeypatch.chdir(tmp_path)
+    fs = MemoryFileSystem()
+
+    with using_filesystem(fs):
+        config_main()
+
+    assert list(tmp_path.iterdir()) == []
+    assert Path(".gemini/settings.json") in fs.files(tmp_path)
+    assert Path(".vscode/settings.json") in fs.files(tmp_path)
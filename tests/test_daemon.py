@@ -0,0 +1,131 @@
+"""Test the resident daemon and CLI forwarding."""
+
+import json
+import os
+import socket
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from typer.testing import CliRunner
+
+from llm_ide_rules import app
+from llm_ide_rules.client import (
+    SOCKET_ENV_VAR,
+    forward_to_daemon,
+    get_protocol_version,
+    receive_line,
+    should_forward,
+)
+from llm_ide_rules.daemon import DaemonServer
+
+
+@pytest.fixture
+def daemon_socket(tmp_path, monkeypatch):
+    """Run a daemon on a temporary socket for the duration of a test."""
+    socket_path = tmp_path / "daemon.sock"
+    monkeypatch.setenv(SOCKET_ENV_VAR, str(socket_path))
+
+    server = DaemonServer(socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield socket_path
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def test_forward_to_daemon_matches_local_run(daemon_socket, tmp_path, capsys):
+    """Test a forwarded command runs in the client's directory with the same output."""
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "instructions.md").write_text(
+        "# Rules\n\n## Python\nglobs: *.py\n\nUse types.\n"
+    )
+    os.chdir(project)
+
+    exit_code = forward_to_daemon(["ignores", "--print"])
+    forwarded = capsys.readouterr().out
+
+    assert exit_code == 0
+    assert ".cursor/rules/python.mdc" in forwarded
+    assert forwarded == CliRunner().invoke(app, ["ignores", "--print"]).stdout
+    assert Path.cwd() == project
+
+    # Failures are reported through the exit code and stderr
+    assert forward_to_daemon(["ignores", "missing.md", "--print"]) == 1
+    assert "Input file not found" in capsys.readouterr().err
+
+
+def test_forward_to_daemon_falls_back_to_local(daemon_socket, tmp_path, monkeypatch):
+    """Test forwarding is skipped when it cannot or should not reach the daemon."""
+    os.chdir(tmp_path)
+
+    # The client and the daemon disagree on the version
+    with patch("llm_ide_rules.daemon.get_protocol_version", return_value="0.0.0-other"):
+        assert forward_to_daemon(["ignores", "--print"]) is None
+
+    monkeypatch.setenv("LLM_IDE_RULES_NO_DAEMON", "1")
+    assert forward_to_daemon(["ignores", "--print"]) is None
+    monkeypatch.delenv("LLM_IDE_RULES_NO_DAEMON")
+
+    stale = tmp_path / "stale.sock"
+    stale.touch()
+    monkeypatch.setenv(SOCKET_ENV_VAR, str(stale))
+    assert forward_to_daemon(["ignores", "--print"]) is None
+
+
+def test_daemon_runs_in_client_environment(daemon_socket, tmp_path, monkeypatch):
+    """Test a forwarded command sees the client's environment, not the daemon's."""
+    monkeypatch.setenv("GITHUB_TOKEN", "daemon-token")
+    request = {
+        "version": get_protocol_version(),
+        "argv": ["ignores", "--print"],
+        "cwd": str(tmp_path),
+        "env": {"GITHUB_TOKEN": "client-token"},
+    }
+
+    def run_cli(argv):
+        return 0, os.environ.get("GITHUB_TOKEN", ""), ""
+
+    with (
+        patch("llm_ide_rules.daemon.run_cli", side_effect=run_cli),
+        socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn,
+    ):
+        conn.connect(str(daemon_socket))
+        conn.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        response = json.loads(receive_line(conn))
+
+    assert response["stdout"] == "client-token"
+    assert os.environ["GITHUB_TOKEN"] == "daemon-token"
+
+
+def test_daemon_resets_log_level_between_requests(daemon_socket, tmp_path, capsys):
+    """Test --verbose on one forwarded request does not make the next one verbose."""
+    (tmp_path / "instructions.md").write_text("# Rules\n\n## Python\n\nUse types.\n")
+    os.chdir(tmp_path)
+
+    assert forward_to_daemon(["-v", "explode", "--agent", "cursor"]) == 0
+    verbose = capsys.readouterr()
+    assert "debug" in (verbose.out + verbose.err).lower()
+
+    assert forward_to_daemon(["explode", "--agent", "cursor"]) == 0
+    quiet = capsys.readouterr()
+    assert "debug" not in (quiet.out + quiet.err).lower()
+    assert os.environ["LOG_LEVEL"] == "WARNING"
+
+
+def test_should_forward():
+    """Test only non-interactive supported commands are forwarded."""
+    assert should_forward(["-v", "explode", "instructions.md"])
+    assert should_forward(["implode", "cursor"])
+    assert should_forward(["delete", "--yes"])
+    assert not should_forward(["delete"])
+    assert not should_forward(["download"])
+    assert not should_forward(["explode", "--help"])
+    assert not should_forward(["--timings", "explode"])
+    assert not should_forward(["--profile=run.pstats", "implode", "cursor"])
+    assert not should_forward([])
@@ -1,3 +1,4 @@
+import os
 import tempfile
 from pathlib import Path
 
@@ -5,7 +6,11 @@ import click
 from typer.testing import CliRunner
 
 from llm_ide_rules import app
-from llm_ide_rules.commands.delete import find_files_to_delete
+from llm_ide_rules.commands.delete import (
+    delete_paths,
+    find_files_to_delete,
+    partition_generated_candidates,
+)
 
 
 def test_delete_help():
@@ -284,3 +289,126 @@ def test_delete_directory_with_subdirectories():
 
         assert result.exit_code == 0
         assert not rules_dir.exists()
+
+
+def test_delete_uses_manifest_and_preserves_modified_files():
+    """Test delete targets manifest entries and skips files edited since generation."""
+    runner = CliRunner()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+
+        (temp_path / "instructions.md").write_text(
+            "# Rules\n\n## Python\n\nglobs: **/*.py\n\nUse type hints.\n\n"
+            "## Testing\n\nglobs: tests/**/*.py\n\nUse pytest.\n"
+        )
+        os.chdir(temp_dir)
+        result = runner.invoke(app, ["explode", "--agent", "cursor"])
+        assert result.exit_code == 0
+
+        manifest_path = temp_path / ".llm-ide-rules-manifest.json"
+        assert manifest_path.exists()
+        assert ".cursor/rules/python.mdc" in manifest_path.read_text()
+
+        # Hand-edit one generated file and add an unrelated manual rule
+        (temp_path / ".cursor/rules/testing.mdc").write_text("edited by hand")
+        (temp_path / ".cursor/rules/manual.mdc").write_text("manual rule")
+
+        result = runner.invoke(app, ["delete", "--target", temp_dir, "--yes"])
+
+        assert result.exit_code == 0
+        assert "modified since generation" in result.stdout
+        assert not (temp_path / ".cursor/rules/python.mdc").exists()
+        assert (temp_path / ".cursor/rules/testing.mdc").exists()
+        assert (temp_path / ".cursor/rules/manual.mdc").exists()
+
+        # The manifest only keeps track of the preserved generated file
+        manifest_content = manifest_path.read_text()
+        assert ".cursor/rules/python.mdc" not in manifest_content
+        assert ".cursor/rules/testing.mdc" in manifest_content
+
+
+def test_load_manifest_ignores_invalid_manifests(tmp_path):
+    """Test unreadable, malformed and mistyped manifests load as empty."""
+    from llm_ide_rules.manifest import MANIFEST_FILENAME, load_manifest
+
+    manifest_path = tmp_path / MANIFEST_FILENAME
+    for content in (b"not json", b'{"files": []}', b"\xff\xfe"):
+        manifest_path.write_bytes(content)
+        assert load_manifest(tmp_path).files == {}
+
+
+def test_partition_generated_candidates_uses_relative_keys():
+    """Test candidates are partitioned by relative path in one pass, without duplicates."""
+    target_path = Path("/project")
+    generated = {".cursor/rules/python.mdc", "web/AGENTS.md"}
+    candidates = [
+        target_path / ".cursor/rules/python.mdc",
+        target_path / ".cursor/rules/manual.mdc",
+        target_path / "web/AGENTS.md",
+        target_path / "web/AGENTS.md",
+    ]
+
+    files, skipped = partition_generated_candidates(candidates, generated, target_path)
+
+    assert files == [
+        target_path / ".cursor/rules/python.mdc",
+        target_path / "web/AGENTS.md",
+    ]
+    assert skipped == [target_path / ".cursor/rules/manual.mdc"]
+
+
+def test_delete_paths_removes_empty_generated_directories():
+    """Test batched deletion prunes emptied agent directories but keeps project ones."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+
+        skills_dir = temp_path / ".agents" / "skills"
+        files = []
+        for i in range(20):
+            skill_file = skills_dir / f"skill-{i}" / "SKILL.md"
+            skill_file.parent.mkdir(parents=True)
+            skill_file.write_text("skill")
+            files.append(skill_file)
+
+        manual_skill = skills_dir / "manual" / "SKILL.md"
+        manual_skill.parent.mkdir()
+        manual_skill.write_text("manual")
+
+        nested_agents = temp_path / "web" / "AGENTS.md"
+        nested_agents.parent.mkdir()
+        nested_agents.write_text("nested")
+        files.append(nested_agents)
+
+        result = delete_paths([], files, temp_path, max_workers=4)
+
+        assert result.deleted_count == 21
+        assert not result.errors
+        assert not (skills_dir / "skill-0").exists()
+        assert manual_skill.exists()
+        assert (temp_path / "web").exists()
+
+
+def test_delete_summarizes_large_listings():
+    """Test delete summarizes per directory for many files unless --verbose is given."""
+    runner = CliRunner()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.chdir(temp_dir)
+
+        sections = "".join(
+            f"## Rule {i}\n\nglobs: **/*.py\n\nRule {i} content.\n\n" for i in range(60)
+        )
+        Path("instructions.md").write_text(f"# Rules\n\n{sections}")
+
+        result = runner.invoke(app, ["explode", "--agent", "cursor"])
+        assert result.exit_code == 0
+
+        result = runner.invoke(app, ["delete", "--target", temp_dir], input="n\n")
+        assert ".cursor/rules/ (61 items)" in result.stdout
+        assert "rule-0.mdc" not in result.stdout
+
+        result = runner.invoke(
+            app, ["delete", "--target", temp_dir, "--verbose"], input="n\n"
+        )
+        assert ".cursor/rules/rule-0.mdc" in result.stdout
@@ -483,3 +483,114 @@ def test_download_preserves_custom_instructions(mock_zipfile, mock_requests):
         assert "<!-- END CLONED INSTRUCTIONS -->" in content
         assert "My Custom Rules" in content
         assert "Old stuff" not in content
+
+
+def test_copy_file_link_modes():
+    """Test that copy_file materializes files for every link mode."""
+    from llm_ide_rules.commands.download import LinkMode, copy_file
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        source = temp_path / "source.md"
+        source.write_text("rule content")
+
+        copied = temp_path / "copied.md"
+        copy_file(source, copied, LinkMode.copy)
+        assert copied.read_text() == "rule content"
+        assert not copied.samefile(source)
+
+        linked = temp_path / "linked.md"
+        linked.write_text("stale content")
+        copy_file(source, linked, LinkMode.hardlink)
+        assert linked.read_text() == "rule content"
+        assert linked.samefile(source)
+
+        # reflink falls back to a regular copy on filesystems without support
+        for mode in (LinkMode.reflink, LinkMode.auto):
+            cloned = temp_path / f"{mode.value}.md"
+            copy_file(source, cloned, mode)
+            assert cloned.read_text() == "rule content"
+            assert not cloned.samefile(source)
+
+
+@patch("llm_ide_rules.commands.download.requests.get")
+@patch("llm_ide_rules.commands.download.zipfile.ZipFile")
+def test_download_hardlink_uses_archive_store(mock_zipfile, mock_requests):
+    """Test that --link-mode hardlink links files from the cached archive store."""
+    runner = CliRunner()
+
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.headers = {"ETag": '"v1"'}
+    mock_response.content = b"fake zip content"
+    mock_response.raise_for_status = Mock()
+    mock_requests.return_value = mock_response
+
+    mock_zip_instance = Mock()
+    mock_zipfile.return_value.__enter__.return_value = mock_zip_instance
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.chdir(temp_dir)
+        cache_home = Path(temp_dir) / "cache"
+
+        def mock_extractall(path):
+            extracted_dir = Path(path) / "llm_ide_rules-master"
+            rules_dir = extracted_dir / ".cursor" / "rules"
+            rules_dir.mkdir(parents=True, exist_ok=True)
+            (rules_dir / "manual.mdc").write_text("manual rule")
+
+        mock_zip_instance.extractall = mock_extractall
+
+        with patch.dict(os.environ, {"XDG_CACHE_HOME": str(cache_home)}):
+            result = runner.invoke(
+                app, ["download", "cursor", "--link-mode", "hardlink"]
+            )
+
+        assert result.exit_code == 0, result.stdout
+
+        store_dir = (
+            cache_home / "llm-ide-rules/archives/iloveitaly__llm-ide-rules@master"
+        )
+        store_file = (
+            store_dir / "extracted/llm_ide_rules-master/.cursor/rules/manual.mdc"
+        )
+        assert store_file.exists()
+        assert Path(".cursor/rules/manual.mdc").samefile(store_file)
+        assert not (store_dir / "repo.zip").exists()
+        assert "editing one in place edits the cache too" in result.stderr
+
+        # An unchanged branch is revalidated with its ETag and not extracted again
+        mock_response.status_code = 304
+        mock_zipfile.reset_mock()
+        with patch.dict(os.environ, {"XDG_CACHE_HOME": str(cache_home)}):
+            result = runner.invoke(
+                app, ["download", "cursor", "--link-mode", "hardlink"]
+            )
+
+        assert result.exit_code == 0, result.stdout
+        assert mock_requests.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+        mock_zipfile.assert_not_called()
+
+        # Editing a linked file edits the store, which is then downloaded again
+        store_file.write_text("edited rule")
+        with patch.dict(os.environ, {"XDG_CACHE_HOME": str(cache_home)}):
+            result = runner.invoke(
+                app, ["download", "cursor", "--link-mode", "hardlink"]
+            )
+
+        assert result.exit_code == 0, result.stdout
+        assert mock_requests.call_args.kwargs["headers"] == {}
+        assert store_file.read_text() == "manual rule"
+
+        # Switching away from hardlinks replaces the links instead of writing through
+        for link_mode in ("auto", "copy"):
+            with patch.dict(os.environ, {"XDG_CACHE_HOME": str(cache_home)}):
+                result = runner.invoke(
+                    app, ["download", "cursor", "--link-mode", link_mode]
+                )
+
+            assert result.exit_code == 0, result.stdout
+            assert store_file.read_text() == "manual rule"
+            target_file = Path(".cursor/rules/manual.mdc")
+            assert target_file.read_text() == "manual rule"
+            assert not target_file.samefile(store_file)
@@ -0,0 +1,217 @@
+"""Test duplicate block detection and factoring shared blocks."""
+
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from llm_ide_rules import app
+from llm_ide_rules.duplicates import (
+    Document,
+    Occurrence,
+    factor_shared_blocks,
+    find_duplicate_blocks,
+    split_blocks,
+)
+
+INSTRUCTIONS = """# Instructions
+
+Keep answers short and dense.
+
+## Python
+
+globs: **/*.py
+
+Run the full test suite before every commit.
+
+- Use type hints on public functions.
+- Prefer dataclasses over dictionaries.
+
+## Scripts
+
+globs: scripts/**/*.py
+
+Run the full test suite before every commit.
+
+- Use type hints on public functions.
+- Prefer dataclasses over dictionaries.
+- Scripts must be idempotent.
+
+## Docs
+
+Keep answers short and dense.
+"""
+
+
+def test_split_blocks():
+    """Test paragraphs, list items and code blocks are separate blocks."""
+    lines = [
+        "---\n",
+        "description: Python\n",
+        "---\n",
+        "## Python\n",
+        "First line\n",
+        "continued.\n",
+        "- Item one\n",
+        "  wrapped.\n",
+        "- Item two\n",
+        "```\n",
+        "a\n",
+        "\n",
+        "b\n",
+        "```\n",
+    ]
+
+    blocks = [(block.start, block.end) for block in split_blocks(lines)]
+    assert blocks == [(4, 6), (6, 8), (8, 9), (9, 14)]
+
+
+def test_split_blocks_splits_paragraphs_after_sentences():
+    """Test each line ending a sentence closes a block, wrapped sentences stay whole."""
+    lines = [
+        "Keep functions small.\n",
+        "Prefer pathlib over os.path for\n",
+        "every file access.\n",
+        "- Item one.\n",
+        "  Still item one.\n",
+    ]
+
+    blocks = [(block.start, block.end) for block in split_blocks(lines)]
+    assert blocks == [(0, 1), (1, 3), (3, 5)]
+
+
+def test_sentence_shared_within_paragraphs():
+    """Test a sentence in a longer paragraph matches and factors out on its own."""
+    text = (
+        "# Instructions\n"
+        "\n"
+        "## Python\n"
+        "\n"
+        "globs: **/*.py\n"
+        "\n"
+        "Keep functions small and focused.\n"
+        "Prefer pathlib over os.path for all file access.\n"
+        "\n"
+        "## Tests\n"
+        "\n"
+        "globs: tests/**/*.py\n"
+        "\n"
+        "Prefer pathlib over os.path for all file access.\n"
+    )
+
+    duplicates = find_duplicate_blocks([Document("instructions.md", text)])
+    assert [block.text for block in duplicates] == [
+        "Prefer pathlib over os.path for all file access.\n"
+    ]
+
+    general, _, sections = factor_shared_blocks(text).partition("## Python")
+    assert general.endswith("Prefer pathlib over os.path for all file access.\n\n")
+    assert "Prefer pathlib" not in sections
+    assert "Keep functions small and focused.\n" in sections
+
+
+def test_find_duplicate_blocks_extends_runs():
+    """Test consecutive repeated blocks are reported once as one run."""
+    lines = INSTRUCTIONS.splitlines(keepends=True)
+
+    duplicates = find_duplicate_blocks([Document("instructions.md", INSTRUCTIONS)])
+
+    by_text = {block.text: block.occurrences for block in duplicates}
+    run = "".join(lines[8:12])
+    assert by_text[run] == [
+        Occurrence("instructions.md", 9),
+        Occurrence("instructions.md", 18),
+    ]
+    assert by_text["Keep answers short and dense.\n"] == [
+        Occurrence("instructions.md", 3),
+        Occurrence("instructions.md", 26),
+    ]
+    assert len(duplicates) == 2
+
+
+def test_find_duplicate_blocks_keeps_code_structure():
+    """Test code blocks only match when their lines match."""
+    first = "```\nx = 1\ny = 2\n```\n"
+    second = "```\nx = 1\n\ny = 2\n```\n"
+
+    assert find_duplicate_blocks([Document("a", first), Document("b", second)]) == []
+    assert len(find_duplicate_blocks([Document("a", first), Document("b", first)]))
+
+
+def test_factor_shared_blocks():
+    """Test blocks shared by sections move to the general instructions once."""
+    factored = factor_shared_blocks(INSTRUCTIONS)
+
+    general, _, sections = factored.partition("## Python")
+    assert general == (
+        "# Instructions\n"
+        "\n"
+        "Keep answers short and dense.\n"
+        "\n"
+        "Run the full test suite before every commit.\n"
+        "\n"
+        "- Use type hints on public functions.\n"
+        "- Prefer dataclasses over dictionaries.\n"
+        "\n"
+    )
+    assert "Run the full test suite" not in sections
+    assert "Use type hints" not in sections
+    assert "- Scripts must be idempotent.\n" in sections
+    assert "Keep answers short" not in sections
+    assert "globs: scripts/**/*.py" in sections
+
+
+def test_analyze_duplicates_command(tmp_path, monkeypatch):
+    """Test duplicates are reported per source with their token cost."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("LLM_IDE_RULES_NO_DAEMON", "1")
+    Path("instructions.md").write_text(INSTRUCTIONS)
+    runner = CliRunner()
+
+    result = runner.invoke(
+        app, ["analyze", "duplicates", "--agent", "claude", "--min-tokens", "5"]
+    )
+    assert result.exit_code == 0, result.output
+    assert "sources: 2 duplicate blocks" in result.stdout
+    assert "x2: instructions.md:9, instructions.md:18" in result.stdout
+    assert "x2: .claude/rules/python.md:9, .claude/rules/scripts.md:9" in result.stdout
+    assert not Path(".claude").exists()
+
+
+def test_explode_factor_shared(tmp_path, monkeypatch):
+    """Test explode --factor-shared keeps shared blocks in the general rule only."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("LLM_IDE_RULES_NO_DAEMON", "1")
+    Path("instructions.md").write_text(INSTRUCTIONS)
+    runner = CliRunner()
+
+    result = runner.invoke(app, ["explode", "--factor-shared", "--agent", "claude"])
+    assert result.exit_code == 0, result.output
+
+    assert "Run the full test suite" in Path(".claude/rules/general.md").read_text()
+    scripts_rule = Path(".claude/rules/scripts.md").read_text()
+    assert scripts_rule.endswith("## Scripts\n\n- Scripts must be idempotent.\n")
+
+    assert "Run the full test suite" not in Path(".claude/rules/python.md").read_text()
+
+
+def test_explode_factor_shared_per_agent(tmp_path, monkeypatch):
+    """Test shared blocks move into the file each agent always loads, if it has one."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("LLM_IDE_RULES_NO_DAEMON", "1")
+    Path("instructions.md").write_text(INSTRUCTIONS)
+    runner = CliRunner()
+
+    result = runner.invoke(app, ["explode", "--factor-shared"])
+    assert result.exit_code == 0, result.output
+
+    for root_doc in ("AGENTS.md", "GEMINI.md"):
+        assert Path(root_doc).read_text().count("Run the full test suite") == 1
+    assert "Run the full test suite" in Path(".cursor/rules/general.mdc").read_text()
+    assert "Run the full test suite" not in Path(".cursor/rules/python.mdc").read_text()
+
+    # Antigravity has no general instructions, so its sections keep the blocks
+    for rule in ("python.md", "scripts.md"):
+        assert "Run the full test suite" in Path(".agents/rules", rule).read_text()
+
+    result = runner.invoke(app, ["explode", "--factor-shared", "--check"])
+    assert result.exit_code == 0, result.output
@@ -3,6 +3,7 @@
 import os
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 from typer.testing import CliRunner
 
@@ -494,3 +495,40 @@ This should be ignored.
         remote_command_content = Path(".cursor/commands/remote-command.md").read_text()
         assert "This is a remote command." in remote_command_content
         assert "Local Command" not in remote_command_content
+
+
+def test_explode_check_reports_stale_files_without_writing(tmp_path, monkeypatch):
+    """Test --check passes after explode and reports edits and deletions without writing."""
+    runner = CliRunner()
+    monkeypatch.chdir(tmp_path)
+    Path("instructions.md").write_text(
+        "# Rules\n\n## Python\nglobs: *.py\n\nUse types.\n\n## Docs\n\nWrite docs.\n"
+    )
+
+    result = runner.invoke(app, ["explode", "--agent", "cursor", "--check"])
+    assert result.exit_code == 1
+    assert "3 of 3 generated files are out of date" in result.stderr
+    assert ".cursor/rules/python.mdc: missing" in result.stderr
+    assert not Path(".cursor").exists()
+
+    assert runner.invoke(app, ["explode", "--agent", "cursor"]).exit_code == 0
+    manifest_before = Path(".llm-ide-rules-manifest.json").read_text()
+
+    # Unchanged files are verified from the manifest without being hashed again
+    with patch("llm_ide_rules.commands.explode.hash_file") as mock_hash:
+        result = runner.invoke(app, ["explode", "--agent", "cursor", "--check"])
+    mock_hash.assert_not_called()
+    assert result.exit_code == 0
+    assert "All 3 generated files are up to date" in result.stdout
+
+    python_rule = Path(".cursor/rules/python.mdc")
+    python_rule.write_text(python_rule.read_text().replace("Use types.", "Use tabs."))
+    Path(".cursor/rules/docs.mdc").unlink()
+
+    result = runner.invoke(app, ["explode", "--agent", "cursor", "--check"])
+    assert result.exit_code == 1
+    assert ".cursor/rules/docs.mdc: missing" in result.stderr
+    assert ".cursor/rules/python.mdc: modified (+1 -1 lines)" in result.stderr
+    assert "Use tabs." in python_rule.read_text()
+    assert not Path(".cursor/rules/docs.mdc").exists()
+    assert Path(".llm-ide-rules-manifest.json").read_text() == manifest_before
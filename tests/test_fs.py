@@ -0,0 +1,150 @@
+"""Test the pluggable filesystem and rendering without touching disk."""
+
+from pathlib import Path
+
+import pytest
+
+from llm_ide_rules.agents import get_agent
+from llm_ide_rules.commands.delete import delete_paths, find_files_to_delete
+from llm_ide_rules.commands.explode import explode_implementation
+from llm_ide_rules.constants import INSTRUCTIONS_MARKER
+from llm_ide_rules.fs import MemoryFileSystem, using_filesystem
+from llm_ide_rules.manifest import MANIFEST_FILENAME
+
+INSTRUCTIONS = """# Instructions
+
+Always write tests.
+
+## Python
+
+globs: **/*.py
+
+Use type hints.
+
+## Documentation
+
+Keep the README current.
+"""
+
+COMMANDS = """## Fix Tests
+
+Description: Repair failing tests
+
+Run pytest and fix failures.
+"""
+
+
+def test_explode_to_memory_matches_disk(tmp_path):
+    """Test an in-memory explode renders exactly what a disk explode writes."""
+    project = Path("/project")
+    fs = MemoryFileSystem(
+        {
+            project / "instructions.md": INSTRUCTIONS,
+            project / "commands.md": COMMANDS,
+        }
+    )
+
+    explode_implementation("instructions.md", "all", project, fs=fs)
+    rendered = fs.files(project)
+
+    assert not Path("/project").exists()
+    assert Path(".cursor/rules/python.mdc") in rendered
+    assert Path(".gemini/commands/fix-tests.toml") in rendered
+    assert Path(MANIFEST_FILENAME) in rendered
+
+    (tmp_path / "instructions.md").write_text(INSTRUCTIONS)
+    (tmp_path / "commands.md").write_text(COMMANDS)
+    explode_implementation("instructions.md", "all", tmp_path)
+
+    on_disk = {
+        path.relative_to(tmp_path): path.read_bytes()
+        for path in tmp_path.rglob("*")
+        if path.is_file()
+    }
+    # Manifests differ only in the recorded modification times
+    rendered.pop(Path(MANIFEST_FILENAME))
+    on_disk.pop(Path(MANIFEST_FILENAME))
+    assert rendered == on_disk
+
+
+def test_bundle_rules_in_memory_preserves_local_tail():
+    """Test implode bundling reads and writes through the active filesystem."""
+    project = Path("/project")
+    output_file = project / "instructions.md"
+    fs = MemoryFileSystem(
+        {
+            project / ".cursor/rules/python.mdc": (
+                "---\ndescription: Python\nglobs: **/*.py\nalwaysApply: false\n---\n"
+                "## Python\n\nUse type hints.\n"
+            ),
+            output_file: f"old\n{INSTRUCTIONS_MARKER}\nMy Custom Rules\n",
+        }
+    )
+
+    with using_filesystem(fs):
+        assert get_agent("cursor").bundle_rules(output_file)
+
+    content = fs.read_text(output_file)
+    assert content.startswith("## Python\n\nglobs: **/*.py\n\nUse type hints.")
+    assert content.endswith(f"{INSTRUCTIONS_MARKER}\n\nMy Custom Rules\n")
+    assert list(fs.files()) == [
+        project / ".cursor/rules/python.mdc",
+        output_file,
+    ]
+
+
+def test_delete_in_memory_removes_files_and_empty_dirs():
+    """Test deletion runs against the active filesystem, including worker threads."""
+    project = Path("/project")
+    fs = MemoryFileSystem(
+        {
+            project / ".cursor/rules/python.mdc": "rule",
+            project / ".cursor/commands/fix.md": "command",
+            project / "src/AGENTS.md": "nested",
+            project / "src/main.py": "print()",
+        }
+    )
+
+    with using_filesystem(fs):
+        dirs, files = find_files_to_delete(["cursor", "agents"], project)
+        assert dirs == [project / ".cursor/rules", project / ".cursor/commands"]
+        assert files == [project / "src/AGENTS.md"]
+
+        result = delete_paths(
+            [], [project / ".cursor/rules/python.mdc", *files], project
+        )
+
+    assert result.deleted_count == 2
+    assert result.removed_dirs == [project / ".cursor/rules"]
+    assert set(fs.files(project)) == {
+        Path(".cursor/commands/fix.md"),
+        Path("src/main.py"),
+    }
+    assert fs.is_dir(project / "src")
+
+
+def test_memory_filesystem_operations():
+    """Test the memory backend mirrors the disk semantics the tool relies on."""
+    fs = MemoryFileSystem({"/a/b/one.md": "1", "/a/two.md": b"2"})
+
+    assert fs.is_dir(Path("/a/b"))
+    assert [p.name for p in fs.glob(Path("/a"), "*.md")] == ["two.md"]
+    assert [p.name for p in fs.rglob(Path("/a"), "*.md")] == ["one.md", "two.md"]
+
+    with pytest.raises(OSError):
+        fs.rmdir(Path("/a/b"))
+    with pytest.raises(FileNotFoundError):
+        fs.read_bytes(Path("/a/missing.md"))
+
+    before = fs.stat(Path("/a/two.md"))
+    with fs.open(Path("/a/tmp"), "wb") as f:
+        f.write(b"22")
+    fs.replace(Path("/a/tmp"), Path("/a/two.md"))
+
+    after = fs.stat(Path("/a/two.md"))
+    assert fs.read_bytes(Path("/a/two.md")) == b"22"
+    assert after.size == 2 and after.mtime_ns > before.mtime_ns
+    assert not fs.exists(Path("/a/tmp"))
+
+    fs.rmtree(Path("/a/b"))
+    assert fs.files() == {Path("/a/two.md"): b"22"}
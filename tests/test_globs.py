@@ -0,0 +1,90 @@
+"""Test glob matching and the analyze globs command."""
+
+from typer.testing import CliRunner
+
+from llm_ide_rules import app
+from llm_ide_rules.globs import (
+    GlobMatcher,
+    analyze_glob_coverage,
+    list_project_files,
+    split_globs,
+)
+
+FILES = [
+    "main.py",
+    "app/models.py",
+    "tests/test_models.py",
+    "web/src/index.ts",
+    "web/src/App.tsx",
+    "docs/guide.md",
+]
+
+
+def test_split_globs():
+    """Test globs values are split on commas outside braces."""
+    assert split_globs("**/*.ts, **/*.tsx") == ["**/*.ts", "**/*.tsx"]
+    assert split_globs("src/**/*.{ts,tsx}") == ["src/**/*.{ts,tsx}"]
+    assert split_globs("manual") == []
+    assert split_globs(None) == []
+
+
+def test_glob_matcher_semantics():
+    """Test segment wildcards, recursive wildcards, braces and classes."""
+    matcher = GlobMatcher(
+        ["**/*.py", "*.py", "tests/**", "web/**/*.{ts,tsx}", "docs/[a-g]*.md"]
+    )
+
+    assert matcher.match("main.py") == {0, 1}
+    assert matcher.match("app/models.py") == {0}
+    assert matcher.match("tests/test_models.py") == {0, 2}
+    assert matcher.match("web/src/App.tsx") == {3}
+    assert matcher.match("docs/guide.md") == {4}
+    assert matcher.match("docs/readme.md") == set()
+    assert matcher.match("main.pyc") == set()
+
+
+def test_analyze_glob_coverage():
+    """Test per-section counts, dead globs and overlaps come from one pass."""
+    coverage, overlaps = analyze_glob_coverage(
+        {
+            "Python": "**/*.py",
+            "Tests": "tests/**/*.py",
+            "Frontend": "web/**/*.tsx, web/**/*.vue",
+            "General": None,
+            "Manual": "manual",
+        },
+        FILES,
+    )
+
+    by_section = {item.section: item for item in coverage}
+    assert list(by_section) == ["Python", "Tests", "Frontend"]
+    assert by_section["Python"].file_count == 3
+    assert by_section["Frontend"].file_count == 1
+    assert by_section["Frontend"].dead_globs == ["web/**/*.vue"]
+
+    assert [(o.first, o.second, o.file_count) for o in overlaps] == [
+        ("Python", "Tests", 1)
+    ]
+    assert overlaps[0].example == "tests/test_models.py"
+
+
+def test_analyze_globs_command(tmp_path, monkeypatch):
+    """Test the report lists dead globs and overlaps for the files on disk."""
+    monkeypatch.chdir(tmp_path)
+    for relative_path in [*FILES, "node_modules/dep/index.py", ".venv/lib.py"]:
+        (tmp_path / relative_path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / relative_path).write_text("")
+    (tmp_path / "instructions.md").write_text(
+        "# Rules\n\n## Python\n\nglobs: **/*.py\n\nTypes.\n\n"
+        "## Tests\n\nglobs: tests/**/*.py\n\nPytest.\n\n"
+        "## Shell\n\nglobs: **/*.sh\n\nSet -e.\n"
+    )
+
+    assert "node_modules/dep/index.py" not in list_project_files(tmp_path)
+
+    result = CliRunner().invoke(app, ["analyze", "globs"])
+
+    assert result.exit_code == 0, result.output
+    assert "Globs matching no files (1):\n  Shell: **/*.sh" in result.stdout
+    assert "Python & Tests: 1 files (e.g. tests/test_models.py)" in result.stdout
+    assert "Matched 3 sections against 7 files" in result.stdout
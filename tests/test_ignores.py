@@ -221,3 +221,97 @@ Python rules.
         assert ".claude/rules/general.md" in output
         assert ".claude/rules/python.md" in output
         assert "AGENTS.md" in output
+
+
+def test_ignores_matches_explode_outputs():
+    """Test the projected ignore list matches the files explode actually writes."""
+    runner = CliRunner()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.chdir(temp_dir)
+        Path("src").mkdir()
+
+        instructions_content = """# Sample Instructions
+
+Always write tests.
+
+## Python
+globs: *.py
+
+Python rules.
+
+## Source
+globs: src/**/*.ts
+
+TypeScript rules.
+
+## Empty Section
+
+## Manual Only
+
+Manual rules.
+"""
+        Path("instructions.md").write_text(instructions_content)
+        Path("commands.md").write_text("## Fix Tests\n\nFix failing tests.\n")
+
+        result = runner.invoke(app, ["ignores", "instructions.md", "--print"])
+        assert result.exit_code == 0
+        projected = set(result.stdout.split())
+
+        result = runner.invoke(app, ["explode", "instructions.md"])
+        assert result.exit_code == 0
+
+        written = {
+            path.relative_to(temp_dir).as_posix()
+            for path in Path(temp_dir).rglob("*")
+            if path.is_file()
+        } - {"instructions.md", "commands.md"}
+
+        assert projected == written
+        assert "src/AGENTS.md" in projected
+        assert ".llm-ide-rules-manifest.json" in projected
+
+
+def test_ignores_compact_collapses_generated_directories():
+    """Test --compact collapses generated-only directories and keeps hand-written ones."""
+    runner = CliRunner()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.chdir(temp_dir)
+
+        instructions_content = """# Sample Instructions
+
+Always write tests.
+
+## Python
+globs: *.py
+
+Python rules.
+
+## Testing
+
+Testing rules.
+"""
+        Path("instructions.md").write_text(instructions_content)
+        Path("commands.md").write_text("## Fix Tests\n\nFix failing tests.\n")
+
+        # A hand-written Cursor rule must stay visible to git
+        Path(".cursor/rules").mkdir(parents=True)
+        Path(".cursor/rules/custom.mdc").write_text("custom rule\n")
+
+        result = runner.invoke(
+            app, ["ignores", "instructions.md", "--print", "--compact"]
+        )
+        assert result.exit_code == 0
+        patterns = result.stdout.split()
+
+        assert ".claude/rules/" in patterns
+        assert ".agents/skills/" in patterns
+        assert ".agents/skills/fix-tests/SKILL.md" not in patterns
+        assert ".cursor/rules/" not in patterns
+        assert ".cursor/rules/python.mdc" in patterns
+        assert ".cursor/rules/testing.mdc" in patterns
+        assert "AGENTS.md" in patterns
+
+        result = runner.invoke(app, ["ignores", "instructions.md", "--print"])
+        assert len(result.stdout.split()) > len(patterns)
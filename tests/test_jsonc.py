@@ -0,0 +1,109 @@
+"""Test the comment-preserving JSONC editor."""
+
+from textwrap import dedent
+
+import pytest
+
+from llm_ide_rules.jsonc import JsoncError, apply_updates, loads
+from llm_ide_rules.utils import modify_json_file
+
+
+def test_apply_updates_batches_nested_and_literal_keys():
+    """Test literal dotted keys and tuple paths are updated in a single pass."""
+    original = dedent("""
+    {
+      // editor settings
+      "editor.fontSize": 14,
+      "context": {
+        "fileName": "AGENTS.md", // keep me
+        "other": { "fileName": "untouched" }
+      },
+      "markdownlint.config": { "MD034": false },
+    }
+    """).strip()
+
+    updated = apply_updates(
+        original,
+        {
+            "editor.fontSize": 16,
+            ("context", "fileName"): ["GEMINI.md", "AGENTS.md"],
+            ("markdownlint.config", "MD013"): False,
+            "chat.useAgentsMdFile": True,
+        },
+    )
+
+    assert "// editor settings" in updated
+    assert '"fileName": ["GEMINI.md", "AGENTS.md"], // keep me' not in updated
+    assert "// keep me" in updated
+    assert '"other": { "fileName": "untouched" }' in updated
+
+    data = loads(updated)
+    assert data["editor.fontSize"] == 16
+    assert data["context"]["fileName"] == ["GEMINI.md", "AGENTS.md"]
+    assert data["context"]["other"] == {"fileName": "untouched"}
+    assert data["markdownlint.config"] == {"MD034": False, "MD013": False}
+    assert data["chat.useAgentsMdFile"] is True
+
+
+def test_apply_updates_creates_missing_objects():
+    """Test tuple paths create intermediate objects with the file's indentation."""
+    updated = apply_updates(
+        '{\n    "other": "value"\n}', {("context", "fileName"): ["GEMINI.md"]}
+    )
+
+    assert updated.startswith('{\n    "other": "value",\n    "context": {')
+    assert loads(updated) == {"other": "value", "context": {"fileName": ["GEMINI.md"]}}
+
+
+def test_apply_updates_keeps_comments_in_empty_objects():
+    """Test members added to an empty object go after the comments inside it."""
+    updated = apply_updates("{\n  // c\n}\n", {"a": True})
+    assert updated == '{\n  // c\n  "a": true\n}\n'
+
+    updated = apply_updates('{"x": { /* keep */ }}', {("x", "a"): 1})
+    assert "/* keep */" in updated
+    assert loads(updated) == {"x": {"a": 1}}
+
+
+def test_apply_updates_is_noop_when_values_match():
+    """Test unchanged values leave the document byte-for-byte identical."""
+    original = '{\n  "a": true, /* note */\n  "b": [1, 2]\n}\n'
+
+    assert apply_updates(original, {"a": True}) == original
+
+
+def test_apply_updates_rejects_invalid_documents():
+    """Test malformed documents raise instead of being rewritten."""
+    with pytest.raises(JsoncError):
+        apply_updates('{"a": }', {"a": True})
+
+    with pytest.raises(JsoncError):
+        apply_updates("[1, 2]", {"a": True})
+
+
+def test_modify_json_file_creates_nested_file(tmp_path):
+    """Test a missing file is created with nested keys expanded."""
+    settings_file = tmp_path / ".gemini" / "settings.json"
+
+    assert modify_json_file(settings_file, {("context", "fileName"): ["GEMINI.md"]})
+    assert loads(settings_file.read_text()) == {"context": {"fileName": ["GEMINI.md"]}}
+    assert not modify_json_file(settings_file, {("context", "fileName"): ["GEMINI.md"]})
+
+
+def test_apply_updates_keeps_layout_of_equal_values():
+    """Test equal values in a different layout are not rewritten."""
+    original = '{\n  "context": {"fileName": [ "GEMINI.md" ]},\n  "a": 1\n}'
+
+    assert apply_updates(original, {("context", "fileName"): ["GEMINI.md"]}) == original
+    assert '"a": true' in apply_updates(original, {"a": True})
+
+
+def test_apply_updates_adds_members_inline_to_single_line_objects():
+    """Test a member added to an object written on one line stays on that line."""
+    original = '{\n  "context": {"x": 1},\n  "a": 1\n}\n'
+
+    updated = apply_updates(original, {("context", "fileName"): ["AGENTS.md"]})
+
+    assert (
+        updated == '{\n  "context": {"x": 1, "fileName": ["AGENTS.md"]},\n  "a": 1\n}\n'
+    )
@@ -0,0 +1,41 @@
+"""Test the lazily configured logger."""
+
+import logging
+
+from llm_ide_rules.log import LazyLogger
+
+
+def test_logger_configures_only_for_emitted_calls(monkeypatch):
+    """Test calls below LOG_LEVEL never configure structlog."""
+    monkeypatch.setenv("LOG_LEVEL", "WARNING")
+    logger = LazyLogger()
+
+    logger.debug("skipped", path="a")
+    logger.info("skipped")
+    assert logger._logger is None
+    assert not logger.is_enabled_for(logging.DEBUG)
+    assert logger.is_enabled_for(logging.ERROR)
+
+    logger.warning("emitted")
+    assert logger._logger is not None
+
+
+def test_logger_configure_picks_up_new_level(monkeypatch):
+    """Test reconfiguring re-reads LOG_LEVEL, as --verbose relies on."""
+    monkeypatch.setenv("LOG_LEVEL", "WARNING")
+    logger = LazyLogger()
+    assert logger.level == logging.WARNING
+
+    monkeypatch.setenv("LOG_LEVEL", "debug")
+    assert logger.level == logging.WARNING
+    logger.configure()
+    assert logger.is_enabled_for(logging.DEBUG)
+
+    # structlog-config registers TRACE with logging below DEBUG
+    monkeypatch.setenv("LOG_LEVEL", "TRACE")
+    logger.configure()
+    assert logger.is_enabled_for(logging.DEBUG - 1)
+
+    # Leave structlog configured the way the rest of the suite expects
+    monkeypatch.setenv("LOG_LEVEL", "WARNING")
+    logger.configure()
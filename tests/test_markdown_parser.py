@@ -141,3 +141,35 @@ React content.
 
     react_section = sections["React"]
     assert react_section.glob_pattern is None
+
+
+def test_parse_sections_matches_line_based_extraction():
+    """Test offset-based sections yield the same lines as slicing the source."""
+    text = """# Title
+
+General.
+
+## Python
+globs: **/*.py
+
+Python content.
+
+## Empty
+
+## Last
+No trailing newline"""
+
+    _, sections = parse_sections(text)
+    lines = text.splitlines(keepends=True)
+
+    expected, pattern = extract_glob_directive(lines[4:9])
+    assert sections["Python"].content == expected
+    assert sections["Python"].glob_pattern == pattern == "**/*.py"
+    assert sections["Python"].text == "".join(expected)
+
+    assert sections["Empty"].content == ["## Empty\n", "\n"]
+    assert sections["Last"].content == ["## Last\n", "No trailing newline"]
+    assert sections["Last"].has_content
+
+    # Sections reference the parsed text rather than holding copies of it
+    assert all(section._source is text for section in sections.values())
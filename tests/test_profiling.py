@@ -0,0 +1,44 @@
+"""Test the --profile option."""
+
+import pstats
+
+from typer.testing import CliRunner
+
+from llm_ide_rules import app
+
+
+def test_profile_option_writes_stats_and_reports(tmp_path, monkeypatch):
+    """Test --profile dumps loadable stats and prints hot functions and allocations."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("LLM_IDE_RULES_NO_DAEMON", "1")
+    (tmp_path / "instructions.md").write_text(
+        "# Rules\n\n## Python\n\nglobs: **/*.py\n\nUse types.\n"
+    )
+
+    result = CliRunner().invoke(
+        app,
+        ["--profile", "run.pstats", "--profile-memory", "explode", "-a", "cursor"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert (tmp_path / ".cursor/rules/python.mdc").exists()
+
+    stats = pstats.Stats(str(tmp_path / "run.pstats"))
+    assert any(name == "explode_implementation" for _, _, name in stats.stats)
+
+    assert "function calls" in result.stderr
+    assert "Wrote profile to run.pstats" in result.stderr
+    assert "Peak traced memory" in result.stderr
+
+
+def test_profile_memory_requires_profile(tmp_path, monkeypatch):
+    """Test --profile-memory without --profile is rejected instead of ignored."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("LLM_IDE_RULES_NO_DAEMON", "1")
+    (tmp_path / "instructions.md").write_text("# Rules\n\nUse types.\n")
+
+    result = CliRunner().invoke(app, ["--profile-memory", "explode", "-a", "cursor"])
+
+    assert result.exit_code == 1
+    assert "--profile-memory requires --profile" in result.stderr
+    assert not (tmp_path / ".cursor").exists()
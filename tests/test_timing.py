@@ -0,0 +1,88 @@
+"""Test timing spans and the --timings report."""
+
+import json
+
+from typer.testing import CliRunner
+
+from llm_ide_rules import app
+from llm_ide_rules.timing import (
+    SpanRecord,
+    is_recording,
+    span,
+    start_recording,
+    stop_recording,
+    summarize_spans,
+)
+
+
+def test_spans_are_recorded_only_while_recording():
+    """Test finished spans are collected with their attributes between start and stop."""
+    with span("ignored"):
+        pass
+
+    start_recording()
+    with span("phase", files=1) as current:
+        current.add(bytes=10)
+        current.add(bytes=5)
+    records = stop_recording()
+
+    assert not is_recording()
+    assert [record.name for record in records] == ["phase"]
+    assert records[0].attributes == {"files": 1, "bytes": 15}
+    assert records[0].duration >= 0
+
+
+def test_summarize_spans_aggregates_by_name():
+    """Test spans sharing a name are summed, slowest total first."""
+    records = [
+        SpanRecord("write", 0.0, 0.1, 1, 1, {"files": 1, "bytes": 10}),
+        SpanRecord("parse", 0.0, 0.5, 1, 1, {}),
+        SpanRecord("write", 0.2, 0.3, 1, 1, {"files": 1, "bytes": 20}),
+    ]
+
+    parse, write = summarize_spans(records)
+
+    assert parse.name == "parse" and parse.count == 1
+    assert write.count == 2 and write.files == 2 and write.bytes == 30
+    assert round(write.total, 6) == 0.4 and write.max == 0.3
+
+
+def test_timings_option_prints_phase_table(tmp_path, monkeypatch):
+    """Test --timings reports the phases of an explode run on stderr."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("LLM_IDE_RULES_NO_DAEMON", "1")
+    (tmp_path / "instructions.md").write_text(
+        "# Rules\n\nBe concise.\n\n## Python\n\nglobs: **/*.py\n\nUse types.\n"
+    )
+
+    result = CliRunner().invoke(app, ["--timings", "explode", "--agent", "cursor"])
+
+    assert result.exit_code == 0, result.output
+    assert "Phase" in result.stderr
+    for phase in ("explode.parse", "explode.render.cursor", "write"):
+        assert phase in result.stderr
+    assert not is_recording()
+
+
+def test_trace_option_writes_chrome_trace(tmp_path, monkeypatch):
+    """Test --trace writes complete events for every span with process and thread ids."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("LLM_IDE_RULES_NO_DAEMON", "1")
+    (tmp_path / "instructions.md").write_text(
+        "# Rules\n\n## Python\n\nglobs: **/*.py\n\nUse types.\n"
+    )
+
+    result = CliRunner().invoke(
+        app, ["--trace", "trace.json", "explode", "--agent", "cursor"]
+    )
+    assert result.exit_code == 0, result.output
+
+    trace = json.loads((tmp_path / "trace.json").read_text())
+    events = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    by_name = {event["name"]: event for event in events}
+
+    assert by_name["explode"]["ts"] == 0
+    assert by_name["explode.render.cursor"]["args"] == {"section": "Python"}
+    assert by_name["write"]["args"]["files"] == 1
+    assert all(event["dur"] >= 0 and event["tid"] for event in events)
+    assert "Phase" not in result.stderr
@@ -0,0 +1,116 @@
+"""Test marker search and tail-preserving writes."""
+
+import os
+import threading
+from unittest.mock import patch
+
+from llm_ide_rules.constants import INSTRUCTIONS_MARKER
+from llm_ide_rules.utils import (
+    find_marker_offset,
+    read_text_before_marker,
+    write_preserving_tail,
+)
+
+
+def test_find_marker_offset_with_mmap_and_chunked_fallback(tmp_path):
+    """Test the marker is found by mmap and by the chunked fallback across chunk edges."""
+    file_path = tmp_path / "instructions.md"
+    head = "é" * 9 + "x"
+    file_path.write_text(f"{head}{INSTRUCTIONS_MARKER}\nlocal\n", encoding="utf-8")
+    expected = len(head.encode("utf-8"))
+
+    assert find_marker_offset(file_path, INSTRUCTIONS_MARKER) == expected
+
+    # Force the chunked path with chunks smaller than the marker itself
+    with (
+        patch("llm_ide_rules.utils.mmap.mmap", side_effect=OSError),
+        patch("llm_ide_rules.utils.MARKER_SEARCH_CHUNK_SIZE", 7),
+    ):
+        assert find_marker_offset(file_path, INSTRUCTIONS_MARKER) == expected
+
+    (tmp_path / "empty.md").write_text("")
+    assert find_marker_offset(tmp_path / "empty.md", INSTRUCTIONS_MARKER) is None
+
+
+def test_read_text_before_marker(tmp_path):
+    """Test only the text before the first matching marker is returned."""
+    file_path = tmp_path / "commands.md"
+    file_path.write_text(f"## Cmd\n{INSTRUCTIONS_MARKER}\n## Local\n")
+
+    assert read_text_before_marker(
+        file_path, "<!-- OTHER -->", INSTRUCTIONS_MARKER
+    ) == (
+        "## Cmd\n",
+        INSTRUCTIONS_MARKER,
+    )
+
+    file_path.write_text("## Cmd\n")
+    assert read_text_before_marker(file_path, INSTRUCTIONS_MARKER) == ("## Cmd\n", None)
+
+
+def test_write_preserving_tail_streams_head_file_and_local_tail(tmp_path):
+    """Test a head file is streamed, gets a marker, and the local tail survives."""
+    output_file = tmp_path / "instructions.md"
+    output_file.write_text(f"old\n{INSTRUCTIONS_MARKER}\nMy Custom Rules\n")
+    output_file.chmod(0o640)
+
+    remote = tmp_path / "remote.md"
+    remote.write_text("new upstream\n")
+
+    write_preserving_tail(output_file, remote, INSTRUCTIONS_MARKER)
+
+    assert output_file.read_text() == (
+        f"new upstream\n\n\n{INSTRUCTIONS_MARKER}\n\nMy Custom Rules\n"
+    )
+    assert output_file.stat().st_mode & 0o777 == 0o640
+    # No temporary file is left behind
+    assert {p.name for p in tmp_path.iterdir()} == {"instructions.md", "remote.md"}
+
+    # String heads that already carry the marker are written as-is
+    write_preserving_tail(
+        output_file, f"bundle\n{INSTRUCTIONS_MARKER}", INSTRUCTIONS_MARKER
+    )
+    assert (
+        output_file.read_text() == f"bundle\n{INSTRUCTIONS_MARKER}\n\nMy Custom Rules\n"
+    )
+
+
+def test_write_preserving_tail_writes_through_symlinks(tmp_path):
+    """Test a symlinked output stays a symlink and its target gets the new content."""
+    target = tmp_path / "shared" / "AGENTS.md"
+    target.parent.mkdir()
+    target.write_text(f"old\n{INSTRUCTIONS_MARKER}\nlocal\n")
+    link = tmp_path / "AGENTS.md"
+    link.symlink_to(target)
+
+    write_preserving_tail(link, f"new\n{INSTRUCTIONS_MARKER}", INSTRUCTIONS_MARKER)
+
+    assert link.is_symlink()
+    assert target.read_text() == f"new\n{INSTRUCTIONS_MARKER}\nlocal\n"
+
+
+def test_write_preserving_tail_from_concurrent_threads(tmp_path):
+    """Test threads of one process writing the same file use separate temp files."""
+    output_file = tmp_path / "AGENTS.md"
+    errors = []
+
+    def write(index):
+        try:
+            for _ in range(20):
+                write_preserving_tail(
+                    output_file, f"head {index}\n", INSTRUCTIONS_MARKER
+                )
+        except OSError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert [p.name for p in tmp_path.iterdir()] == ["AGENTS.md"]
+    umask = os.umask(0)
+    os.umask(umask)
+    assert output_file.stat().st_mode & 0o777 == 0o666 & ~umask
@@ -0,0 +1,85 @@
+"""Test exploding every project of a workspace."""
+
+import os
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from llm_ide_rules import app
+from llm_ide_rules.workspace import find_workspace_projects
+
+INSTRUCTIONS = "# Rules\n\n## Python\nglobs: *.py\n\nUse types.\n"
+
+
+def make_workspace(root: Path) -> None:
+    """Create a workspace with two projects and two that must be pruned."""
+    for project in ["", "packages/api", "node_modules/dep", ".cache/copy"]:
+        project_dir = root / project
+        project_dir.mkdir(parents=True, exist_ok=True)
+        (project_dir / "instructions.md").write_text(INSTRUCTIONS)
+
+
+def test_find_workspace_projects_prunes_hidden_and_dependency_dirs(tmp_path):
+    """Test discovery skips hidden and dependency directories."""
+    make_workspace(tmp_path)
+
+    assert find_workspace_projects(tmp_path) == [tmp_path, tmp_path / "packages/api"]
+    assert find_workspace_projects(tmp_path, "missing.md") == []
+
+
+def test_explode_workspace_reports_each_project(tmp_path, monkeypatch):
+    """Test --workspace explodes every project on a pool and aggregates the results."""
+    runner = CliRunner()
+    make_workspace(tmp_path)
+    monkeypatch.chdir(tmp_path)
+
+    result = runner.invoke(
+        app, ["explode", "--workspace", "--agent", "cursor", "--jobs", "2"]
+    )
+    assert result.exit_code == 0
+    assert "Exploded 2 projects" in result.stdout
+    assert "packages/api: Created 2 rules in .cursor/ directory" in result.stdout
+    assert Path(".cursor/rules/python.mdc").exists()
+    assert Path("packages/api/.cursor/rules/python.mdc").exists()
+    assert not Path("node_modules/dep/.cursor").exists()
+
+    result = runner.invoke(app, ["explode", "--workspace", "-a", "cursor", "--check"])
+    assert result.exit_code == 0
+    assert "Checked 2 projects" in result.stdout
+
+    Path("packages/api/.cursor/rules/python.mdc").write_text("edited\n")
+    Path("instructions.md").write_bytes(b"\xff\xfe not utf-8")
+
+    result = runner.invoke(
+        app, ["explode", "--workspace", "-a", "cursor", "--check", "-j", "2"]
+    )
+    assert result.exit_code == 1
+    assert "packages/api: stale" in result.stderr
+    assert ".cursor/rules/python.mdc: modified" in result.stderr
+    assert "UnicodeDecodeError" in result.stderr
+    assert "Checked 2 projects" in result.stderr
+    assert "2 are out of date" in result.stderr
+
+
+def test_trace_merges_worker_spans(tmp_path, monkeypatch):
+    """Test --trace includes the spans recorded by every pool worker."""
+    import json
+
+    make_workspace(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("LLM_IDE_RULES_NO_DAEMON", "1")
+
+    result = CliRunner().invoke(
+        app,
+        ["--trace", "trace.json", "explode", "--workspace", "-a", "cursor", "-j", "2"],
+    )
+    assert result.exit_code == 0, result.output
+
+    events = json.loads(Path("trace.json").read_text())["traceEvents"]
+    projects = [event for event in events if event["name"] == "workspace.project"]
+    assert sorted(Path(event["args"]["project"]) for event in projects) == [
+        tmp_path,
+        tmp_path / "packages/api",
+    ]
+    # Every project ran in a worker process, none of them in the CLI process
+    assert all(event["pid"] != os.getpid() for event in projects)